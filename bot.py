@@ -15,11 +15,17 @@ from discord.ext import commands, tasks
 from discord.ext.commands import Context
 from dotenv import load_dotenv
 
+from core.assets import registry as assets
+from core.combat.dojo.simulator import SimulationService
+from core.edit_scheduler import EditScheduler
+from core.image_probe import AvatarValidator
 from core.state_manager import StateManager
 from database import DatabaseManager
 from database.backup import create_backup
+from database.migrations import check_query_plans, run_migrations
 
 BACKUP_INTERVAL_HOURS = 6
+LEADERBOARD_RECONCILE_MINUTES = 10
 BACKUP_RETENTION_COUNT = 28  # ~1 week of history at the default 6h interval
 
 if not os.path.isfile(f"{os.path.realpath(os.path.dirname(__file__))}/config.json"):
@@ -113,16 +119,24 @@ logger.setLevel(logging.INFO)
 # Console handler
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(LoggingFormatter())
-# File handler
-file_handler = logging.FileHandler(filename="discord.log", encoding="utf-8", mode="w")
-file_handler_formatter = logging.Formatter(
-    "[{asctime}] [{levelname:<8}] {name}: {message}", "%Y-%m-%d %H:%M:%S", style="{"
-)
-file_handler.setFormatter(file_handler_formatter)
-
 # Add the handlers
 logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+
+# Simulation workers (core/combat/dojo/simulator.py) are spawned processes that
+# re-import this file as __mp_main__: only the real entry point may truncate
+# discord.log or start the bot.
+if __name__ == "__main__":
+    # File handler
+    file_handler = logging.FileHandler(
+        filename="discord.log", encoding="utf-8", mode="w"
+    )
+    file_handler_formatter = logging.Formatter(
+        "[{asctime}] [{levelname:<8}] {name}: {message}",
+        "%Y-%m-%d %H:%M:%S",
+        style="{",
+    )
+    file_handler.setFormatter(file_handler_formatter)
+    logger.addHandler(file_handler)
 
 
 class CustomCommandTree(CommandTree):
@@ -177,6 +191,14 @@ class DiscordBot(commands.Bot):
         self.config = config
         self.database = None
         self.state_manager = StateManager(logger=self.logger)
+        self.edit_scheduler = EditScheduler(
+            message_interval=config.get("edit_message_interval", 0.5),
+            channel_interval=config.get("edit_channel_interval", 0.2),
+        )
+        self.simulator = SimulationService(
+            max_workers=config.get("simulation_workers", 2)
+        )
+        self.avatar_validator = AvatarValidator()
 
     async def init_db(self) -> None:
         async with aiosqlite.connect(
@@ -187,70 +209,13 @@ class DiscordBot(commands.Bot):
             ) as file:
                 await db.executescript(file.read())
             await db.commit()
-            # Idempotent ALTERs to add columns introduced after the base schema.sql
-            for stmt in [
-                "ALTER TABLE users ADD COLUMN combat_stamina INTEGER NOT NULL DEFAULT 10",
-                "ALTER TABLE users ADD COLUMN last_stamina_regen TIMESTAMP DEFAULT NULL",
-                # Maw rework: add fights_this_cycle cap tracking.
-                "ALTER TABLE maw_participants ADD COLUMN fights_this_cycle INTEGER NOT NULL DEFAULT 0",
-                # Maw rework: rename last_damage_check → last_fight_ts (SQLite 3.25+).
-                "ALTER TABLE maw_participants RENAME COLUMN last_damage_check TO last_fight_ts",
-                "ALTER TABLE uber_shrine_statues ADD COLUMN tier INTEGER NOT NULL DEFAULT 1",
-                "ALTER TABLE uber_shrine_statues ADD COLUMN slot_index INTEGER NOT NULL DEFAULT 0",
-                # Nether Market: expand rotation from 1 to 2 items per tier (lo = below
-                # true value, hi = above true value); old single cheap/med/expensive
-                # columns are left in place unused.
-                "ALTER TABLE nether_market_rotation ADD COLUMN cheap_lo_item TEXT",
-                "ALTER TABLE nether_market_rotation ADD COLUMN cheap_lo_price INTEGER",
-                "ALTER TABLE nether_market_rotation ADD COLUMN cheap_hi_item TEXT",
-                "ALTER TABLE nether_market_rotation ADD COLUMN cheap_hi_price INTEGER",
-                "ALTER TABLE nether_market_rotation ADD COLUMN med_lo_item TEXT",
-                "ALTER TABLE nether_market_rotation ADD COLUMN med_lo_price INTEGER",
-                "ALTER TABLE nether_market_rotation ADD COLUMN med_hi_item TEXT",
-                "ALTER TABLE nether_market_rotation ADD COLUMN med_hi_price INTEGER",
-                "ALTER TABLE nether_market_rotation ADD COLUMN expensive_lo_item TEXT",
-                "ALTER TABLE nether_market_rotation ADD COLUMN expensive_lo_price INTEGER",
-                "ALTER TABLE nether_market_rotation ADD COLUMN expensive_hi_item TEXT",
-                "ALTER TABLE nether_market_rotation ADD COLUMN expensive_hi_price INTEGER",
-                # Nether Market: one-shot notice shown next time a plundered victim opens /nether.
-                "ALTER TABLE nether_market_profile ADD COLUMN pending_plunder_notice TEXT DEFAULT NULL",
-                # Corrupted Monsters / Paradise moved to level 70: new player settings.
-                "ALTER TABLE users ADD COLUMN corrupted_encounters_enabled INTEGER NOT NULL DEFAULT 1",
-                "ALTER TABLE users ADD COLUMN auto_potion_reload INTEGER NOT NULL DEFAULT 0",
-                # Prestige rework: emoji "Emblem" cosmetic (replaces title/flair catalogues).
-                "ALTER TABLE users ADD COLUMN prestige_emblem TEXT DEFAULT NULL",
-                # Rite of Convergence: 5 tradeable entry keys.
-                "ALTER TABLE player_currencies ADD COLUMN rite_key_apex_of_dreams INTEGER NOT NULL DEFAULT 0",
-                "ALTER TABLE player_currencies ADD COLUMN rite_key_corruption_of_memories INTEGER NOT NULL DEFAULT 0",
-                "ALTER TABLE player_currencies ADD COLUMN rite_key_scales_of_judgment INTEGER NOT NULL DEFAULT 0",
-                "ALTER TABLE player_currencies ADD COLUMN rite_key_devoid_of_thoughts INTEGER NOT NULL DEFAULT 0",
-                "ALTER TABLE player_currencies ADD COLUMN rite_key_zenith_of_nightmares INTEGER NOT NULL DEFAULT 0",
-            ]:
-                try:
-                    await db.execute(stmt)
-                    await db.commit()
-                except Exception:
-                    pass  # Column already exists
-
-            # One-time data migration: fold the old single-slot player_artefacts
-            # row (if any) into the new rite_artefact_items inventory, marked
-            # equipped. Idempotent — skips any user/server already present in
-            # rite_artefact_items, so this is safe to run on every boot.
-            try:
-                await db.execute(
-                    """INSERT INTO rite_artefact_items
-                           (user_id, server_id, artefact_key, roll_1, roll_2, roll_3, is_equipped)
-                       SELECT pa.user_id, pa.server_id, pa.artefact_key,
-                              pa.roll_1, pa.roll_2, pa.roll_3, 1
-                       FROM player_artefacts pa
-                       WHERE NOT EXISTS (
-                           SELECT 1 FROM rite_artefact_items ri
-                           WHERE ri.user_id = pa.user_id AND ri.server_id = pa.server_id
-                       )"""
+            applied = await run_migrations(db)
+            for migration in applied:
+                self.logger.info(
+                    f"Applied migration {migration.version}: {migration.description}"
                 )
-                await db.commit()
-            except Exception:
-                pass  # Already migrated
+            for problem in await check_query_plans(db):
+                self.logger.error(f"Query plan regression — {problem}")
 
     async def load_cogs(self) -> None:
         """
@@ -323,6 +288,21 @@ class DiscordBot(commands.Bot):
     async def before_backup_task(self) -> None:
         await self.wait_until_ready()
 
+    @tasks.loop(minutes=LEADERBOARD_RECONCILE_MINUTES)
+    async def leaderboard_task(self) -> None:
+        """Reloads the materialised leaderboards from their source tables,
+        catching any write the incremental hooks do not cover."""
+        try:
+            drifted = await self.database.leaderboards.reconcile()
+            if drifted:
+                self.logger.info(f"Leaderboards reconciled: {drifted} had drifted")
+        except Exception:
+            self.logger.error("leaderboard_task error", exc_info=True)
+
+    @leaderboard_task.before_loop
+    async def before_leaderboard_task(self) -> None:
+        await self.wait_until_ready()
+
     async def setup_hook(self) -> None:
         """
         This will just be executed when the bot starts the first time.
@@ -335,9 +315,8 @@ class DiscordBot(commands.Bot):
         )
         self.logger.info("-------------------")
         await self.init_db()
-        _conn = await aiosqlite.connect(
-            f"{os.path.realpath(os.path.dirname(__file__))}/database/database.db"
-        )
+        _db_path = f"{os.path.realpath(os.path.dirname(__file__))}/database/database.db"
+        _conn = await aiosqlite.connect(_db_path)
         _conn.row_factory = sqlite3.Row
         await _conn.execute("PRAGMA journal_mode=WAL")
         await _conn.execute("PRAGMA synchronous=NORMAL")
@@ -345,20 +324,48 @@ class DiscordBot(commands.Bot):
         # (hot backups, a stray second process, Windows file-lock hiccups)
         # waits and retries instead of surfacing as "database is locked".
         await _conn.execute("PRAGMA busy_timeout=30000")
-        self.database = DatabaseManager(connection=_conn)
+        self.database = DatabaseManager(
+            connection=_conn,
+            player_cache_size=self.config.get("player_cache_size", 1024),
+            player_cache_ttl=self.config.get("player_cache_ttl", 600.0),
+            leaderboard_size=self.config.get("leaderboard_size", 50),
+        )
+        if self.config.get("db_query_stats", True):
+            self.database.enable_query_stats(
+                slow_ms=self.config.get("db_slow_query_ms", 100.0),
+                slow_log_path=self.config.get("db_slow_query_log"),
+            )
+        group_commit_ms = self.config.get("db_group_commit_ms", 0)
+        if group_commit_ms > 0:
+            self.database.enable_group_commit(
+                window_ms=group_commit_ms,
+                max_pending=self.config.get("db_group_commit_max", 64),
+            )
+        read_connections = self.config.get("db_read_connections", 3)
+        if read_connections > 0:
+            await self.database.open_read_pool(_db_path, read_connections)
         await self.database.quests.create_tables()
         await self.database.settlement.migrate_buildings_schema()
         await self.database.settlement.migrate_settlements_schema()
         await self.database.settlement_materials.migrate_schema()
         await self.database.paradise.migrate_schema()
+        claimed = await self.database.hall_of_firsts.load_claimed()
+        self.logger.info(f"Hall of Firsts: {claimed} categories already claimed")
+        assets.hot_reload = self.config.get("asset_hot_reload", False)
+        for line in assets.preload():
+            self.logger.info(f"Asset {line}")
         await self.load_cogs()
         self.status_task.start()
         self.backup_task.start()
+        self.leaderboard_task.start()
 
     async def close(self) -> None:
+        self.simulator.shutdown()
+        await self.avatar_validator.close()
         if self.database is not None:
             try:
-                await self.database.connection.close()
+                # Flushes any writes still queued by group commit first.
+                await self.database.close()
             except Exception:
                 pass
         await super().close()
@@ -546,7 +553,8 @@ class DiscordBot(commands.Bot):
         return True
 
 
-load_dotenv()
+if __name__ == "__main__":
+    load_dotenv()
 
-bot = DiscordBot()
-bot.run(os.getenv("TOKEN"))
+    bot = DiscordBot()
+    bot.run(os.getenv("TOKEN"))
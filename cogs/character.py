@@ -1,3 +1,5 @@
+import time
+
 import discord
 from discord import Interaction, app_commands
 from discord.ext import commands, tasks
@@ -91,9 +93,13 @@ class Character(commands.Cog, name="character"):
     async def check_stamina(self):
         """Grant 1 combat stamina per hour to all users below the cap of 10."""
         try:
+            started = time.perf_counter()
             updated = await self.bot.database.users.regen_stamina_tick()
+            elapsed_ms = (time.perf_counter() - started) * 1000
             if updated:
-                self.bot.logger.info(f"Stamina regen: granted +1 to {updated} user(s)")
+                self.bot.logger.info(
+                    f"Stamina regen: granted +1 to {updated} user(s) in {elapsed_ms:.1f} ms"
+                )
         except Exception:
             self.bot.logger.error("check_stamina task error", exc_info=True)
 
@@ -1,51 +1,10 @@
-import asyncio
-
 from discord import Interaction, app_commands
 from discord.ext import commands
 
 from core.character.profile_hub import ProfileHubView
 from core.character.profile_ui import ProfileBuilder
 from core.first_use import TutorialGateView
-from core.inventory.views import SLOT_ORDER, GearView, LoadoutView
-
-# Core
-from core.items.factory import (
-    create_accessory,
-    create_armor,
-    create_boot,
-    create_glove,
-    create_helmet,
-    create_weapon,
-)
-from core.rite.models import artefact_list_from_db
-
-
-async def _fetch_all_slots(bot, user_id: str, server_id: str) -> dict:
-    """Fetch and factory-create all six equipment slots, plus the Rite of
-    Convergence Artefact inventory, concurrently."""
-    factories = {
-        "weapon": create_weapon,
-        "armor": create_armor,
-        "helmet": create_helmet,
-        "glove": create_glove,
-        "boot": create_boot,
-        "accessory": create_accessory,
-    }
-    raw_results, artefact_rows = await asyncio.gather(
-        asyncio.gather(
-            *[bot.database.equipment.get_all(user_id, slot) for slot in SLOT_ORDER]
-        ),
-        bot.database.rite.get_artefact_inventory(user_id, server_id),
-    )
-    all_items = {}
-    for slot, rows in zip(SLOT_ORDER, raw_results):
-        items = [factories[slot](row) for row in rows]
-        items.sort(
-            key=lambda x: (getattr(x, "is_equipped", False), x.level), reverse=True
-        )
-        all_items[slot] = items
-    all_items["artefact"] = artefact_list_from_db(artefact_rows)
-    return all_items
+from core.inventory.views import GearView, LoadoutView
 
 
 class Inventory(commands.Cog, name="inventory"):
@@ -65,12 +24,10 @@ class Inventory(commands.Cog, name="inventory"):
         self.bot.state_manager.set_active(user_id, "inventory")
 
         async def _build():
-            all_items = await _fetch_all_slots(self.bot, user_id, server_id)
-            view = GearView(
+            view = await GearView.create(
                 self.bot,
                 user_id,
                 server_id,
-                all_items,
                 initial_slot=initial_slot,
                 player_name=existing_user["name"],
             )
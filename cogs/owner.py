@@ -241,6 +241,129 @@ class Owner(commands.Cog, name="owner"):
             )
             await context.send(embed=embed, delete_after=5)
 
+    @commands.hybrid_command(
+        name="cachestats", description="Show player snapshot cache counters."
+    )
+    @commands.is_owner()
+    async def cache_stats(self, context: Context) -> None:
+        """Hit-rate and eviction counters for tuning player_cache_size and
+        leaderboard_size."""
+        stats = self.bot.database.player_cache.stats()
+        boards = self.bot.database.leaderboards.stats()
+        layouts = self.bot.database.connection.settlement_projections.stats()
+        embed = discord.Embed(
+            title="Player Snapshot Cache",
+            description=(
+                f"**Entries**: {stats['entries']:,} / {stats['max_entries']:,} "
+                f"(TTL {stats['ttl_seconds']:.0f}s)\n"
+                f"**Hit rate**: {stats['hit_rate']:.1%} "
+                f"({stats['hits']:,} hits / {stats['misses']:,} misses)\n"
+                f"**Evictions**: {stats['evictions']:,}\n"
+                f"**Expirations**: {stats['expirations']:,}\n"
+                f"**Invalidations**: {stats['invalidations']:,}\n"
+                f"**Leaderboards**: {boards['boards']} loaded (top {boards['capacity']}), "
+                f"{boards['hits']:,} hits / {boards['loads']:,} loads, "
+                f"{boards['forced_reloads']:,} forced reloads\n"
+                f"**Settlement projections**: {layouts['entries']:,} cached, "
+                f"{layouts['hits']:,} hits / {layouts['misses']:,} misses, "
+                f"{layouts['bumps']:,} layout changes"
+            ),
+            color=0xBEBEFE,
+        )
+        await context.send(embed=embed, ephemeral=True)
+
+    @commands.hybrid_command(
+        name="editstats", description="Show message edit scheduler counters."
+    )
+    @commands.is_owner()
+    async def edit_stats(self, context: Context) -> None:
+        """Coalescing counters for tuning the edit_*_interval settings."""
+        stats = self.bot.edit_scheduler.stats()
+        embed = discord.Embed(
+            title="Message Edit Scheduler",
+            description=(
+                f"**Intervals**: {stats['message_interval']:.2f}s per message, "
+                f"{stats['channel_interval']:.2f}s per channel\n"
+                f"**Requested**: {stats['requested']:,}\n"
+                f"**Sent**: {stats['sent']:,}\n"
+                f"**Superseded**: {stats['superseded']:,}\n"
+                f"**Failed**: {stats['failed']:,}\n"
+                f"**Pending**: {stats['pending']:,}"
+            ),
+            color=0xBEBEFE,
+        )
+        await context.send(embed=embed, ephemeral=True)
+
+    @commands.hybrid_command(
+        name="dbstats", description="Show database connection queue/latency counters."
+    )
+    @commands.is_owner()
+    async def db_stats(self, context: Context) -> None:
+        """Per-connection load, for tuning db_read_connections."""
+        stats = self.bot.database.connection_stats()
+
+        def line(name: str, s: dict) -> str:
+            return (
+                f"**{name}**: {s['calls']:,} calls, avg {s['avg_ms']:.2f} ms, "
+                f"max {s['max_ms']:.1f} ms, depth {s['in_flight']} "
+                f"(peak {s['peak_in_flight']})"
+            )
+
+        lines = [line("Writer", stats["writer"])]
+        lines += [line(f"Reader {i}", s) for i, s in enumerate(stats["readers"], 1)]
+        if not stats["readers"]:
+            lines.append("*No read pool — every read goes through the writer.*")
+        group = stats["group_commit"]
+        if group is not None:
+            lines.append(
+                f"**Group commit** ({group['window_ms']:.0f} ms / "
+                f"{group['max_pending']}): {group['requested']:,} commits as "
+                f"{group['commits']:,} COMMITs, {group['pending']} queued"
+            )
+        embed = discord.Embed(
+            title="Database Connections",
+            description="\n".join(lines),
+            color=0xBEBEFE,
+        )
+        await context.send(embed=embed, ephemeral=True)
+
+    @commands.hybrid_command(
+        name="querystats", description="Show the heaviest database statements."
+    )
+    @commands.is_owner()
+    async def query_stats(
+        self, context: Context, sort: str = "total", limit: int = 10
+    ) -> None:
+        """Per-statement timings. sort: total, count, p95, p99 or wait."""
+        stats = self.bot.database.connection.query_stats
+        if stats is None:
+            await context.send("Query stats are disabled.", ephemeral=True)
+            return
+        by = {"count": "count", "p95": "p95_ms", "p99": "p99_ms", "wait": "wait_ms"}
+        rows = stats.top(max(1, min(limit, 15)), by=by.get(sort, "total_ms"))
+        lines = [
+            f"**Waiting on transactions**: {stats.tx_wait_ms:,.0f} ms over "
+            f"{stats.tx_waits:,} statements"
+        ]
+        if stats.slow_log_path:
+            lines.append(
+                f"**Slow log**: {stats.slow_logged:,} statements over "
+                f"{stats.slow_ms:g} ms → `{stats.slow_log_path}`"
+            )
+        for row in rows:
+            sql = row["sql"] if len(row["sql"]) <= 90 else row["sql"][:87] + "..."
+            lines.append(
+                f"**{row['caller']}** — {row['count']:,}x, {row['total_ms']:,.0f} ms "
+                f"(p50 {row['p50_ms']:.1f} / p95 {row['p95_ms']:.1f} / "
+                f"p99 {row['p99_ms']:.1f}, wait {row['wait_ms']:,.0f})\n`{sql}`"
+            )
+        embed = discord.Embed(
+            title="Database Statements",
+            description="\n".join(lines)[:4096],
+            color=0xBEBEFE,
+        )
+        await context.send(embed=embed, ephemeral=True)
+
     @commands.hybrid_command(
         name="debug", description="Check all active operations for users."
     )
@@ -1,7 +1,5 @@
 import asyncio
-import io
 import re
-import urllib.request
 
 import discord
 from discord import ButtonStyle, app_commands, ui
@@ -206,50 +204,6 @@ def _active_emblem_label(active: dict) -> str:
     return entry[0] if entry else "None"
 
 
-# ---------------------------------------------------------------------------
-# Avatar validation
-# ---------------------------------------------------------------------------
-
-
-async def _validate_avatar_url(url: str) -> tuple[bool, str]:
-    """Returns (is_valid, error_message). Blocks in a thread to avoid blocking the event loop."""
-
-    def _check() -> tuple[bool, str]:
-        try:
-            req = urllib.request.Request(url, headers={"User-Agent": "Idleology/1.0"})
-            with urllib.request.urlopen(req, timeout=8) as resp:
-                ct = resp.headers.get("Content-Type", "")
-                if not ct.startswith("image/"):
-                    return (
-                        False,
-                        "URL must point to a direct image file (jpg, png, webp).",
-                    )
-                if ct == "image/gif":
-                    return False, "GIFs aren't allowed for custom avatars — use a static image."
-                data = resp.read(4 * 1024 * 1024)  # 4 MB cap
-        except Exception as exc:
-            return False, f"Could not fetch the URL: {exc}"
-
-        try:
-            from PIL import Image
-
-            img = Image.open(io.BytesIO(data))
-            # Content-Type can lie (or be missing/generic) — confirm via the
-            # decoded format too, and reject multi-frame images either way.
-            if img.format == "GIF" or getattr(img, "is_animated", False):
-                return False, "GIFs aren't allowed for custom avatars — use a static image."
-            w, h = img.size
-            if w != h:
-                return False, f"Image must be square (1:1 ratio). Got {w}×{h}."
-            if w > 600:
-                return False, f"Image must be 600×600 or smaller. Got {w}×{h}."
-            return True, ""
-        except Exception as exc:
-            return False, f"Could not read image dimensions: {exc}"
-
-    return await asyncio.to_thread(_check)
-
-
 # ---------------------------------------------------------------------------
 # Modals
 # ---------------------------------------------------------------------------
@@ -273,7 +227,7 @@ class AvatarModal(discord.ui.Modal, title="Set Custom Avatar"):
         await interaction.response.defer(ephemeral=True, thinking=True)
         url = self.url_input.value.strip()
 
-        valid, error = await _validate_avatar_url(url)
+        valid, error = await self.bot.avatar_validator.validate(url)
         if not valid:
             return await interaction.followup.send(error, ephemeral=True)
 
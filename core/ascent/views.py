@@ -492,7 +492,7 @@ class AscentView(BaseLayoutView):
         if interaction and not interaction.response.is_done():
             await interaction.response.edit_message(view=self)
         elif message:
-            await message.edit(view=self)
+            await self.schedule_edit(message, view=self)
         elif interaction:
             await interaction.edit_original_response(view=self)
 
@@ -523,7 +523,7 @@ class AscentView(BaseLayoutView):
         # Disable all buttons for the duration of the auto loop
         for child in self.row.children:
             child.disabled = True
-        await message.edit(view=self)
+        await self.schedule_edit(message, view=self)
 
         while (
             self.player.current_hp > (self.player.total_max_hp * 0.2)
@@ -578,7 +578,7 @@ class AscentView(BaseLayoutView):
 
         for child in self.row.children:
             child.disabled = True
-        await message.edit(view=self)
+        await self.schedule_edit(message, view=self)
 
         while self.player.current_hp > 0 and self.monster.hp > 0:
             for _ in range(10):
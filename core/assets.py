@@ -0,0 +1,254 @@
+"""
+core/assets.py
+Shared registry for the static tables under assets/.
+
+Every table is parsed once (at startup via ``preload()`` or lazily on first
+use) into an indexed structure and then served from memory. With
+``hot_reload`` on, each lookup also stats the file and re-parses it when
+its mtime changes, so asset edits go live without a restart.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+logger = logging.getLogger("discord_bot")
+
+ASSETS_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "assets"))
+
+
+# ---------------------------------------------------------------------------
+# Parsed shapes
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class MonsterTable:
+    """monsters.csv, indexed for encounter generation.
+
+    Encounter levels only ever query a handful of windows (level_scaled is
+    always a multiple of 10), so each distinct (nsfw, window[, species])
+    query is built once, in file order, and memoised. Callers pick from the returned
+    tuples directly; file order keeps ``random.choice`` results identical
+    to the old per-call list comprehensions.
+    """
+
+    # Tuple layout: (name, url, level_scaled, flavor, species, is_nsfw)
+    rows: list[tuple] = field(default_factory=list)
+    # level_scaled -> rows at exactly that level, in file order
+    by_level: dict[int, list[tuple]] = field(default_factory=dict)
+    by_name: dict[str, tuple] = field(default_factory=dict)
+    _memo: dict[tuple, Any] = field(default_factory=dict, repr=False)
+
+    @staticmethod
+    def _window(lo: int, hi: int) -> tuple[int, int]:
+        # level_scaled is level * 10, so snapping the bounds inwards to the
+        # decade grid selects the same rows and shares the memo entry.
+        return -(-lo // 10) * 10, hi // 10 * 10
+
+    def pool(self, *, include_nsfw: bool) -> tuple[tuple, ...]:
+        key = ("pool", include_nsfw)
+        if key not in self._memo:
+            self._memo[key] = tuple(r for r in self.rows if include_nsfw or not r[5])
+        return self._memo[key]
+
+    def at_level(self, level_scaled: int, *, include_nsfw: bool) -> tuple[tuple, ...]:
+        key = ("level", level_scaled, include_nsfw)
+        if key not in self._memo:
+            self._memo[key] = tuple(
+                r
+                for r in self.by_level.get(level_scaled, ())
+                if include_nsfw or not r[5]
+            )
+        return self._memo[key]
+
+    def in_range(
+        self, lo: int, hi: int, *, include_nsfw: bool, species: str | None = None
+    ) -> tuple[tuple, ...]:
+        """Rows with ``lo <= level_scaled <= hi``, optionally one species."""
+        lo, hi = self._window(lo, hi)
+        key = ("range", lo, hi, include_nsfw, species)
+        if key not in self._memo:
+            self._memo[key] = tuple(
+                r
+                for r in self.pool(include_nsfw=include_nsfw)
+                if lo <= r[2] <= hi and (species is None or r[4] == species)
+            )
+        return self._memo[key]
+
+    def species_weights(self, lo: int, hi: int) -> tuple[list[str], list[int]]:
+        """(species, row count) over the window, in first-seen order — the
+        slayer task roll weights species by how often they appear."""
+        lo, hi = self._window(lo, hi)
+        key = ("species", lo, hi)
+        if key not in self._memo:
+            counts = Counter(r[4] for r in self.in_range(lo, hi, include_nsfw=True))
+            self._memo[key] = (list(counts.keys()), list(counts.values()))
+        return self._memo[key]
+
+
+def _parse_exp(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["levels"]
+
+
+def _parse_monsters(path: str) -> MonsterTable:
+    table = MonsterTable()
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            entry = (
+                row["name"],
+                row["url"],
+                int(row["level"]) * 10,
+                row["flavor"],
+                row.get("species", row["name"]),
+                row.get("nsfw", "").strip() == "1",
+            )
+            table.rows.append(entry)
+            table.by_level.setdefault(entry[2], []).append(entry)
+            # First row wins, matching the old linear name scan.
+            table.by_name.setdefault(entry[0], entry)
+    return table
+
+
+def _parse_curios(path: str) -> dict[str, str]:
+    with open(path, newline="") as f:
+        urls: dict[str, str] = {}
+        for row in csv.DictReader(f):
+            urls.setdefault(row["Item"], row["URL"])
+        return urls
+
+
+def _parse_profiles(path: str) -> dict[str, list[tuple[str, str]]]:
+    by_sex: dict[str, list[tuple[str, str]]] = {}
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            by_sex.setdefault(row["Sex"].upper(), []).append(
+                (row["Class"], row["URL"])
+            )
+    return by_sex
+
+
+def _parse_lines(path: str) -> list[str]:
+    with open(path) as f:
+        return [line.strip() for line in f.readlines()]
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Entry:
+    path: str
+    parser: Callable[[str], Any]
+    value: Any = None
+    loaded: bool = False
+    mtime: float | None = None
+    load_ms: float = 0.0
+    loads: int = 0
+
+
+class AssetRegistry:
+    """Name -> parsed asset table, loaded once and shared by every caller.
+
+    Callers must treat returned tables as read-only: they are the shared
+    copies. Parse errors propagate, so call sites keep their own fallbacks.
+    """
+
+    def __init__(self, base_dir: str = ASSETS_DIR, *, hot_reload: bool = False):
+        self.base_dir = base_dir
+        self.hot_reload = hot_reload
+        self._entries: dict[str, _Entry] = {}
+
+    def register(self, name: str, relpath: str, parser: Callable[[str], Any]):
+        self._entries[name] = _Entry(os.path.join(self.base_dir, relpath), parser)
+
+    def get(self, name: str) -> Any:
+        entry = self._entries.get(name)
+        if entry is None:
+            # Ad-hoc plain-text lists (assets/items/*.txt) register on demand.
+            self.register(name, name, _parse_lines)
+            entry = self._entries[name]
+        if not entry.loaded:
+            self._load(entry)
+        elif self.hot_reload and self._mtime(entry.path) != entry.mtime:
+            self._load(entry)
+            logger.info(f"Reloaded asset {name} ({entry.load_ms:.1f} ms)")
+        return entry.value
+
+    def preload(self) -> list[str]:
+        """Loads every registered table. Returns one timing line per table,
+        slowest first, for the startup log."""
+        for entry in self._entries.values():
+            if not entry.loaded:
+                self._load(entry)
+        return self.report()
+
+    def report(self) -> list[str]:
+        loaded = [(n, e) for n, e in self._entries.items() if e.loaded]
+        loaded.sort(key=lambda item: item[1].load_ms, reverse=True)
+        lines = [
+            f"{name}: {entry.load_ms:.1f} ms"
+            + (f" ({entry.loads} loads)" if entry.loads > 1 else "")
+            for name, entry in loaded
+        ]
+        total = sum(e.load_ms for _, e in loaded)
+        lines.append(f"total: {total:.1f} ms across {len(loaded)} tables")
+        return lines
+
+    @staticmethod
+    def _mtime(path: str) -> float | None:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def _load(self, entry: _Entry) -> None:
+        mtime = self._mtime(entry.path)
+        start = time.perf_counter()
+        entry.value = entry.parser(entry.path)
+        entry.load_ms = (time.perf_counter() - start) * 1000
+        entry.mtime = mtime
+        entry.loaded = True
+        entry.loads += 1
+
+    # ------------------------------------------------------------------
+    # Typed accessors
+    # ------------------------------------------------------------------
+
+    def exp_levels(self) -> dict[str, int]:
+        """exp.json's ``levels`` table: str(level) -> exp threshold."""
+        return self.get("exp")
+
+    def monsters(self) -> MonsterTable:
+        return self.get("monsters")
+
+    def curio_url(self, key: str) -> str | None:
+        return self.get("curios").get(key)
+
+    def profile_appearances(self, sex: str) -> list[tuple[str, str]]:
+        """(Class, URL) portraits for "M" / "F", in file order."""
+        return self.get("profiles").get(sex.upper(), [])
+
+    def lines(self, relpath: str) -> list[str]:
+        """A plain-text list under assets/, one stripped entry per line."""
+        return self.get(relpath)
+
+
+registry = AssetRegistry()
+registry.register("exp", "exp.json", _parse_exp)
+registry.register("monsters", "monsters.csv", _parse_monsters)
+registry.register("curios", "curios.csv", _parse_curios)
+registry.register("profiles", "profiles.csv", _parse_profiles)
+for _name in sorted(os.listdir(os.path.join(ASSETS_DIR, "items"))):
+    if _name.endswith(".txt"):
+        registry.register(f"items/{_name}", f"items/{_name}", _parse_lines)
@@ -95,6 +95,19 @@ class BaseLayoutView(ui.LayoutView):
         finally:
             self._dispatch_busy = False
 
+    async def schedule_edit(self, message=None, **kwargs) -> bool:
+        """Edits ``message`` (default ``self.message``) through the bot's
+        shared EditScheduler, so rapid redraws of a live view are paced and
+        coalesced instead of each becoming a REST call. Returns False when
+        a newer edit of the same message superseded this one. Raises like
+        ``message.edit`` would."""
+        message = message or self.message
+        scheduler = getattr(self.bot, "edit_scheduler", None)
+        if scheduler is None:
+            await message.edit(**kwargs)
+            return True
+        return await scheduler.edit(message, **kwargs)
+
     async def on_timeout(self) -> None:
         """Default safe cleanup.
 
@@ -94,6 +94,19 @@ class BaseView(ui.View):
         finally:
             self._dispatch_busy = False
 
+    async def schedule_edit(self, message=None, **kwargs) -> bool:
+        """Edits ``message`` (default ``self.message``) through the bot's
+        shared EditScheduler, so rapid redraws of a live view are paced and
+        coalesced instead of each becoming a REST call. Returns False when
+        a newer edit of the same message superseded this one. Raises like
+        ``message.edit`` would."""
+        message = message or self.message
+        scheduler = getattr(self.bot, "edit_scheduler", None)
+        if scheduler is None:
+            await message.edit(**kwargs)
+            return True
+        return await scheduler.edit(message, **kwargs)
+
     async def _safe_message_edit(
         self, *, retries: int = 1, retry_delay: float = 2.0, **kwargs
     ) -> bool:
@@ -111,7 +124,7 @@ class BaseView(ui.View):
             return False
         for attempt in range(retries + 1):
             try:
-                await self.message.edit(**kwargs)
+                await self.schedule_edit(**kwargs)
                 return True
             except asyncio.CancelledError:
                 raise
@@ -122,7 +122,8 @@ class LeaderboardHubView(BaseView):
             data = await self.bot.database.duels.get_leaderboard(10)
             embed = discord.Embed(title="Hiscores: Top Duelists ⚔️", color=0xFFD700)
             lines = []
-            for i, (user_id, wins, losses) in enumerate(data):
+            for i, row in enumerate(data):
+                user_id, wins, losses = row["user_id"], row["wins"], row["losses"]
                 try:
                     user = await self.bot.fetch_user(int(user_id))
                     name = user.display_name
@@ -3,12 +3,11 @@ core/character/profile_ui_card.py
 Embed builders for the card and cooldowns tabs of the Profile Hub.
 """
 
-import json
-import os
 from datetime import datetime, timedelta, timezone
 
 import discord
 
+from core.assets import registry as assets
 from core.character.prestige_display import format_prestige_name
 from core.emojis import (
     DEVELOPMENT_CONTRACT,
@@ -56,11 +55,7 @@ class CardProfileBuilder:
         )
         _lvl, _exp, _asc = user["level"], user["experience"], user["ascension"]
         try:
-            _exp_path = os.path.join(
-                os.path.dirname(__file__), "..", "..", "assets", "exp.json"
-            )
-            with open(_exp_path, encoding="utf-8") as _f:
-                _exp_table = json.load(_f)["levels"]
+            _exp_table = assets.exp_levels()
             if _lvl >= 100:
                 # Mirrors ExperienceManager.add_experience's ascension threshold:
                 # exp_table["100"] scaled by the current ascension bracket.
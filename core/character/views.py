@@ -1,10 +1,10 @@
-import csv
 import re
 
 import discord
 from discord import ButtonStyle, Interaction, SelectOption, ui
 from discord.ui import Button, Modal, Select, TextInput
 
+from core.assets import registry as assets
 from core.base_view import BaseView
 from core.character.tutorial import TutorialView
 from core.emojis import GOLD_COIN, RUNE_REGRET
@@ -50,16 +50,10 @@ class RegistrationView(BaseView):
         self.nsfw_enabled = False
 
     def _load_appearances(self, gender_code: str):
-        apps = []
         try:
-            with open("assets/profiles.csv", mode="r") as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row["Sex"].upper() == gender_code:
-                        apps.append((row["Class"], row["URL"]))
+            return list(assets.profile_appearances(gender_code))
         except Exception:
-            pass
-        return apps
+            return []
 
     # --- STEP 1: GENDER SELECTION ---
 
@@ -1,4 +1,6 @@
 import copy
+import math
+import random
 from dataclasses import dataclass
 
 from core.models import Monster, Player
@@ -22,6 +24,60 @@ class SimulationResult:
     is_max_lethal: bool
 
 
+@dataclass
+class FightReplicates:
+    """Outcome distribution of N independent full fights."""
+
+    fights: int
+    wins: int
+    win_rate: float
+    win_rate_ci: tuple[float, float]  # Wilson 95% interval
+    ttk_turns: list[int]  # turns to kill, winning fights only, sorted
+    ttk_mean: float
+    ttk_mean_ci: tuple[float, float]  # normal-approximation 95% interval
+
+    def ttk_percentile(self, pct: float) -> int:
+        """Nearest-rank percentile of turns to kill (0 if no wins)."""
+        if not self.ttk_turns:
+            return 0
+        rank = max(1, math.ceil(pct / 100 * len(self.ttk_turns)))
+        return self.ttk_turns[rank - 1]
+
+    @staticmethod
+    def merge(outcomes: list[tuple[bool, int]]) -> "FightReplicates":
+        """Builds the summary from (won, turns) pairs."""
+        fights = len(outcomes)
+        ttk = sorted(turns for won, turns in outcomes if won)
+        wins = len(ttk)
+        z = 1.96
+        if fights:
+            p = wins / fights
+            denom = 1 + z * z / fights
+            centre = (p + z * z / (2 * fights)) / denom
+            half = (
+                z * math.sqrt(p * (1 - p) / fights + z * z / (4 * fights * fights))
+            ) / denom
+            win_ci = (max(0.0, centre - half), min(1.0, centre + half))
+        else:
+            p, win_ci = 0.0, (0.0, 0.0)
+        mean = sum(ttk) / wins if wins else 0.0
+        if wins > 1:
+            var = sum((t - mean) ** 2 for t in ttk) / (wins - 1)
+            half = z * math.sqrt(var / wins)
+            mean_ci = (mean - half, mean + half)
+        else:
+            mean_ci = (mean, mean)
+        return FightReplicates(
+            fights=fights,
+            wins=wins,
+            win_rate=p,
+            win_rate_ci=win_ci,
+            ttk_turns=ttk,
+            ttk_mean=mean,
+            ttk_mean_ci=mean_ci,
+        )
+
+
 class DummyEngine:
     @staticmethod
     def run_simulation(
@@ -36,7 +92,7 @@ class DummyEngine:
         from core.combat.turns import engine
 
         sim_player = copy.deepcopy(player)
-        sim_monster = copy.deepcopy(monster)
+        sim_monster = monster.copy()
 
         # Phase 3: Reset any combat transients on the copied monster
         sim_monster.reset_combat_bonuses()
@@ -109,6 +165,37 @@ class DummyEngine:
             is_max_lethal=(max_damage_taken >= player.total_max_hp),
         )
 
+    @staticmethod
+    def run_fight_outcomes(
+        player: Player,
+        monster: Monster,
+        fights: int,
+        seed: int,
+        max_turns: int | None = None,
+    ) -> list[tuple[bool, int]]:
+        """
+        Fights ``fights`` independent copies of the encounter to the end (no
+        HP resets, no low-HP pause — Full Send rules, 600-turn exhaustion cap)
+        and returns (won, turns) per fight. Each fight reseeds ``random`` with ``seed + i`` so a batch
+        can be split across processes and still reproduce exactly.
+        """
+        from core.combat.turns import engine
+
+        outcomes = []
+        for i in range(fights):
+            random.seed(seed + i)
+            sim_player = copy.deepcopy(player)
+            sim_monster = monster.copy()
+            sim_monster.reset_combat_bonuses()
+            sim_player.combat_ward = sim_player.get_combat_ward_value()
+            engine.apply_stat_effects(sim_player, sim_monster)
+            engine.apply_combat_start_passives(sim_player, sim_monster)
+            result = engine.resolve_auto_battle(
+                sim_player, sim_monster, turn_count=0, max_turns=max_turns
+            )
+            outcomes.append((result.stop_reason == "victory", result.turns))
+        return outcomes
+
     # ---------------------------------------------------------------------- #
     # Readiness assessments for Uber boss lobbies                              #
     # ---------------------------------------------------------------------- #
@@ -0,0 +1,105 @@
+"""
+core/combat/dojo/simulator.py
+Runs DummyEngine simulations in worker processes.
+
+A dojo run or an Uber readiness check is 50–100 real player/monster turns on
+deep copies — pure CPU work that used to run on the event loop, stalling
+every other guild's interactions for its duration. SimulationService ships
+the (picklable) Player/Monster snapshot to a ProcessPoolExecutor and awaits
+the result, so the loop only pays for pickling a few KB.
+
+Workers are spawned (not forked) on every platform: forking a process that
+is running an event loop and aiohttp threads is unsafe, and Windows can only
+spawn anyway. bot.py therefore keeps its side effects behind
+``if __name__ == "__main__"``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from core.combat.dojo.dummy_engine import (
+    DummyEngine,
+    FightReplicates,
+    SimulationResult,
+)
+from core.models import Monster, Player
+
+
+def _warm_worker() -> None:
+    # Pay the combat-engine import once per worker, not on the first request.
+    importlib.import_module("core.combat.turns.engine")
+
+
+class SimulationService:
+    """Shared per-bot process pool for combat simulations."""
+
+    def __init__(self, max_workers: int = 2):
+        self.max_workers = max(1, max_workers)
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+        return self._pool
+
+    async def run(self, fn, *args):
+        """Runs ``fn(*args)`` in a worker. ``fn`` must be a module-level (or
+        class-level static) function and every argument picklable."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor(), fn, *args)
+        except BrokenProcessPool:
+            # A worker died (OOM-killed, crashed); rebuild the pool once.
+            self._pool = None
+            return await loop.run_in_executor(self._executor(), fn, *args)
+
+    async def simulate(
+        self, player: Player, monster: Monster, turns: int = 100
+    ) -> SimulationResult:
+        return await self.run(DummyEngine.run_simulation, player, monster, turns)
+
+    async def assess_readiness(self, player: Player, target: str) -> str:
+        return await self.run(DummyEngine.assess_readiness, player, target)
+
+    async def fight_replicates(
+        self,
+        player: Player,
+        monster: Monster,
+        fights: int = 200,
+        *,
+        seed: int | None = None,
+        max_turns: int | None = None,
+    ) -> FightReplicates:
+        """Fights ``fights`` independent copies of the encounter, split across
+        the workers, and returns the win-rate / time-to-kill distribution."""
+        if seed is None:
+            seed = random.randrange(1 << 30)
+        chunk = -(-fights // self.max_workers)
+        batches = [
+            self.run(
+                DummyEngine.run_fight_outcomes,
+                player,
+                monster,
+                min(chunk, fights - start),
+                seed + start,
+                max_turns,
+            )
+            for start in range(0, fights, chunk)
+        ]
+        outcomes = [o for batch in await asyncio.gather(*batches) for o in batch]
+        return FightReplicates.merge(outcomes)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
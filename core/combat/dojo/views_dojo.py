@@ -2,7 +2,6 @@ import discord
 from discord import ButtonStyle, Interaction, SelectOption, ui
 
 from core.base_view import BaseView
-from core.combat.dojo.dummy_engine import DummyEngine
 from core.combat.mobgen.gen_mob import calculate_monster_stats, get_modifier_description
 from core.combat.mobgen.modifier_data import (
     BOSS_MOD_NAMES,
@@ -326,7 +325,7 @@ class DummyConfigView(BaseView):
             self.player.active_task_species = "_dojo_dummy_"
 
         try:
-            results = DummyEngine.run_simulation(self.player, monster, turns=100)
+            results = await self.bot.simulator.simulate(self.player, monster, turns=100)
         finally:
             self.player.active_task_species = saved_species
 
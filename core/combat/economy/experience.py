@@ -1,6 +1,6 @@
-import json
 import random
 
+from core.assets import registry as assets
 from core.emojis import INNER_SANC, ORIGIN_CORRUPTION
 from core.hall_of_firsts import triggers as hof_triggers
 from core.models import Player
@@ -67,11 +67,6 @@ def _gen_packages(base_atk: int = 0, base_def: int = 0, base_hp: int = 0) -> lis
 
 
 class ExperienceManager:
-    @staticmethod
-    def _get_exp_table():
-        with open("assets/exp.json") as f:
-            return json.load(f)
-
     @staticmethod
     async def add_experience(
         bot,
@@ -109,14 +104,14 @@ class ExperienceManager:
         # 2. Add XP
         player.exp += xp_amount
         changes["xp_added"] = xp_amount
-        exp_table = ExperienceManager._get_exp_table()
+        exp_table = assets.exp_levels()
 
         # Accumulate pending stat packages for all level-ups in this grant.
         new_packages: list[list[dict]] = []
 
         # 3. Process Level Ups
         while True:
-            exp_threshold = exp_table["levels"].get(str(player.level), 999999999)
+            exp_threshold = exp_table.get(str(player.level), 999999999)
             if player.exp < exp_threshold:
                 break
 
@@ -1,5 +1,6 @@
 import random
 
+from core.assets import registry as assets
 from core.combat.economy.config import (
     ACC_STAT_CAPS,
     ARMOR_STAT_CAPS,
@@ -11,7 +12,6 @@ from core.combat.economy.config import (
     WEAPON_STAT_CAPS,
 )
 from core.models import Accessory, Armor, Boot, Glove, Helmet, Weapon
-from core.util import load_list
 
 # ---------------------------------------------------------------------------
 # Weapon Base Templates
@@ -75,9 +75,9 @@ def get_scaled_stat(
 
 async def generate_weapon(user_id: str, level: int) -> Weapon:
     """Generate a unique loot item."""
-    prefix = random.choice(load_list("assets/items/pref.txt"))
-    weapon_type = random.choice(load_list("assets/items/wep.txt"))
-    suffix = random.choice(load_list("assets/items/suff.txt"))
+    prefix = random.choice(assets.lines("items/pref.txt"))
+    weapon_type = random.choice(assets.lines("items/wep.txt"))
+    suffix = random.choice(assets.lines("items/suff.txt"))
     item_name = f"{prefix} {weapon_type} {suffix}"
 
     weapon = Weapon(
@@ -119,9 +119,9 @@ async def generate_weapon(user_id: str, level: int) -> Weapon:
 
 async def generate_accessory(user_id: str, level: int) -> Accessory:
     """Generate a unique accessory item."""
-    prefix = random.choice(load_list("assets/items/pref.txt"))
-    accessory_type = random.choice(load_list("assets/items/acc.txt"))
-    suffix = random.choice(load_list("assets/items/suff.txt"))
+    prefix = random.choice(assets.lines("items/pref.txt"))
+    accessory_type = random.choice(assets.lines("items/acc.txt"))
+    suffix = random.choice(assets.lines("items/suff.txt"))
     acc_name = f"{prefix} {accessory_type} {suffix}"
 
     acc = Accessory(
@@ -160,9 +160,9 @@ async def generate_accessory(user_id: str, level: int) -> Accessory:
 
 async def generate_armor(user_id: str, level: int) -> Armor:
     """Generate a unique armor item."""
-    prefix = random.choice(load_list("assets/items/pref.txt"))
-    armor_type = random.choice(load_list("assets/items/armor.txt"))
-    suffix = random.choice(load_list("assets/items/suff.txt"))
+    prefix = random.choice(assets.lines("items/pref.txt"))
+    armor_type = random.choice(assets.lines("items/armor.txt"))
+    suffix = random.choice(assets.lines("items/suff.txt"))
     armor_name = f"{prefix} {armor_type} {suffix}"
 
     armor = Armor(
@@ -210,11 +210,11 @@ async def generate_glove(user_id: str, level: int) -> Glove:
     """Generate a unique glove item. Gloves roll one primary stat (Atk, Def, or Ward)
     and one secondary stat (PDR or FDR). They do not drop runes."""
     try:
-        prefix = random.choice(load_list("assets/items/pref.txt"))
+        prefix = random.choice(assets.lines("items/pref.txt"))
         glove_type_name = random.choice(
-            load_list("assets/items/gloves.txt")
+            assets.lines("items/gloves.txt")
         )  # Renamed to avoid conflict
-        suffix = random.choice(load_list("assets/items/suff.txt"))
+        suffix = random.choice(assets.lines("items/suff.txt"))
         glove_name = f"{prefix} {glove_type_name} {suffix}"
     except FileNotFoundError:
         glove_name = f"Training Gloves of Level {level}"
@@ -255,9 +255,9 @@ async def generate_boot(user_id: str, level: int) -> Boot:
     and one secondary stat (PDR or FDR). They do not drop runes."""
     try:
         # Assuming asset files: assets/items/boot_pref.txt, assets/items/boots.txt, assets/items/boot_suff.txt
-        prefix = random.choice(load_list("assets/items/pref.txt"))
-        boot_type_name = random.choice(load_list("assets/items/boots.txt"))
-        suffix = random.choice(load_list("assets/items/suff.txt"))
+        prefix = random.choice(assets.lines("items/pref.txt"))
+        boot_type_name = random.choice(assets.lines("items/boots.txt"))
+        suffix = random.choice(assets.lines("items/suff.txt"))
         boot_name = f"{prefix} {boot_type_name} {suffix}"
     except FileNotFoundError:
         boot_name = f"Sturdy Boots of Level {level}"  # Fallback name
@@ -295,11 +295,11 @@ async def generate_boot(user_id: str, level: int) -> Boot:
 
 async def generate_helmet(user_id: str, level: int) -> Helmet:
     try:
-        prefix = random.choice(load_list("assets/items/pref.txt"))
+        prefix = random.choice(assets.lines("items/pref.txt"))
         helm_type = random.choice(
             ["Helm", "Coif", "Sallet", "Bascinet", "Armet", "Visor"]
         )
-        suffix = random.choice(load_list("assets/items/suff.txt"))
+        suffix = random.choice(assets.lines("items/suff.txt"))
         name = f"{prefix} {helm_type} {suffix}"
     except Exception:
         name = f"Sturdy Helm of Level {level}"
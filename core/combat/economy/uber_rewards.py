@@ -229,21 +229,15 @@ async def _uber_setup(view, message) -> dict | None:
     # Note: boss_kill:* ticks are intentionally NOT here — uber kills track uber_complete only.
     # The slay_* quests are for the normal multi-phase boss encounters.
     try:
-        from core.quests.mechanics import tick_quest_progress
+        from core.quests.mechanics import tick_quest_events
 
-        quest_msgs = []
-
-        quest_msgs += await tick_quest_progress(
-            view.bot, view.user_id, view.server_id, "uber_complete"
-        )
-        quest_msgs += await tick_quest_progress(
-            view.bot, view.user_id, view.server_id, "combat_win"
-        )
+        quest_events = {"uber_complete": 1, "combat_win": 1}
         total_dmg = view.monster.max_hp
         if total_dmg > 0:
-            quest_msgs += await tick_quest_progress(
-                view.bot, view.user_id, view.server_id, "damage", total_dmg
-            )
+            quest_events["damage"] = total_dmg
+        quest_msgs = await tick_quest_events(
+            view.bot, view.user_id, view.server_id, quest_events
+        )
 
         if quest_msgs:
             reward_data["msgs"].extend(quest_msgs)
@@ -433,6 +433,7 @@ async def apply_victory_rewards(
     save_jewel_state) and clearing active status.
     """
     reward_data = calculate_rewards(player, monster, apply_modifier_xp_bonus=True)
+    ledger = bot.database.reward_ledger(user_id, server_id)
     special_flags = check_special_drops(player, monster)
     reward_data["special"] = []
     # Total damage dealt to the monster (used by damage quest tracking)
@@ -479,7 +480,7 @@ async def apply_victory_rewards(
             ],
             k=1,
         )[0]
-        await bot.database.alchemy.modify_cosmic_dust(user_id, dust)
+        ledger.cosmic_dust(dust)
         reward_data["consolation_dust"] = dust
 
     exp_changes = await ExperienceManager.add_experience(
@@ -491,7 +492,8 @@ async def apply_victory_rewards(
     if combat_logger:
         combat_logger.log_rewards(player, reward_data, monster)
 
-    await bot.database.users.modify_gold(user_id, reward_data["gold"])
+    ledger.gold(reward_data["gold"])
+    await ledger.flush()
 
     # Flora sig: materialise the converted gold into skilling resources.
     # gold deduction already happened in calculate_rewards; here we write the skill DB.
@@ -535,65 +537,47 @@ async def apply_victory_rewards(
                 f"🤝 **{partner.name}** reached level **{partner.level}**!"
             )
 
-    # Quest progress tracking
+    # Quest progress tracking — every event in one read and one write batch
     try:
-        from core.quests.mechanics import tick_quest_progress
-
-        quest_msgs = []
+        from core.quests.mechanics import tick_quest_events
 
         # Combat win (all victories)
-        quest_msgs += await tick_quest_progress(bot, user_id, server_id, "combat_win")
+        quest_events = {"combat_win": 1}
 
         # Damage dealt
         total_dmg = reward_data.get("total_damage", 0)
         if total_dmg > 0:
-            quest_msgs += await tick_quest_progress(
-                bot, user_id, server_id, "damage", total_dmg
-            )
+            quest_events["damage"] = total_dmg
 
         # Named boss kills (normal multi-phase encounters; uber bosses never reach this path)
         if monster.is_boss:
             boss_name = monster.name.lower()
             if "aphrodite" in boss_name:
-                quest_msgs += await tick_quest_progress(
-                    bot, user_id, server_id, "boss_kill:aphrodite"
-                )
+                quest_events["boss_kill:aphrodite"] = 1
             elif "lucifer" in boss_name:
-                quest_msgs += await tick_quest_progress(
-                    bot, user_id, server_id, "boss_kill:lucifer"
-                )
+                quest_events["boss_kill:lucifer"] = 1
             elif (
                 "castor" in boss_name or "pollux" in boss_name or "gemini" in boss_name
             ):
-                quest_msgs += await tick_quest_progress(
-                    bot, user_id, server_id, "boss_kill:gemini"
-                )
+                quest_events["boss_kill:gemini"] = 1
             elif "neet" in boss_name:
-                quest_msgs += await tick_quest_progress(
-                    bot, user_id, server_id, "boss_kill:neet"
-                )
+                quest_events["boss_kill:neet"] = 1
             elif "evelynn" in boss_name:
-                quest_msgs += await tick_quest_progress(
-                    bot, user_id, server_id, "boss_kill:evelynn"
-                )
+                quest_events["boss_kill:evelynn"] = 1
 
         # Calcified monsters
         if getattr(monster, "is_essence", False):
-            quest_msgs += await tick_quest_progress(
-                bot, user_id, server_id, "calcified_kill"
-            )
+            quest_events["calcified_kill"] = 1
 
         # Corrupted monsters
         if getattr(monster, "is_corrupted", False):
-            quest_msgs += await tick_quest_progress(
-                bot, user_id, server_id, "corrupted_kill"
-            )
+            quest_events["corrupted_kill"] = 1
 
         # Incubated monsters (egg_release hook)
         if getattr(monster, "is_incubated", False):
-            quest_msgs += await tick_quest_progress(
-                bot, user_id, server_id, "egg_release"
-            )
+            quest_events["egg_release"] = 1
+
+        quest_msgs = await tick_quest_events(bot, user_id, server_id, quest_events)
 
         if quest_msgs:
             reward_data["msgs"].extend(quest_msgs)
@@ -1,7 +1,7 @@
-import csv
-import os
 import random
 
+from core.assets import MonsterTable
+from core.assets import registry as assets
 from core.combat.mobgen.modifier_data import (
     BOSS_MOD_NAMES,
     COMMON_MOD_NAMES,
@@ -23,34 +23,13 @@ from core.images import (
 from core.inner_sanctum.mechanics import get_tree_bonuses
 from core.models import Monster
 
-# Module-level cache for monsters.csv rows — populated on first call, never re-read.
-# Tuple layout: (name, url, level_scaled, flavor, species, is_nsfw)
-_MONSTER_ROWS: list[tuple] | None = None
-
-
-def _load_monster_rows() -> list[tuple]:
-    global _MONSTER_ROWS
-    if _MONSTER_ROWS is not None:
-        return _MONSTER_ROWS
-    csv_path = os.path.join(os.path.dirname(__file__), "../../../assets/monsters.csv")
-    rows: list[tuple] = []
+def _monster_table() -> MonsterTable | None:
+    """The indexed monsters.csv table, or None if it failed to load."""
     try:
-        with open(csv_path, newline="") as f:
-            for row in csv.DictReader(f):
-                rows.append(
-                    (
-                        row["name"],
-                        row["url"],
-                        int(row["level"]) * 10,
-                        row["flavor"],
-                        row.get("species", row["name"]),
-                        row.get("nsfw", "").strip() == "1",
-                    )
-                )
+        return assets.monsters()
     except Exception as e:
         print(f"Error reading monsters.csv: {e}")
-    _MONSTER_ROWS = rows
-    return rows
+        return None
 
 
 async def generate_encounter(
@@ -565,10 +544,8 @@ async def fetch_monster_image(
     level, monster_data, task_species=None, nsfw_enabled=False
 ):
     """Fetches a monster image from the monsters.csv file based on the encounter level."""
-    monsters = _load_monster_rows()
-    if not nsfw_enabled:
-        monsters = [monster for monster in monsters if not monster[5]]
-    if not monsters:
+    table = _monster_table()
+    if table is None or not table.pool(include_nsfw=nsfw_enabled):
         monster_data.name = "Commoner"
         monster_data.image = COMBAT_DUMMY
         monster_data.flavor = "stares pleadingly at"
@@ -576,26 +553,25 @@ async def fetch_monster_image(
         return monster_data
 
     if 444 <= level <= 888:
-        for monster in monsters:
-            if monster[2] == level * 10:
-                monster_data.name = monster[0]
-                monster_data.image = monster[1]
-                monster_data.flavor = monster[3]
-                monster_data.species = monster[4]
-                return monster_data
+        specials = table.at_level(level * 10, include_nsfw=nsfw_enabled)
+        if specials:
+            monster = specials[0]
+            monster_data.name = monster[0]
+            monster_data.image = monster[1]
+            monster_data.flavor = monster[3]
+            monster_data.species = monster[4]
+            return monster_data
     else:
         if level == 999:
-            selected_monsters = [
-                monster for monster in monsters if monster[2] == level * 10
-            ]
+            min_level = max_level = level * 10
         else:
             if level > 110:
                 level = 100
             min_level = max(1, level - 30)
             max_level = min(110, level + 10)
-            selected_monsters = [
-                monster for monster in monsters if min_level <= monster[2] <= max_level
-            ]
+        selected_monsters = table.in_range(
+            min_level, max_level, include_nsfw=nsfw_enabled
+        )
 
         if not selected_monsters:
             monster_data.name = "Commoner"
@@ -605,7 +581,9 @@ async def fetch_monster_image(
             return monster_data
 
         if task_species and random.random() < 0.50:
-            task_specific_mobs = [m for m in selected_monsters if m[4] == task_species]
+            task_specific_mobs = table.in_range(
+                min_level, max_level, include_nsfw=nsfw_enabled, species=task_species
+            )
             if task_specific_mobs:
                 selected_monsters = task_specific_mobs
 
@@ -760,11 +738,11 @@ async def generate_incubated_monster(
 
 async def _fetch_incubated_image(original_name: str, monster: "Monster") -> "Monster":
     """Tries to match the original monster name in monsters.csv to grab its image."""
-    for name, url, _, _, species, _ in _load_monster_rows():
-        if name == original_name:
-            monster.image = url
-            monster.species = species
-            return monster
+    table = _monster_table()
+    row = table.by_name.get(original_name) if table is not None else None
+    if row is not None:
+        monster.image = row[1]
+        monster.species = row[4]
     return monster  # fallback: image stays empty, name already set
 
 
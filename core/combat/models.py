@@ -9,7 +9,8 @@ Contains:
   Player            — player character with all stats, gear, and combat helpers
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import Any, List, Optional
 
 from core.items.models import (
@@ -29,9 +30,13 @@ from core.partners.models import Partner
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatState:
-    """Per-combat transient state. Reset to defaults between every fight via Player.reset_combat_state()."""
+    """Per-combat transient state. Reset to defaults between every fight via Player.reset_combat_state().
+
+    Slotted. Every field is an immutable scalar, so copy() is a field-wise
+    copy (also used by deepcopy()) and reset() re-runs __init__ in place.
+    """
 
     ward: int = 0
     is_invulnerable: bool = False
@@ -153,6 +158,22 @@ class CombatState:
     # Prestige gathering boss (Artisan Mastery) transient
     is_snared: bool = False  # Verdant Colossus snare effect
 
+    def copy(self) -> "CombatState":
+        return CombatState(*_combat_state_values(self))
+
+    def reset(self) -> None:
+        """Restores every field to its default, in place."""
+        CombatState.__init__(self)
+
+    def __copy__(self) -> "CombatState":
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> "CombatState":
+        return self.copy()
+
+
+_combat_state_values = attrgetter(*(f.name for f in fields(CombatState)))
+
 
 # ---------------------------------------------------------------------------
 # Per-codex-run state
@@ -176,7 +197,7 @@ class CodexRunState:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class MonsterModifier:
     name: str
     tier: int  # 1–5 for tiered mods; 0 for flat (no numeral shown)
@@ -190,9 +211,17 @@ class MonsterModifier:
         numerals = ["I", "II", "III", "IV", "V"]
         return f"{self.name} {numerals[self.tier - 1]}"
 
+    def copy(self) -> "MonsterModifier":
+        return MonsterModifier(self.name, self.tier, self.value, self.difficulty)
 
-@dataclass
+    def __deepcopy__(self, memo) -> "MonsterModifier":
+        return self.copy()
+
+
+@dataclass(slots=True)
 class Monster:
+    """Slotted: every attribute set on a monster must be declared here."""
+
     name: str
     level: int
     hp: int
@@ -325,6 +354,24 @@ class Monster:
     is_bonus_crit_chance: float = 0.0
     is_bonus_damage_pct: float = 0.0
 
+    # --- Encounter flags set by specific generators / views ---
+    is_uber: bool = False  # Uber boss fights (views_uber_*)
+    is_zenith: bool = False  # guarantees the Imbued Heart drop (victory.py)
+    prestige_boss_type: str = ""  # "golem", "leviathan" or "colossus"
+    # Hematurgy Flash Frost: monster skips its next turn.
+    _hema_frozen: bool = field(default=False, init=False, repr=False)
+
+    def copy(self) -> "Monster":
+        """Independent copy for simulations; equivalent to deepcopy(), since
+        ``modifiers`` is the only mutable field."""
+        new = Monster(*_monster_init_values(self))
+        new.modifiers = [m.copy() for m in self.modifiers]
+        new._hema_frozen = self._hema_frozen
+        return new
+
+    def __deepcopy__(self, memo) -> "Monster":
+        return self.copy()
+
     @property
     def hard_mode(self) -> bool:
         """True when any difficulty mode is active. Keeps legacy callers working."""
@@ -552,10 +599,32 @@ class Monster:
         # Only clear things that are purely per-fight accumulations.
 
 
+_monster_init_values = attrgetter(*(f.name for f in fields(Monster) if f.init))
+
+
 # ---------------------------------------------------------------------------
 # Player
 # ---------------------------------------------------------------------------
 
+# Player fields the memoised loadout terms are derived from (see
+# Player._loadout_cache). Reassigning any of them drops the memo.
+_LOADOUT_FIELDS = frozenset(
+    {
+        "equipped_weapon",
+        "equipped_accessory",
+        "equipped_armor",
+        "equipped_glove",
+        "equipped_boot",
+        "equipped_helmet",
+        "active_companions",
+        "companion_passive_mult",
+        "companion_elite_bond",
+        "codex_tomes",
+        "ascension_unlocks",
+        "soul_stone",
+    }
+)
+
 
 @dataclass
 class Player:
@@ -665,6 +734,27 @@ class Player:
     # Per-codex-run state — persists across waves, reset when a run ends
     run: CodexRunState = field(default_factory=CodexRunState)
 
+    # Memoised loadout terms (companion/tome/essence/ascension/weapon-tier
+    # sums) read by the get_total_* getters every turn. They depend only on
+    # _LOADOUT_FIELDS, never on CombatState, so combat never invalidates
+    # them; gear swaps and compute_flat_stats() do.
+    _loadout_cache: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _LOADOUT_FIELDS:
+            cache = self.__dict__.get("_loadout_cache")
+            if cache:
+                cache.clear()
+
+    def invalidate_derived_stats(self) -> None:
+        """Drops the memoised loadout terms. Reassigning a loadout field or
+        calling compute_flat_stats() already does this; call it directly
+        after mutating gear, companions, tomes or unlocks in place."""
+        self._loadout_cache.clear()
+
     # -----------------------------------------------------------------------
     # Property forwarders — expose CombatState fields under their original names
     # so all existing callsites continue to work unchanged.
@@ -1250,7 +1340,6 @@ class Player:
     ) -> "int | tuple[int, list[tuple[str, float]]]":
         """Same computation as total_max_hp; explain=True also returns a
         contributions list — see get_total_attack docstring."""
-        from core.items.essence_mechanics import compute_essence_stat_bonus
 
         contributions: list[tuple[str, float]] = []
 
@@ -1271,14 +1360,15 @@ class Player:
             if self.equipped_parts
             else 0
         )
-        contributions.append(("Base Max HP", self.max_hp))
-        if self.run_max_hp_bonus:
+        if explain:
+            contributions.append(("Base Max HP", self.max_hp))
+        if explain and self.run_max_hp_bonus:
             contributions.append(("Codex Run Bonus", self.run_max_hp_bonus))
-        if self.bonus_max_hp:
+        if explain and self.bonus_max_hp:
             contributions.append(("Combat bonus accumulator", self.bonus_max_hp))
-        if asc_hp:
+        if explain and asc_hp:
             contributions.append(("Ascension Pinnacle", asc_hp))
-        if parts_hp:
+        if explain and parts_hp:
             contributions.append(("Equipped Monster Parts", parts_hp))
 
         base = (
@@ -1287,27 +1377,26 @@ class Player:
         total_pct = vitality_pct + hearty_pct + self.cs.respite_hp_pct
         if total_pct > 0:
             new_base = int(base * (1 + total_pct / 100))
-            contributions.append(
-                (f"Vitality/Hearty/Respite (+{total_pct:.1f}%)", new_base - base)
-            )
+            if explain:
+                contributions.append(
+                    (f"Vitality/Hearty/Respite (+{total_pct:.1f}%)", new_base - base)
+                )
             base = new_base
-        gluttony_pct = sum(
-            compute_essence_stat_bonus(item).get("max_hp_pct", 0)
-            for item in (self.equipped_glove, self.equipped_boot, self.equipped_helmet)
-            if item
-        )
+        gluttony_pct = self._get_essence_bonus("max_hp_pct")
         if gluttony_pct > 0:
             new_base = int(base * (1 + gluttony_pct / 100))
-            contributions.append(
-                (f"Gluttony Essences (+{gluttony_pct:.1f}%)", new_base - base)
-            )
+            if explain:
+                contributions.append(
+                    (f"Gluttony Essences (+{gluttony_pct:.1f}%)", new_base - base)
+                )
             base = new_base
         # Stat investment bonus (0.1% per point)
         if self.stat_invest_hp > 0:
             new_base = int(base * (1 + self.stat_invest_hp * 0.001))
-            contributions.append(
-                (f"Stat Investment ({self.stat_invest_hp} pts)", new_base - base)
-            )
+            if explain:
+                contributions.append(
+                    (f"Stat Investment ({self.stat_invest_hp} pts)", new_base - base)
+                )
             base = new_base
 
         # Codex signature/boon layer — last step, a single net % of the fully
@@ -1316,12 +1405,13 @@ class Player:
         # only the one-shot permanent run_max_hp_bonus conversion above).
         if self.codex_max_hp_pct:
             new_base = int(base * (1 + self.codex_max_hp_pct))
-            contributions.append(
-                (
-                    f"Codex Signature/Boons ({self.codex_max_hp_pct * 100:+.0f}%)",
-                    new_base - base,
+            if explain:
+                contributions.append(
+                    (
+                        f"Codex Signature/Boons ({self.codex_max_hp_pct * 100:+.0f}%)",
+                        new_base - base,
+                    )
                 )
-            )
             base = new_base
 
         base = max(1, base)
@@ -1330,6 +1420,14 @@ class Player:
         return base
 
     def _get_companion_bonus(self, p_type: str) -> float:
+        key = ("companion", p_type)
+        try:
+            return self._loadout_cache[key]
+        except KeyError:
+            bonus = self._loadout_cache[key] = self._sum_companion_bonus(p_type)
+            return bonus
+
+    def _sum_companion_bonus(self, p_type: str) -> float:
         primary = sum(
             c.passive_value for c in self.active_companions if c.passive_type == p_type
         )
@@ -1415,6 +1513,7 @@ class Player:
         (level-up, gear swap).  get_total_attack/defence read these cached
         values, so this must be called before combat begins.
         """
+        self._loadout_cache.clear()
         self.flat_atk = self._get_flat_attack()
         self.flat_def = self._get_flat_defence()
 
@@ -1445,16 +1544,67 @@ class Player:
         Ward is zeroed here; callers must re-initialize it via get_combat_ward_value().
         Does NOT touch self.run (CodexRunState) — that persists for the whole run.
         """
-        self.cs = CombatState()
+        self.cs.reset()
 
     # -----------------------------------------------------------------------
     # Ascension pinnacle bonus helper
     # -----------------------------------------------------------------------
 
     def get_ascension_bonuses(self) -> dict:
-        from core.ascent.mechanics import AscentMechanics
+        """Summed pinnacle bonuses. Memoised — treat the dict as read-only."""
+        try:
+            return self._loadout_cache["ascension"]
+        except KeyError:
+            from core.ascent.mechanics import AscentMechanics
+
+            bonuses = AscentMechanics.get_cumulative_pinnacle_bonuses(
+                self.ascension_unlocks
+            )
+            self._loadout_cache["ascension"] = bonuses
+            return bonuses
+
+    def _get_essence_bonus(self, stat: str) -> float:
+        """compute_essence_stat_bonus()[stat] summed over glove, boot and
+        helmet (the essence-bearing slots). Memoised."""
+        key = ("essence", stat)
+        try:
+            return self._loadout_cache[key]
+        except KeyError:
+            from core.items.essence_mechanics import compute_essence_stat_bonus
+
+            total = sum(
+                compute_essence_stat_bonus(item).get(stat, 0)
+                for item in (
+                    self.equipped_glove,
+                    self.equipped_boot,
+                    self.equipped_helmet,
+                )
+                if item
+            )
+            self._loadout_cache[key] = total
+            return total
+
+    def _get_weapon_tier(self, family: str) -> tuple[int, str]:
+        """calcs.get_weapon_tier(self, family), memoised."""
+        key = ("weapon_tier", family)
+        try:
+            return self._loadout_cache[key]
+        except KeyError:
+            from core.combat.calc.calcs import get_weapon_tier
+
+            tier = self._loadout_cache[key] = get_weapon_tier(self, family)
+            return tier
+
+    def _get_resonance(self) -> dict:
+        """Soul Stone resonance multipliers, memoised (requires soul_stone)."""
+        try:
+            return self._loadout_cache["resonance"]
+        except KeyError:
+            from core.apex.mechanics import ApexMechanics
 
-        return AscentMechanics.get_cumulative_pinnacle_bonuses(self.ascension_unlocks)
+            res = ApexMechanics.get_resonance_multipliers(self.soul_stone)
+            self._loadout_cache["resonance"] = res
+            return res
 
     # -----------------------------------------------------------------------
     # Total stat calculations
@@ -1488,36 +1638,44 @@ class Player:
         stat-breakdown audit. Delta is the actual amount that source added to
         the total, computed on the same pass as the real total (no duplicated
         math), so it can never drift from what's displayed in the combat embed.
+        Labels are only formatted when explain=True; the per-turn path just
+        sums.
         """
         contributions: list[tuple[str, float]] = []
         flat = self.flat_atk  # Base + Equipment; pre-computed, immutable during combat
-        contributions.append(("FLAT ATK: Base + Equipment + Essences", flat))
+        if explain:
+            contributions.append(("FLAT ATK: Base + Equipment + Essences", flat))
 
         # ---- Flat bonus pool (gear/companion/tome sources) ----
         bonus_pool = self.bonus_atk
-        if self.bonus_atk:
+        if explain and self.bonus_atk:
             contributions.append(("BONUS STAT POOL ACCUMULATOR", self.bonus_atk))
 
         comp_pct = self._get_companion_bonus("atk")
         if comp_pct > 0:
             delta = int(flat * (comp_pct / 100))
             bonus_pool += delta
-            contributions.append((f"Companions (+{comp_pct:.1f}%)", delta))
+            if explain:
+                contributions.append((f"Companions (+{comp_pct:.1f}%)", delta))
 
         # Stat investment bonus (0.1% per point, scales off flat)
         if self.stat_invest_atk > 0:
             delta = int(flat * (self.stat_invest_atk * 0.001))
             bonus_pool += delta
-            contributions.append(
-                (f"Stat Investment ({self.stat_invest_atk} pts)", delta)
-            )
+            if explain:
+                contributions.append(
+                    (f"Stat Investment ({self.stat_invest_atk} pts)", delta)
+                )
 
         # Wrath tome: converts % of flat DEF into bonus ATK
         wrath_pct = self.get_tome_bonus("wrath")
         if wrath_pct > 0:
             delta = int(self.flat_def * (wrath_pct / 100))
             bonus_pool += delta
-            contributions.append((f"Wrath Tome (+{wrath_pct:.1f}% DEF→ATK)", delta))
+            if explain:
+                contributions.append(
+                    (f"Wrath Tome (+{wrath_pct:.1f}% DEF→ATK)", delta)
+                )
 
         # Hematurgy Counterforce: converts % of flat DEF into flat bonus ATK —
         # same shape as the Wrath tome conversion above.
@@ -1527,7 +1685,8 @@ class Player:
             delta = get_counterforce_bonus(self)
             if delta:
                 bonus_pool += delta
-                contributions.append(("Hematurgy Counterforce", delta))
+                if explain:
+                    contributions.append(("Hematurgy Counterforce", delta))
 
         # ---- Percentage-of-flat pool (every "+X% ATK" source sums here) ----
         pct_pool = 0.0
@@ -1536,20 +1695,22 @@ class Player:
         if self.equipped_accessory and self.equipped_accessory.attack:
             acc_pct = self.equipped_accessory.attack / 100
             pct_pool += acc_pct
-            contributions.append(
-                (
-                    f"Accessory (+{self.equipped_accessory.attack}% ATK)",
-                    int(flat * acc_pct),
+            if explain:
+                contributions.append(
+                    (
+                        f"Accessory (+{self.equipped_accessory.attack}% ATK)",
+                        int(flat * acc_pct),
+                    )
                 )
-            )
 
         # Unified multiplier (codex signature/boon + diabolic_pact, etc.)
         if self.atk_multiplier != 1.0:
             d = self.atk_multiplier - 1.0
             pct_pool += d
-            contributions.append(
-                (f"ATK Multiplier (x{self.atk_multiplier:.2f})", int(flat * d))
-            )
+            if explain:
+                contributions.append(
+                    (f"ATK Multiplier (x{self.atk_multiplier:.2f})", int(flat * d))
+                )
 
         # Burning (weapon passive) — moved to an on-hit "increased damage"
         # source in hit_calc.py's build_attack_multiplier() (stacks with
@@ -1560,36 +1721,40 @@ class Player:
             atk_pct = self.get_ascension_bonuses()["atk_pct"]
             if atk_pct:
                 pct_pool += atk_pct / 100
-                contributions.append(
-                    (f"Ascension Pinnacle (+{atk_pct}%)", int(flat * (atk_pct / 100)))
-                )
+                if explain:
+                    contributions.append(
+                        (
+                            f"Ascension Pinnacle (+{atk_pct}%)",
+                            int(flat * (atk_pct / 100)),
+                        )
+                    )
 
         # Soul Stone Vulcan Resonance (offensive_2 / offensive_3)
         if self.soul_stone:
-            from core.apex.mechanics import ApexMechanics
-
-            res = ApexMechanics.get_resonance_multipliers(self.soul_stone)
+            res = self._get_resonance()
             if res["atk_mult"] != 1.0:
                 d = res["atk_mult"] - 1.0
                 pct_pool += d
-                contributions.append(
-                    (
-                        f"Soul Stone Vulcan Resonance (x{res['atk_mult']:.2f})",
-                        int(flat * d),
+                if explain:
+                    contributions.append(
+                        (
+                            f"Soul Stone Vulcan Resonance (x{res['atk_mult']:.2f})",
+                            int(flat * d),
+                        )
                     )
-                )
 
         # Alchemy Enrage (temporary potion % ATK boost) — applies only to Base +
         # Equipment, same as every other pct_pool source, and expires on its own
         # turn timer (see monster_turn.py).
         if self.alchemy_atk_boost_pct > 0:
             pct_pool += self.alchemy_atk_boost_pct
-            contributions.append(
-                (
-                    f"Alchemy Enrage (+{self.alchemy_atk_boost_pct * 100:.0f}%)",
-                    int(flat * self.alchemy_atk_boost_pct),
+            if explain:
+                contributions.append(
+                    (
+                        f"Alchemy Enrage (+{self.alchemy_atk_boost_pct * 100:.0f}%)",
+                        int(flat * self.alchemy_atk_boost_pct),
+                    )
                 )
-            )
 
         # Hematurgy: Iron Momentum (stacking) + Soul Fracture (HP-lost scaling) +
         # Executioner's Rite (conditional on monster < 30% HP, needs monster arg).
@@ -1603,25 +1768,28 @@ class Player:
             im = get_iron_momentum_factor(self)
             if im:
                 pct_pool += im
-                contributions.append(
-                    (f"Hematurgy Iron Momentum (+{im * 100:.1f}%)", int(flat * im))
-                )
+                if explain:
+                    contributions.append(
+                        (f"Hematurgy Iron Momentum (+{im * 100:.1f}%)", int(flat * im))
+                    )
             sf = get_soul_fracture_factor(self)
             if sf:
                 pct_pool += sf
-                contributions.append(
-                    (f"Hematurgy Soul Fracture (+{sf * 100:.1f}%)", int(flat * sf))
-                )
+                if explain:
+                    contributions.append(
+                        (f"Hematurgy Soul Fracture (+{sf * 100:.1f}%)", int(flat * sf))
+                    )
             if monster is not None:
                 er = get_executioners_rite_bonus(self, monster)
                 if er:
                     pct_pool += er
-                    contributions.append(
-                        (
-                            f"Hematurgy Executioner's Rite (+{er * 100:.1f}%)",
-                            int(flat * er),
+                    if explain:
+                        contributions.append(
+                            (
+                                f"Hematurgy Executioner's Rite (+{er * 100:.1f}%)",
+                                int(flat * er),
+                            )
                         )
-                    )
 
         # Slayer Tree hu_1 "Slayer's Edge" — +18% ATK vs the assigned task species.
         # Lives in pct_pool (not a damage multiplier) so it sums with every other
@@ -1633,9 +1801,13 @@ class Player:
             and self.slayer_tree_nodes.get("hu_1") == "atk"
         ):
             pct_pool += 0.18
-            contributions.append(
-                ("Slayer Tree: Slayer's Edge (+18% vs task species)", int(flat * 0.18))
-            )
+            if explain:
+                contributions.append(
+                    (
+                        "Slayer Tree: Slayer's Edge (+18% vs task species)",
+                        int(flat * 0.18),
+                    )
+                )
 
         total = flat + bonus_pool
         if pct_pool:
@@ -1643,7 +1815,7 @@ class Player:
 
         # Permanent run penalty (fragment_boost downside in codex runs) — a flat
         # deduction, not part of the pct_pool base.
-        if self.run_atk_penalty:
+        if explain and self.run_atk_penalty:
             contributions.append(("Codex Run Penalty", -self.run_atk_penalty))
         total -= self.run_atk_penalty
 
@@ -1653,12 +1825,13 @@ class Player:
         # it never compounds with any other ATK% source above.
         if self.codex_atk_pct:
             new_total = int(total * (1 + self.codex_atk_pct))
-            contributions.append(
-                (
-                    f"Codex Signature/Boons ({self.codex_atk_pct * 100:+.0f}%)",
-                    new_total - total,
+            if explain:
+                contributions.append(
+                    (
+                        f"Codex Signature/Boons ({self.codex_atk_pct * 100:+.0f}%)",
+                        new_total - total,
+                    )
                 )
-            )
             total = new_total
 
         total = max(0, total)
@@ -1676,33 +1849,39 @@ class Player:
         """
         contributions: list[tuple[str, float]] = []
         flat = self.flat_def  # Base + Equipment; pre-computed, immutable during combat
-        contributions.append(("Base + Equipment + Essence", flat))
+        if explain:
+            contributions.append(("Base + Equipment + Essence", flat))
 
         # ---- Flat bonus pool ----
         bonus_pool = self.bonus_def
-        if self.bonus_def:
+        if explain and self.bonus_def:
             contributions.append(("Combat bonus accumulator", self.bonus_def))
 
         comp_pct = self._get_companion_bonus("def")
         if comp_pct > 0:
             delta = int(flat * (comp_pct / 100))
             bonus_pool += delta
-            contributions.append((f"Companions (+{comp_pct:.1f}%)", delta))
+            if explain:
+                contributions.append((f"Companions (+{comp_pct:.1f}%)", delta))
 
         # Stat investment bonus (0.1% per point, scales off flat)
         if self.stat_invest_def > 0:
             delta = int(flat * (self.stat_invest_def * 0.001))
             bonus_pool += delta
-            contributions.append(
-                (f"Stat Investment ({self.stat_invest_def} pts)", delta)
-            )
+            if explain:
+                contributions.append(
+                    (f"Stat Investment ({self.stat_invest_def} pts)", delta)
+                )
 
         # Bastion tome: converts % of flat ATK into bonus DEF
         bastion_pct = self.get_tome_bonus("bastion")
         if bastion_pct > 0:
             delta = int(self.flat_atk * (bastion_pct / 100))
             bonus_pool += delta
-            contributions.append((f"Bastion Tome (+{bastion_pct:.1f}% ATK→DEF)", delta))
+            if explain:
+                contributions.append(
+                    (f"Bastion Tome (+{bastion_pct:.1f}% ATK→DEF)", delta)
+                )
 
         # ---- Percentage-of-flat pool ----
         pct_pool = 0.0
@@ -1711,82 +1890,89 @@ class Player:
         if self.equipped_accessory and self.equipped_accessory.defence:
             acc_pct = self.equipped_accessory.defence / 100
             pct_pool += acc_pct
-            contributions.append(
-                (
-                    f"Accessory (+{self.equipped_accessory.defence}% DEF)",
-                    int(flat * acc_pct),
+            if explain:
+                contributions.append(
+                    (
+                        f"Accessory (+{self.equipped_accessory.defence}% DEF)",
+                        int(flat * acc_pct),
+                    )
                 )
-            )
 
         # Unified multiplier
         if self.def_multiplier != 1.0:
             d = self.def_multiplier - 1.0
             pct_pool += d
-            contributions.append(
-                (f"DEF Multiplier (x{self.def_multiplier:.2f})", int(flat * d))
-            )
+            if explain:
+                contributions.append(
+                    (f"DEF Multiplier (x{self.def_multiplier:.2f})", int(flat * d))
+                )
 
         # Sturdy (weapon passive) — permanent DEF gain, always active once
         # equipped (+8% of flat DEF per tier). Previously only applied once at
         # real combat start via apply_combat_start_passives (bonus_def mutation),
         # invisible outside an active fight; now lives here so it's always
         # reflected, with the same net effect once combat begins.
-        from core.combat.calc.calcs import get_weapon_tier
 
-        idx, _ = get_weapon_tier(self, "sturdy")
+        idx, _ = self._get_weapon_tier("sturdy")
         if idx >= 0:
             d = (idx + 1) * 0.08
             pct_pool += d
-            contributions.append(
-                (f"Sturdy (weapon passive, T{idx + 1})", int(flat * d))
-            )
+            if explain:
+                contributions.append(
+                    (f"Sturdy (weapon passive, T{idx + 1})", int(flat * d))
+                )
 
         # Ascension pinnacle % bonus
         if self.ascension_unlocks:
             def_pct = self.get_ascension_bonuses()["def_pct"]
             if def_pct:
                 pct_pool += def_pct / 100
-                contributions.append(
-                    (f"Ascension Pinnacle (+{def_pct}%)", int(flat * (def_pct / 100)))
-                )
+                if explain:
+                    contributions.append(
+                        (
+                            f"Ascension Pinnacle (+{def_pct}%)",
+                            int(flat * (def_pct / 100)),
+                        )
+                    )
 
         # Soul Stone Athena Resonance (defensive_2 / defensive_3)
         if self.soul_stone:
-            from core.apex.mechanics import ApexMechanics
-
-            res = ApexMechanics.get_resonance_multipliers(self.soul_stone)
+            res = self._get_resonance()
             if res["def_mult"] != 1.0:
                 d = res["def_mult"] - 1.0
                 pct_pool += d
-                contributions.append(
-                    (
-                        f"Soul Stone Athena Resonance (x{res['def_mult']:.2f})",
-                        int(flat * d),
+                if explain:
+                    contributions.append(
+                        (
+                            f"Soul Stone Athena Resonance (x{res['def_mult']:.2f})",
+                            int(flat * d),
+                        )
                     )
-                )
 
         # Alchemy Enrage (temporary potion % DEF boost) — same pct_pool treatment
         # as ATK; expires on its own turn timer (see monster_turn.py).
         if self.alchemy_def_boost_pct > 0:
             pct_pool += self.alchemy_def_boost_pct
-            contributions.append(
-                (
-                    f"Alchemy Enrage (+{self.alchemy_def_boost_pct * 100:.0f}%)",
-                    int(flat * self.alchemy_def_boost_pct),
+            if explain:
+                contributions.append(
+                    (
+                        f"Alchemy Enrage (+{self.alchemy_def_boost_pct * 100:.0f}%)",
+                        int(flat * self.alchemy_def_boost_pct),
+                    )
                 )
-            )
 
         # Artefact: Seal of Duality — DEF +15-35% for the rest of combat once
         # the player's ward has broken at least once (see monster_turn.py).
         if self.seal_of_duality_triggered and self.artefact:
             d = self.artefact.roll_1 / 100
             pct_pool += d
-            contributions.append(
-                (
-                    f"Artefact: Seal of Duality (+{self.artefact.roll_1:.0f}%)",
-                    int(flat * d),
+            if explain:
+                contributions.append(
+                    (
+                        f"Artefact: Seal of Duality (+{self.artefact.roll_1:.0f}%)",
+                        int(flat * d),
+                    )
                 )
-            )
 
         # Slayer Tree hu_2 "Hunter's Resolve" — +18% DEF vs the assigned task
         # species. Lives in pct_pool (not a damage-taken multiplier) so it sums
@@ -1798,19 +1984,20 @@ class Player:
             and self.slayer_tree_nodes.get("hu_2") == "def"
         ):
             pct_pool += 0.18
-            contributions.append(
-                (
-                    "Slayer Tree: Hunter's Resolve (+18% vs task species)",
-                    int(flat * 0.18),
+            if explain:
+                contributions.append(
+                    (
+                        "Slayer Tree: Hunter's Resolve (+18% vs task species)",
+                        int(flat * 0.18),
+                    )
                 )
-            )
 
         total = flat + bonus_pool
         if pct_pool:
             total += int(flat * pct_pool)
 
         # Permanent run penalty — a flat deduction, not part of the pct_pool base.
-        if self.run_def_penalty:
+        if explain and self.run_def_penalty:
             contributions.append(("Codex Run Penalty", -self.run_def_penalty))
         total -= self.run_def_penalty
 
@@ -1820,12 +2007,13 @@ class Player:
         # it never compounds with any other DEF% source above.
         if self.codex_def_pct:
             new_total = int(total * (1 + self.codex_def_pct))
-            contributions.append(
-                (
-                    f"Codex Signature/Boons ({self.codex_def_pct * 100:+.0f}%)",
-                    new_total - total,
+            if explain:
+                contributions.append(
+                    (
+                        f"Codex Signature/Boons ({self.codex_def_pct * 100:+.0f}%)",
+                        new_total - total,
+                    )
                 )
-            )
             total = new_total
 
         total = max(0, total)
@@ -1838,7 +2026,6 @@ class Player:
     ) -> "tuple[int, int] | tuple[int, int, list[tuple[str, float]]]":
         """Returns (raw_pdr, pdr_cap) before the hard cap is applied.
         explain=True appends a contributions list — see get_total_attack docstring."""
-        from core.items.essence_mechanics import compute_essence_stat_bonus
 
         contributions: list[tuple[str, float]] = []
         total = 0
@@ -1852,54 +2039,59 @@ class Player:
         if self.equipped_helmet:
             gear_pdr += self.equipped_helmet.pdr
         total += gear_pdr
-        if gear_pdr:
+        if explain and gear_pdr:
             contributions.append(("Equipment (armor/glove/boot/helmet)", gear_pdr))
 
         # Companions
         comp = self._get_companion_bonus("pdr")
         if comp:
             total += comp
-            contributions.append(("Companions", comp))
+            if explain:
+                contributions.append(("Companions", comp))
 
         # Bulwark tome: bonus PDR
         bulwark = int(self.get_tome_bonus("bulwark"))
         if bulwark:
             total += bulwark
-            contributions.append(("Bulwark Tome", bulwark))
+            if explain:
+                contributions.append(("Bulwark Tome", bulwark))
 
         # Essence bonuses
-        essence_pdr = sum(
-            compute_essence_stat_bonus(item).get("pdr", 0)
-            for item in (self.equipped_glove, self.equipped_boot, self.equipped_helmet)
-            if item
-        )
+        essence_pdr = self._get_essence_bonus("pdr")
         if essence_pdr:
             total += essence_pdr
-            contributions.append(("Essences", essence_pdr))
+            if explain:
+                contributions.append(("Essences", essence_pdr))
 
         # Corrupted essence: Lucifer helmet — PDR burst on ward break (transient, persists rest of combat)
         if self.lucifer_pdr_burst:
             total += self.lucifer_pdr_burst
-            contributions.append(
-                ("Lucifer Corrupted Essence (ward-break burst)", self.lucifer_pdr_burst)
-            )
+            if explain:
+                contributions.append(
+                    (
+                        "Lucifer Corrupted Essence (ward-break burst)",
+                        self.lucifer_pdr_burst,
+                    )
+                )
 
         # Ascension pinnacle flat PDR
         if self.ascension_unlocks:
             asc_pdr = self.get_ascension_bonuses()["pdr"]
             if asc_pdr:
                 total += asc_pdr
-                contributions.append(("Ascension Pinnacle", asc_pdr))
+                if explain:
+                    contributions.append(("Ascension Pinnacle", asc_pdr))
 
         # Codex chapter PDR reduction (applied before hard cap)
         if self.chapter_pdr_reduction > 0:
             reduced = int(total * (1 - self.chapter_pdr_reduction))
-            contributions.append(
-                (
-                    f"Codex Chapter PDR Reduction (-{self.chapter_pdr_reduction * 100:.0f}%)",
-                    reduced - total,
+            if explain:
+                contributions.append(
+                    (
+                        f"Codex Chapter PDR Reduction (-{self.chapter_pdr_reduction * 100:.0f}%)",
+                        reduced - total,
+                    )
                 )
-            )
             total = reduced
 
         # Soul stone: impregnable — T1=+2% → T5=+10% PDR (skipped if armor passive active)
@@ -1909,7 +2101,10 @@ class Player:
         ):
             delta = ss_impregnable * 2
             total += delta
-            contributions.append((f"Soul Stone Impregnable (T{ss_impregnable})", delta))
+            if explain:
+                contributions.append(
+                    (f"Soul Stone Impregnable (T{ss_impregnable})", delta)
+                )
 
         # Hard cap: 90% with Impregnable armor passive OR soul stone impregnable, otherwise 80%
         has_impregnable = (
@@ -1946,7 +2141,6 @@ class Player:
     def get_total_fdr(
         self, explain: bool = False
     ) -> "int | tuple[int, list[tuple[str, float]]]":
-        from core.items.essence_mechanics import compute_essence_stat_bonus
 
         contributions: list[tuple[str, float]] = []
         total = 0
@@ -1960,42 +2154,43 @@ class Player:
         if self.equipped_helmet:
             gear_fdr += self.equipped_helmet.fdr
         total += gear_fdr
-        if gear_fdr:
+        if explain and gear_fdr:
             contributions.append(("Equipment (armor/glove/boot/helmet)", gear_fdr))
 
         # Companions
         comp = self._get_companion_bonus("fdr")
         if comp:
             total += comp
-            contributions.append(("Companions", comp))
+            if explain:
+                contributions.append(("Companions", comp))
 
         # Resilience tome: bonus flat damage reduction
         resilience = int(self.get_tome_bonus("resilience"))
         if resilience:
             total += resilience
-            contributions.append(("Resilience Tome", resilience))
+            if explain:
+                contributions.append(("Resilience Tome", resilience))
 
         # Codex FDR boon (per-wave transient)
         if self.boon_fdr:
             total += self.boon_fdr
-            contributions.append(("Codex FDR Boon", self.boon_fdr))
+            if explain:
+                contributions.append(("Codex FDR Boon", self.boon_fdr))
 
         # Essence bonuses
-        essence_fdr = sum(
-            compute_essence_stat_bonus(item).get("fdr", 0)
-            for item in (self.equipped_glove, self.equipped_boot, self.equipped_helmet)
-            if item
-        )
+        essence_fdr = self._get_essence_bonus("fdr")
         if essence_fdr:
             total += essence_fdr
-            contributions.append(("Essences", essence_fdr))
+            if explain:
+                contributions.append(("Essences", essence_fdr))
 
         # Ascension pinnacle flat FDR
         if self.ascension_unlocks:
             asc_fdr = self.get_ascension_bonuses()["fdr"]
             if asc_fdr:
                 total += asc_fdr
-                contributions.append(("Ascension Pinnacle", asc_fdr))
+                if explain:
+                    contributions.append(("Ascension Pinnacle", asc_fdr))
 
         total = int(total)
         if explain:
@@ -2005,7 +2200,6 @@ class Player:
     def get_total_ward_percentage(
         self, explain: bool = False
     ) -> "int | tuple[int, list[tuple[str, float]]]":
-        from core.items.essence_mechanics import compute_essence_stat_bonus
 
         contributions: list[tuple[str, float]] = []
         total = 0
@@ -2033,11 +2227,7 @@ class Player:
             contributions.append(("Companions", comp))
 
         # Essence bonuses (ward % bonus)
-        essence_ward = sum(
-            compute_essence_stat_bonus(item).get("ward", 0)
-            for item in (self.equipped_glove, self.equipped_boot, self.equipped_helmet)
-            if item
-        )
+        essence_ward = self._get_essence_bonus("ward")
         if essence_ward:
             total += essence_ward
             contributions.append(("Essences", essence_ward))
@@ -2049,7 +2239,6 @@ class Player:
     def get_current_crit_chance(
         self, explain: bool = False
     ) -> "int | tuple[int, list[tuple[str, float]]]":
-        from core.items.essence_mechanics import compute_essence_stat_bonus
 
         contributions: list[tuple[str, float]] = []
 
@@ -2061,66 +2250,74 @@ class Player:
         )
         if weapon_crit:
             chance += weapon_crit
-            contributions.append(("Weapon base crit", weapon_crit))
+            if explain:
+                contributions.append(("Weapon base crit", weapon_crit))
         if self.equipped_accessory and self.equipped_accessory.crit:
             chance += self.equipped_accessory.crit
-            contributions.append(("Accessory crit", self.equipped_accessory.crit))
+            if explain:
+                contributions.append(("Accessory crit", self.equipped_accessory.crit))
 
         # Piercing (weapon passive) — permanent flat crit chance, always active
         # once equipped (+5% per tier). Previously only added by
         # calc/hit_calc.py:calculate_crit_chance() at roll time, invisible on
         # the base stat; now lives here so it's always reflected.
-        from core.combat.calc.calcs import get_weapon_tier
 
-        idx, _ = get_weapon_tier(self, "piercing")
+        idx, _ = self._get_weapon_tier("piercing")
         if idx >= 0:
             delta = (idx + 1) * 5
             chance += delta
-            contributions.append((f"Piercing (weapon passive, T{idx + 1})", delta))
+            if explain:
+                contributions.append((f"Piercing (weapon passive, T{idx + 1})", delta))
 
         # Companions
         comp = self._get_companion_bonus("crit")
         if comp:
             chance += comp
-            contributions.append(("Companions", comp))
+            if explain:
+                contributions.append(("Companions", comp))
 
         # Precision tome
         precision = int(self.get_tome_bonus("precision"))
         if precision:
             chance += precision
-            contributions.append(("Precision Tome", precision))
+            if explain:
+                contributions.append(("Precision Tome", precision))
 
         # Essence bonuses (Insight)
-        essence_crit = sum(
-            compute_essence_stat_bonus(item).get("crit", 0)
-            for item in (self.equipped_glove, self.equipped_boot, self.equipped_helmet)
-            if item
-        )
+        essence_crit = self._get_essence_bonus("crit")
         if essence_crit:
             chance += essence_crit
-            contributions.append(("Essences", essence_crit))
+            if explain:
+                contributions.append(("Essences", essence_crit))
 
         # Per-combat/chapter bonus accumulator and permanent run penalty
         if self.bonus_crit:
             chance += self.bonus_crit
-            contributions.append(("Combat bonus accumulator", self.bonus_crit))
+            if explain:
+                contributions.append(("Combat bonus accumulator", self.bonus_crit))
         if self.run_crit_penalty:
             chance -= self.run_crit_penalty
-            contributions.append(("Codex Run Penalty", -self.run_crit_penalty))
+            if explain:
+                contributions.append(("Codex Run Penalty", -self.run_crit_penalty))
 
         # Ascension pinnacle flat crit
         if self.ascension_unlocks:
             asc_crit = self.get_ascension_bonuses()["crit"]
             if asc_crit:
                 chance += asc_crit
-                contributions.append(("Ascension Pinnacle", asc_crit))
+                if explain:
+                    contributions.append(("Ascension Pinnacle", asc_crit))
 
         # Multiplicative layer (Insight helmet passive, future mods)
         if self.crit_multiplier != 1.0:
             new_chance = int(chance * self.crit_multiplier)
-            contributions.append(
-                (f"Crit Multiplier (x{self.crit_multiplier:.2f})", new_chance - chance)
-            )
+            if explain:
+                contributions.append(
+                    (
+                        f"Crit Multiplier (x{self.crit_multiplier:.2f})",
+                        new_chance - chance,
+                    )
+                )
             chance = new_chance
 
         # Codex signature/boon layer — last step, a flat point add (current
@@ -2131,7 +2328,8 @@ class Player:
         # layer above) so it can never compound with them.
         if self.codex_crit_flat:
             chance += self.codex_crit_flat
-            contributions.append(("Codex Signature/Boons", self.codex_crit_flat))
+            if explain:
+                contributions.append(("Codex Signature/Boons", self.codex_crit_flat))
 
         chance = max(0, chance)
         if explain:
@@ -2164,8 +2362,6 @@ class Player:
         page): the ATK-vs-DEF ratio term and monster-conditional sources
         (Blinding, Slayer Tree species match) are skipped when monster is None.
         """
-        from core.combat.calc.calcs import get_weapon_tier
-        from core.items.essence_mechanics import compute_essence_stat_bonus
 
         contributions: list[tuple[str, float]] = []
 
@@ -2204,11 +2400,7 @@ class Player:
                 contributions.append((f"Ascension Pinnacle (+{hit_bonus})", hit_bonus))
                 base_pct += hit_bonus
 
-        essence_hit = sum(
-            compute_essence_stat_bonus(item).get("hit_pct", 0)
-            for item in (self.equipped_glove, self.equipped_boot, self.equipped_helmet)
-            if item
-        )
+        essence_hit = self._get_essence_bonus("hit_pct")
         if essence_hit:
             contributions.append(("Essences", essence_hit))
             base_pct += essence_hit
@@ -2236,7 +2428,7 @@ class Player:
             acc_bonus += 8
             contributions.append(("Slayer Tree: vs task species", 8))
 
-        idx, _ = get_weapon_tier(self, "deadeye")
+        idx, _ = self._get_weapon_tier("deadeye")
         if idx >= 0:
             delta = (idx + 1) * 4
             acc_bonus += delta
@@ -2265,17 +2457,12 @@ class Player:
         self, explain: bool = False
     ) -> "int | tuple[int, list[tuple[str, float]]]":
         """Total evasion including armor base and any essence bonuses on glove/boot/helmet."""
-        from core.items.essence_mechanics import compute_essence_stat_bonus
 
         contributions: list[tuple[str, float]] = []
         total = self.equipped_armor.evasion if self.equipped_armor else 0
         if total:
             contributions.append(("Equipment (armor)", total))
-        essence_evasion = sum(
-            compute_essence_stat_bonus(item).get("evasion", 0)
-            for item in (self.equipped_glove, self.equipped_boot, self.equipped_helmet)
-            if item
-        )
+        essence_evasion = self._get_essence_bonus("evasion")
         if essence_evasion:
             total += essence_evasion
             contributions.append(("Essences", essence_evasion))
@@ -2287,17 +2474,12 @@ class Player:
         self, explain: bool = False
     ) -> "int | tuple[int, list[tuple[str, float]]]":
         """Total block including armor base and any essence bonuses on glove/boot/helmet."""
-        from core.items.essence_mechanics import compute_essence_stat_bonus
 
         contributions: list[tuple[str, float]] = []
         total = self.equipped_armor.block if self.equipped_armor else 0
         if total:
             contributions.append(("Equipment (armor)", total))
-        essence_block = sum(
-            compute_essence_stat_bonus(item).get("block", 0)
-            for item in (self.equipped_glove, self.equipped_boot, self.equipped_helmet)
-            if item
-        )
+        essence_block = self._get_essence_bonus("block")
         if essence_block:
             total += essence_block
             contributions.append(("Essences", essence_block))
@@ -2594,7 +2776,15 @@ class Player:
 
     def get_tome_bonus(self, passive_type: str) -> float:
         """Returns the accumulated stat value for a given Codex tome passive type."""
-        return sum(t.value for t in self.codex_tomes if t.passive_type == passive_type)
+        key = ("tome", passive_type)
+        try:
+            return self._loadout_cache[key]
+        except KeyError:
+            total = sum(
+                t.value for t in self.codex_tomes if t.passive_type == passive_type
+            )
+            self._loadout_cache[key] = total
+            return total
 
     def get_effective_max_hp(self) -> int:
         """Alias for total_max_hp — kept for display call sites."""
@@ -6,6 +6,7 @@ All combat logic lives in the focused sub-modules:
   passives.py     — combat-start passives, apply_stat_effects
   player_turn.py  — process_player_turn, process_heal, _pt_* phases
   monster_turn.py — process_monster_turn, _roll_monster_damage
+  resolver.py     — resolve_auto_battle (headless Auto / Full Send turns)
   calcs.py        — hit chance, damage, crit chance (pure math)
   combat_log.py   — CombatLogger
 
@@ -18,11 +19,13 @@ from core.combat.turns.helpers import MonsterTurnResult, PlayerTurnResult
 from core.combat.turns.monster_turn import process_monster_turn
 from core.combat.turns.passives import apply_combat_start_passives, apply_stat_effects
 from core.combat.turns.player_turn import process_heal, process_player_turn
+from core.combat.turns.resolver import AutoBattleResult, resolve_auto_battle
 
 __all__ = [
     # Result types
     "PlayerTurnResult",
     "MonsterTurnResult",
+    "AutoBattleResult",
     # Ward helper (used by views and uber views)
     "_add_ward",
     # Combat lifecycle
@@ -31,6 +34,7 @@ __all__ = [
     "process_player_turn",
     "process_monster_turn",  # now accepts optional context_note="" for retaliation logging
     "process_heal",
+    "resolve_auto_battle",
     # Logging
     "CombatLogger",
 ]
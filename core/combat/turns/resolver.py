@@ -0,0 +1,127 @@
+"""
+core/combat/turns/resolver.py — Headless auto-battle resolution.
+
+Auto and Full Send used to run one player/monster exchange at a time with a
+message edit and a one-second sleep in between, so a long boss fight held
+its view, state lock and a stream of REST edits open for minutes. The
+outcome never depended on that pacing: every turn is already pure in-memory
+work on the Player and Monster.
+
+resolve_auto_battle() runs those same turns back-to-back until the current
+phase ends, the low-HP threshold is reached, the turn budget is spent or
+the 600-turn exhaustion cap hits. It returns an AutoBattleResult with a
+compact per-turn timeline; the view shows one summary frame per phase
+instead of one frame per turn. Phase transitions stay in the view
+(handle_end_state), which calls back in here for the next phase.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from core.combat.combat_log import CombatLogger
+from core.combat.turns.helpers import MonsterTurnResult, PlayerTurnResult
+from core.combat.turns.monster_turn import process_monster_turn
+from core.combat.turns.player_turn import process_player_turn
+from core.models import Monster, Player
+
+EXHAUSTION_TURNS = 600
+
+
+@dataclass
+class TurnEvent:
+    turn: int  # fight-wide turn number (1-based)
+    damage_dealt: int  # damage the player dealt to the monster
+    is_crit: bool
+    damage_taken: int  # player HP lost to the monster's reply (0 if it died first)
+    player_hp: int  # after both sides acted
+    monster_hp: int
+
+
+@dataclass
+class AutoBattleResult:
+    turns: int = 0  # turns resolved by this call
+    stop_reason: str = ""  # victory | defeat | low_hp | budget | exhaustion
+    timeline: list[TurnEvent] = field(default_factory=list)
+    last_player_turn: PlayerTurnResult | None = None
+    last_monster_turn: MonsterTurnResult | str = ""
+    # HP lost to the last monster turn; None if the monster never acted.
+    killing_blow: int | None = None
+
+    @property
+    def damage_dealt(self) -> int:
+        return sum(e.damage_dealt for e in self.timeline)
+
+    @property
+    def damage_taken(self) -> int:
+        return sum(e.damage_taken for e in self.timeline)
+
+    @property
+    def crits(self) -> int:
+        return sum(1 for e in self.timeline if e.is_crit)
+
+
+def resolve_auto_battle(
+    player: Player,
+    monster: Monster,
+    *,
+    turn_count: int,
+    hp_threshold: float = 0,
+    max_turns: int | None = None,
+    combat_logger: CombatLogger | None = None,
+) -> AutoBattleResult:
+    """Runs player/monster exchanges until the fight (or phase) is decided.
+
+    A turn only starts while the player is above ``hp_threshold``, the
+    monster is alive, ``turn_count`` (turns already fought this encounter)
+    is under the exhaustion cap and fewer than ``max_turns`` turns have run
+    in this call. Each turn is identical to a manual Attack, including the
+    combat-log file entries when ``combat_logger`` is given.
+    """
+    result = AutoBattleResult()
+    while (
+        player.current_hp > hp_threshold
+        and monster.hp > 0
+        and turn_count + result.turns < EXHAUSTION_TURNS
+        and (max_turns is None or result.turns < max_turns)
+    ):
+        p_log = process_player_turn(player, monster)
+        if combat_logger:
+            combat_logger.log_player_turn(p_log, monster)
+        m_log: MonsterTurnResult | str = ""
+        taken = 0
+        if monster.hp > 0:
+            hp_before = player.current_hp
+            m_log = process_monster_turn(player, monster)
+            taken = hp_before - max(0, player.current_hp)
+            result.killing_blow = taken
+            if combat_logger:
+                combat_logger.log_monster_turn(m_log, player)
+                combat_logger.log_player_stat_snapshot(player, monster)
+                combat_logger.log_monster_stat_snapshot(monster)
+
+        result.turns += 1
+        result.last_player_turn = p_log
+        result.last_monster_turn = m_log
+        result.timeline.append(
+            TurnEvent(
+                turn=turn_count + result.turns,
+                damage_dealt=p_log.damage,
+                is_crit=p_log.is_crit,
+                damage_taken=taken,
+                player_hp=player.current_hp,
+                monster_hp=monster.hp,
+            )
+        )
+
+    if monster.hp <= 0:
+        result.stop_reason = "victory"
+    elif player.current_hp <= 0:
+        result.stop_reason = "defeat"
+    elif turn_count + result.turns >= EXHAUSTION_TURNS:
+        result.stop_reason = "exhaustion"
+    elif player.current_hp <= hp_threshold:
+        result.stop_reason = "low_hp"
+    else:
+        result.stop_reason = "budget"
+    return result
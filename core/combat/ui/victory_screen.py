@@ -5,12 +5,11 @@ Provides:
   create_victory_embed — Builds the post-combat victory embed with loot summary.
 """
 
-import json
-import os
 from typing import Any, Dict, Optional
 
 import discord
 
+from core.assets import registry as assets
 from core.character.prestige_display import format_prestige_name
 from core.emojis import (
     ANGEL_KEY,
@@ -73,18 +72,8 @@ from core.images import COMBAT_VICTORY
 from core.items.models import _PART_SLOT_LABELS
 from core.models import Monster, Player
 
-_EXP_TABLE: dict = {}
-
-
 def _load_exp_table() -> dict:
-    global _EXP_TABLE
-    if not _EXP_TABLE:
-        path = os.path.join(
-            os.path.dirname(__file__), "..", "..", "..", "assets", "exp.json"
-        )
-        with open(path, encoding="utf-8") as f:
-            _EXP_TABLE = json.load(f)["levels"]
-    return _EXP_TABLE
+    return assets.exp_levels()
 
 
 def _exp_progress_str(level: int, exp: int, ascension: int = 0) -> str:
@@ -456,6 +456,36 @@ class CombatView(BaseLayoutView):
         self.combat_logger.log_monster_stat_snapshot(self.monster)
         return log
 
+    def _run_headless(
+        self, *, hp_threshold: float = 0, max_turns: int | None = None
+    ) -> engine.AutoBattleResult:
+        """Resolves auto-battle turns in memory (see resolve_auto_battle) and
+        applies the outcome to this view's turn counter, logs and killing blow."""
+        result = engine.resolve_auto_battle(
+            self.player,
+            self.monster,
+            turn_count=self._turn_count,
+            hp_threshold=hp_threshold,
+            max_turns=max_turns,
+            combat_logger=self.combat_logger,
+        )
+        self._turn_count += result.turns
+        if result.killing_blow is not None:
+            self.killing_blow = result.killing_blow
+        if result.turns:
+            self.logs = {
+                self.player.name: result.last_player_turn,
+                self.monster.name: result.last_monster_turn,
+            }
+        return result
+
+    @staticmethod
+    def _auto_summary(result: engine.AutoBattleResult) -> str:
+        return (
+            f"⚡ **{result.turns}** turns resolved — dealt **{result.damage_dealt:,}** "
+            f"damage ({result.crits} crits), took **{result.damage_taken:,}**."
+        )
+
     def _apply_phase_image_transition(self):
         """Permanently swap monster to image2 once HP drops to or below 50% (one-way)."""
         if self.monster.image2 and self.monster.hp * 2 <= self.monster.max_hp:
@@ -603,29 +633,18 @@ class CombatView(BaseLayoutView):
         message = interaction.message
 
         self.update_buttons()
-        await message.edit(view=self)
+        await self.schedule_edit(message, view=self)
 
         while True:
-            # Inner loop: fight the current phase to completion
-            while (
-                self.player.current_hp > hp_threshold
-                and self.monster.hp > 0
-                and self._turn_count < 600
-                and not self._stop_auto
-            ):
-                p_log = engine.process_player_turn(self.player, self.monster)
-                self.combat_logger.log_player_turn(p_log, self.monster)
-                m_log = ""
-                if self.monster.hp > 0:
-                    m_log = self._do_monster_turn()
-
-                self.logs = {self.player.name: p_log, self.monster.name: m_log}
-                self._turn_count += 1
-
-                self._apply_phase_image_transition()
-                self._sync_items(self._build_layout(compact=True))
-                await message.edit(view=self)
-                await asyncio.sleep(1.0)
+            # Fight the current phase to completion in memory, then show a
+            # single summary frame instead of one edit per turn.
+            if not self._stop_auto:
+                result = self._run_headless(hp_threshold=hp_threshold)
+                if result.turns:
+                    self.logs["System"] = self._auto_summary(result)
+                    self._apply_phase_image_transition()
+                    self._sync_items(self._build_layout(compact=True))
+                    await self.schedule_edit(message, view=self)
 
             was_auto = self._auto_running
             self._auto_running = False
@@ -636,7 +655,7 @@ class CombatView(BaseLayoutView):
                 self.player.cs.is_snared = False
                 self.logs["Flee"] = "You managed to escape safely!"
                 self._sync_items(interactive=False)
-                await message.edit(view=self)
+                await self.schedule_edit(message, view=self)
                 self.bot.state_manager.clear_active(self.user_id)
                 await self.bot.database.users.update_from_player_object(self.player)
                 await _je.save_jewel_state(self.bot, self.user_id, self.player)
@@ -673,7 +692,7 @@ class CombatView(BaseLayoutView):
                 self.logs["Auto-Battle"] = "🛑 Paused: Low HP Protection triggered!"
                 self.update_buttons()
                 self._sync_items()
-                await message.edit(view=self)
+                await self.schedule_edit(message, view=self)
                 await message.channel.send(
                     f"<@{self.user_id}> ⚠️ Low HP Protection triggered — auto paused!",
                     delete_after=15,
@@ -751,33 +770,11 @@ class CombatView(BaseLayoutView):
         # deferred interactions that later corrupt the post-combat view.
         for child in (*self.row1.children, *self.row2.children):
             child.disabled = True
-        await interaction.message.edit(view=self)
-
-        turns_processed = 0
+        await self.schedule_edit(interaction.message, view=self)
 
-        for _ in range(10):
-            if (
-                self.player.current_hp <= (self.player.total_max_hp * 0.2)
-                or self.monster.hp <= 0
-            ):
-                break
-
-            p_log = engine.process_player_turn(self.player, self.monster)
-            self.combat_logger.log_player_turn(p_log, self.monster)
-            m_log = ""
-            if self.monster.hp > 0:
-                m_log = self._do_monster_turn()
-
-            self.logs = {self.player.name: p_log, self.monster.name: m_log}
-            self._turn_count += 1
-            turns_processed += 1
-
-            if (
-                self._turn_count >= 600
-                and self.monster.hp > 0
-                and self.player.current_hp > 0
-            ):
-                break
+        turns_processed = self._run_headless(
+            hp_threshold=self.player.total_max_hp * 0.2, max_turns=10
+        ).turns
 
         if (
             self._turn_count >= 600
@@ -833,45 +830,18 @@ class CombatView(BaseLayoutView):
         message = interaction.message
 
         self.update_buttons()
-        await message.edit(view=self)
+        await self.schedule_edit(message, view=self)
 
         while True:
-            # Inner loop: fight the current phase to completion, 10 turns per
-            # batch — one UI refresh per batch instead of every single turn.
-            while (
-                self.player.current_hp > 0
-                and self.monster.hp > 0
-                and self._turn_count < 600
-                and not self._stop_auto
-            ):
-                for _ in range(10):
-                    if (
-                        self.player.current_hp <= 0
-                        or self.monster.hp <= 0
-                        or self._turn_count >= 600
-                        or self._stop_auto
-                    ):
-                        break
-                    p_log = engine.process_player_turn(self.player, self.monster)
-                    self.combat_logger.log_player_turn(p_log, self.monster)
-                    m_log = ""
-                    if self.monster.hp > 0:
-                        m_log = self._do_monster_turn()
-
-                    self.logs = {self.player.name: p_log, self.monster.name: m_log}
-                    self._turn_count += 1
-
-                self._apply_phase_image_transition()
-                self._sync_items(self._build_layout(compact=True))
-                await message.edit(view=self)
-
-                if (
-                    self.player.current_hp > 0
-                    and self.monster.hp > 0
-                    and self._turn_count < 600
-                    and not self._stop_auto
-                ):
-                    await asyncio.sleep(1.0)
+            # Fight the current phase to completion in memory, then show a
+            # single summary frame instead of an edit every 10 turns.
+            if not self._stop_auto:
+                result = self._run_headless()
+                if result.turns:
+                    self.logs["System"] = self._auto_summary(result)
+                    self._apply_phase_image_transition()
+                    self._sync_items(self._build_layout(compact=True))
+                    await self.schedule_edit(message, view=self)
 
             was_auto = self._auto_running
             self._auto_running = False
@@ -882,7 +852,7 @@ class CombatView(BaseLayoutView):
                 self.player.cs.is_snared = False
                 self.logs["Flee"] = "You managed to escape safely!"
                 self._sync_items(interactive=False)
-                await message.edit(view=self)
+                await self.schedule_edit(message, view=self)
                 self.bot.state_manager.clear_active(self.user_id)
                 await self.bot.database.users.update_from_player_object(self.player)
                 await _je.save_jewel_state(self.bot, self.user_id, self.player)
@@ -1058,7 +1028,7 @@ class CombatView(BaseLayoutView):
             self._sync_items(
                 combat_ui.embed_to_container(trans_embed), interactive=False
             )
-            await message.edit(view=self)
+            await self.schedule_edit(message, view=self)
             await asyncio.sleep(2)
 
             if not self._was_auto:
@@ -1072,7 +1042,7 @@ class CombatView(BaseLayoutView):
                     title_override=f"⚔️ BOSS PHASE {self.current_phase_index + 1}"
                 )
             )
-            await message.edit(view=self)
+            await self.schedule_edit(message, view=self)
             return  # Keep view alive for next phase
 
         # --- FINAL VICTORY ---
@@ -298,12 +298,11 @@ class UberHubView(BaseLayoutView):
             await interaction.response.defer()
             return
         self._processing = True
-        from core.combat.dojo.dummy_engine import DummyEngine
         from core.combat.views.views_uber_aphrodite import UberAphroditeLobbyView
 
         await interaction.response.defer()
-        readiness_text = DummyEngine.assess_readiness(
-            self.player, target="aphrodite_uber"
+        readiness_text = await self.bot.simulator.assess_readiness(
+            self.player, "aphrodite_uber"
         )
         lobby = UberAphroditeLobbyView(
             self.bot,
@@ -325,12 +324,11 @@ class UberHubView(BaseLayoutView):
             await interaction.response.defer()
             return
         self._processing = True
-        from core.combat.dojo.dummy_engine import DummyEngine
         from core.combat.views.views_uber_lucifer import UberLuciferLobbyView
 
         await interaction.response.defer()
-        readiness_text = DummyEngine.assess_readiness(
-            self.player, target="lucifer_uber"
+        readiness_text = await self.bot.simulator.assess_readiness(
+            self.player, "lucifer_uber"
         )
         lobby = UberLuciferLobbyView(
             self.bot,
@@ -349,11 +347,12 @@ class UberHubView(BaseLayoutView):
             await interaction.response.defer()
             return
         self._processing = True
-        from core.combat.dojo.dummy_engine import DummyEngine
         from core.combat.views.views_uber_neet import UberNEETLobbyView
 
         await interaction.response.defer()
-        readiness_text = DummyEngine.assess_readiness(self.player, target="neet_uber")
+        readiness_text = await self.bot.simulator.assess_readiness(
+            self.player, "neet_uber"
+        )
         lobby = UberNEETLobbyView(
             self.bot,
             self.user_id,
@@ -371,11 +370,12 @@ class UberHubView(BaseLayoutView):
             await interaction.response.defer()
             return
         self._processing = True
-        from core.combat.dojo.dummy_engine import DummyEngine
         from core.combat.views.views_uber_gemini import UberGeminiLobbyView
 
         await interaction.response.defer()
-        readiness_text = DummyEngine.assess_readiness(self.player, target="gemini_uber")
+        readiness_text = await self.bot.simulator.assess_readiness(
+            self.player, "gemini_uber"
+        )
         lobby = UberGeminiLobbyView(
             self.bot,
             self.user_id,
@@ -393,12 +393,11 @@ class UberHubView(BaseLayoutView):
             await interaction.response.defer()
             return
         self._processing = True
-        from core.combat.dojo.dummy_engine import DummyEngine
         from core.combat.views.views_uber_evelynn import UberEvelynnLobbyView
 
         await interaction.response.defer()
-        readiness_text = DummyEngine.assess_readiness(
-            self.player, target="evelynn_uber"
+        readiness_text = await self.bot.simulator.assess_readiness(
+            self.player, "evelynn_uber"
         )
         lobby = UberEvelynnLobbyView(
             self.bot,
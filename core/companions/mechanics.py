@@ -26,7 +26,8 @@ class CompanionMechanics:
 
     @staticmethod
     def calculate_feed_xp(item: Any) -> int:
-        """Determines XP value of an item based on its stats/type."""
+        """Determines XP value of an item based on its stats/type.
+        EquipmentRepository._FEED_XP_SQL mirrors this for bulk discards."""
         xp = 10  # Base for generic junk
 
         # Scale based on item level
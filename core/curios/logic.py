@@ -1,8 +1,8 @@
-import csv
 import random
 from collections import defaultdict
 from typing import Any, Dict
 
+from core.assets import registry as assets
 from core.combat.economy.drops import roll_essence_drop
 
 
@@ -45,8 +45,9 @@ class CurioManager:
         for r in results:
             summary[r] += 1
 
+        ledger = bot.database.reward_ledger(user_id, server_id)
+
         # --- Gold ---
-        gold_total = 0
         for label, mult in (
             ("50k Gold", 50_000),
             ("100k Gold", 100_000),
@@ -54,9 +55,7 @@ class CurioManager:
             ("500k Gold", 500_000),
         ):
             if label in summary:
-                gold_total += mult * summary[label]
-        if gold_total:
-            await bot.database.users.modify_gold(user_id, gold_total)
+                ledger.gold(mult * summary[label])
 
         # --- Boss Key (1x random per drop) ---
         if "Boss Key" in summary:
@@ -67,11 +66,8 @@ class CurioManager:
                 "void_frags",
                 "balance_fragment",
             ]
-            key_counts = defaultdict(int)
             for _ in range(summary["Boss Key"]):
-                key_counts[random.choice(key_options)] += 1
-            for col, cnt in key_counts.items():
-                await bot.database.users.modify_currency(user_id, col, cnt)
+                ledger.currency(random.choice(key_options), 1)
 
         # --- Runes (1x per drop, aggregated) ---
         rune_map = {
@@ -82,63 +78,38 @@ class CurioManager:
         }
         for label, col in rune_map.items():
             if label in summary:
-                await bot.database.users.modify_currency(user_id, col, summary[label])
+                ledger.currency(col, summary[label])
 
         # --- Essence (1x random per drop) ---
-        if "Essence" in summary:
-            essence_counts = defaultdict(int)
-            for _ in range(summary["Essence"]):
-                essence_counts[roll_essence_drop()] += 1
-            for etype, cnt in essence_counts.items():
-                for _ in range(cnt):
-                    await bot.database.essences.add(user_id, etype)
+        for _ in range(summary.get("Essence", 0)):
+            ledger.essence(roll_essence_drop())
 
         # --- Guild Ticket (1x per drop) ---
         if "Guild Ticket" in summary:
-            await bot.database.partners.add_tickets(user_id, summary["Guild Ticket"])
+            ledger.tickets(summary["Guild Ticket"])
 
         # --- Settler Material (1x random sub-type per drop) ---
         if "Settler Material" in summary:
             mat_keys = ["magma_core", "life_root", "spirit_shard"]
-            mat_counts = defaultdict(int)
             for _ in range(summary["Settler Material"]):
-                mat_counts[random.choice(mat_keys)] += 1
-            for col, cnt in mat_counts.items():
-                await bot.database.settlement_materials.modify(user_id, col, cnt)
+                ledger.material(random.choice(mat_keys), 1)
 
         # --- Pinnacle Key (1x per drop) ---
         if "Pinnacle Key" in summary:
-            await bot.database.users.modify_currency(
-                user_id, "pinnacle_key", summary["Pinnacle Key"]
-            )
+            ledger.currency("pinnacle_key", summary["Pinnacle Key"])
 
         # --- Antique Tome (1x per drop) ---
         if "Antique Tome" in summary:
-            await bot.database.users.modify_currency(
-                user_id, "antique_tome", summary["Antique Tome"]
-            )
+            ledger.currency("antique_tome", summary["Antique Tome"])
 
         # --- Elemental Key (1x random sub-type per drop) ---
         if "Elemental Key" in summary:
-            key_counts = defaultdict(int)
             key_options = ["blessed_bismuth", "sparkling_sprig", "capricious_carp"]
             for _ in range(summary["Elemental Key"]):
-                key_counts[random.choice(key_options)] += 1
-            for col, cnt in key_counts.items():
-                if col == "blessed_bismuth":
-                    await bot.database.skills.increment_blessed_bismuth(
-                        user_id, server_id, cnt
-                    )
-                elif col == "sparkling_sprig":
-                    await bot.database.skills.increment_sparkling_sprig(
-                        user_id, server_id, cnt
-                    )
-                elif col == "capricious_carp":
-                    await bot.database.skills.increment_capricious_carp(
-                        user_id, server_id, cnt
-                    )
-
-        await bot.database.users.modify_currency(user_id, "curios", -amount)
+                ledger.mastery(random.choice(key_options), 1)
+
+        ledger.currency("curios", -amount)
+        await ledger.flush()
 
         return {"summary": dict(summary)}
 
@@ -146,11 +117,6 @@ class CurioManager:
     def get_image_url(reward_name: str) -> str:
         key = reward_name.replace(" Gold", "").replace(" ", "_")
         try:
-            with open("assets/curios.csv", mode="r") as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row["Item"] == key:
-                        return row["URL"]
+            return assets.curio_url(key)
         except Exception:
-            pass
-        return None
+            return None
@@ -0,0 +1,168 @@
+"""
+core/edit_scheduler.py
+Paces and coalesces message edits from live views.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class _Slot:
+    """Per-message state: the newest unsent payload and who is waiting on it."""
+
+    __slots__ = ("payload", "future", "last_sent", "worker")
+
+    def __init__(self) -> None:
+        self.payload: dict | None = None
+        self.future: asyncio.Future | None = None
+        self.last_sent = float("-inf")
+        self.worker: asyncio.Task | None = None
+
+
+class EditScheduler:
+    """Shared per-bot scheduler for ``message.edit`` calls.
+
+    Live views (auto-battle, Maw, Codex runs, Ascent) edit their message on
+    every state change. Under load that runs into Discord's per-channel edit
+    limits and queues 429 retries. Sending every edit through ``edit()``
+    changes two things:
+
+    - Each message has at most one edit waiting. An edit that arrives while
+      an earlier one is still waiting for its turn replaces it, so only the
+      latest layout is sent. The superseded caller's ``edit()`` returns
+      False; it is counted under ``superseded``.
+    - Consecutive edits of one message are at least ``message_interval``
+      seconds apart, and edits anywhere in one channel at least
+      ``channel_interval`` seconds apart.
+
+    Errors from the edit itself (NotFound, HTTPException, ...) are raised
+    to the caller whose payload was sent, exactly as a direct
+    ``message.edit`` would raise them. With ``wait=False`` the caller does
+    not wait and failures are only counted (``failed`` in ``stats()``).
+
+    The scheduler only needs ``message.id``, ``message.channel.id`` and an
+    awaitable ``message.edit(**kwargs)``.
+    """
+
+    def __init__(
+        self,
+        message_interval: float = 0.5,
+        channel_interval: float = 0.2,
+    ):
+        self.message_interval = message_interval
+        self.channel_interval = channel_interval
+        self._slots: dict[int, _Slot] = {}
+        self._channel_last: dict[int, float] = {}
+        self.requested = 0
+        self.sent = 0
+        self.superseded = 0
+        self.failed = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def edit(self, message, *, wait: bool = True, **kwargs) -> bool:
+        """Queues ``message.edit(**kwargs)``.
+
+        Returns True once this payload has been sent, or False if a newer
+        edit of the same message replaced it first, the scheduler stopped
+        before sending it, or with ``wait=False``.
+        """
+        self.requested += 1
+        slot = self._slots.get(message.id)
+        if slot is None:
+            slot = self._slots[message.id] = _Slot()
+
+        if slot.future is not None:
+            # Still waiting for its turn: the newer layout wins.
+            self.superseded += 1
+            if not slot.future.done():
+                slot.future.set_result(False)
+        slot.payload = kwargs
+        slot.future = future = asyncio.get_running_loop().create_future()
+
+        if slot.worker is None or slot.worker.done():
+            slot.worker = asyncio.create_task(self._drain(message, slot))
+
+        if not wait:
+            return False
+        return await future
+
+    def stats(self) -> dict:
+        return {
+            "requested": self.requested,
+            "sent": self.sent,
+            "superseded": self.superseded,
+            "failed": self.failed,
+            "pending": sum(1 for s in self._slots.values() if s.future is not None),
+            "message_interval": self.message_interval,
+            "channel_interval": self.channel_interval,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _delay(self, slot: _Slot, channel_id) -> float:
+        now = time.monotonic()
+        return max(
+            0.0,
+            slot.last_sent + self.message_interval - now,
+            self._channel_last.get(channel_id, float("-inf"))
+            + self.channel_interval
+            - now,
+        )
+
+    async def _drain(self, message, slot: _Slot) -> None:
+        channel_id = getattr(getattr(message, "channel", None), "id", None)
+        future = None
+        try:
+            while True:
+                # Re-checked after every sleep: another message in the same
+                # channel may have taken the channel slot meanwhile. After a
+                # send this also holds the slot for one message_interval, so
+                # the next edit still sees last_sent.
+                delay = self._delay(slot, channel_id)
+                while delay > 0:
+                    await asyncio.sleep(delay)
+                    delay = self._delay(slot, channel_id)
+                if slot.future is None:
+                    break
+
+                payload, future = slot.payload, slot.future
+                slot.payload = slot.future = None
+                now = time.monotonic()
+                slot.last_sent = now
+                self._channel_last[channel_id] = now
+                try:
+                    await message.edit(**payload)
+                except Exception as e:
+                    self.failed += 1
+                    # The caller may have been cancelled while the edit was
+                    # in flight; its future is already done then.
+                    if not future.done():
+                        future.set_exception(e)
+                        # Marks it retrieved so wait=False edits don't log
+                        # "exception was never retrieved"; awaiting callers
+                        # still get it raised.
+                        future.exception()
+                else:
+                    self.sent += 1
+                    if not future.done():
+                        future.set_result(True)
+        finally:
+            # Only reached with an edit unresolved if this worker was
+            # cancelled or died: release its callers instead of leaving them
+            # waiting on a slot nothing drains.
+            for waiting in (future, slot.future):
+                if waiting is not None and not waiting.done():
+                    waiting.set_result(False)
+            slot.payload = slot.future = None
+            if self._slots.get(message.id) is slot:
+                del self._slots[message.id]
+            last = self._channel_last.get(channel_id)
+            if last is not None and time.monotonic() - last >= self.channel_interval:
+                del self._channel_last[channel_id]
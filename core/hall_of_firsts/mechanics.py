@@ -2,11 +2,15 @@
 
 try_claim_first is the single entry point every trigger site calls through
 (see core/hall_of_firsts/triggers.py). It is safe to call speculatively —
-callers do not need to check "is this already claimed" themselves.
+callers do not need to check "is this already claimed" themselves. Categories
+already claimed return immediately without touching the database, and
+announcements go out from a background queue so a slow channel send never
+holds up the gameplay action that won the claim.
 """
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 
 import discord
@@ -20,6 +24,8 @@ async def try_claim_first(bot, user_id: str, category_key: str) -> bool:
     """Attempts to claim `category_key` for `user_id`. Returns True if this call
     won the claim. Never raises — a failure here must not interrupt the
     gameplay action that triggered it."""
+    if bot.database.hall_of_firsts.is_claimed(category_key):
+        return False
     try:
         category = CATEGORIES_BY_KEY[category_key]
         user_row = await bot.database.users.get_by_user_id(user_id)
@@ -47,7 +53,7 @@ async def try_claim_first(bot, user_id: str, category_key: str) -> bool:
             appearance,
         )
         if won:
-            await _announce(bot, category, name, title, emblem, appearance)
+            _announce(bot, category, name, title, emblem, appearance)
         return won
     except Exception:
         try:
@@ -60,7 +66,12 @@ async def try_claim_first(bot, user_id: str, category_key: str) -> bool:
         return False
 
 
-async def _announce(
+# Announcement embeds waiting to be sent, drained by one background task.
+_announce_queue: asyncio.Queue | None = None
+_announce_worker: asyncio.Task | None = None
+
+
+def _announce(
     bot,
     category,
     name: str,
@@ -68,9 +79,9 @@ async def _announce(
     emblem: str | None,
     appearance: str | None,
 ) -> None:
-    channel = bot.get_channel(HALL_ANNOUNCE_CHANNEL_ID)
-    if channel is None:
-        return
+    """Builds the announcement now (from the claim-time snapshot) and queues
+    it for the background sender."""
+    global _announce_queue, _announce_worker
     decorated = format_prestige_name(name, title or "", emblem or "")
     embed = discord.Embed(
         title=f"{category.emoji} A New Hall of Firsts Entry!",
@@ -79,7 +90,27 @@ async def _announce(
     )
     if appearance:
         embed.set_thumbnail(url=appearance)
-    try:
-        await channel.send(embed=embed)
-    except (discord.Forbidden, discord.HTTPException):
-        pass
+
+    if _announce_queue is None:
+        _announce_queue = asyncio.Queue()
+    _announce_queue.put_nowait((bot, embed))
+    if _announce_worker is None or _announce_worker.done():
+        _announce_worker = asyncio.create_task(_drain_announcements(_announce_queue))
+
+
+async def _drain_announcements(queue: asyncio.Queue) -> None:
+    while True:
+        bot, embed = await queue.get()
+        try:
+            channel = bot.get_channel(HALL_ANNOUNCE_CHANNEL_ID)
+            if channel is not None:
+                await channel.send(embed=embed)
+        except (discord.Forbidden, discord.HTTPException):
+            pass
+        except Exception:
+            try:
+                bot.logger.error("hall_of_firsts announcement failed", exc_info=True)
+            except Exception:
+                pass  # Logging must never raise
+        finally:
+            queue.task_done()
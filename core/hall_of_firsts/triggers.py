@@ -95,6 +95,8 @@ async def check_cult_leader(bot, user_id: str, follower_count: int) -> None:
 async def check_one_with_nature(bot, user_id: str, server_id: str) -> None:
     """Fetches all 3 gathering tool rows and checks whether every tool is
     currently at its skill's top tier simultaneously."""
+    if bot.database.hall_of_firsts.is_claimed("one_with_nature"):
+        return
     for skill in ("mining", "fishing", "woodcutting"):
         row = await bot.database.skills.get_data(user_id, server_id, skill)
         if not row:
@@ -0,0 +1,233 @@
+"""
+core/image_probe.py
+Checks remote images from their first few KB instead of downloading them.
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+
+import aiohttp
+
+_PNG_SIG = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers (every SOFn except DHT/JPG/DAC).
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+class ImageHeader:
+    __slots__ = ("format", "width", "height", "animated")
+
+    def __init__(self, fmt: str, width: int, height: int, animated: bool = False):
+        self.format = fmt
+        self.width = width
+        self.height = height
+        self.animated = animated
+
+
+def probe(head: bytes) -> ImageHeader | None:
+    """Parses the format and dimensions out of the start of an image file.
+
+    Returns None when ``head`` is too short to tell yet. Raises ValueError
+    for anything that is not a PNG, JPEG, WebP or GIF. GIFs are reported
+    with zero dimensions; callers reject them on format alone.
+    """
+    if len(head) < 12:
+        return None
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return ImageHeader("GIF", 0, 0, True)
+    if head.startswith(_PNG_SIG):
+        return _probe_png(head)
+    if head[:2] == b"\xff\xd8":
+        return _probe_jpeg(head)
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return _probe_webp(head)
+    raise ValueError("unsupported image format")
+
+
+def _probe_png(head: bytes) -> ImageHeader | None:
+    if len(head) < 24:
+        return None
+    if head[12:16] != b"IHDR":
+        raise ValueError("PNG without an IHDR chunk")
+    width, height = struct.unpack(">II", head[16:24])
+    # APNG declares its animation (acTL) before the first image data.
+    pos = 8
+    while pos + 8 <= len(head):
+        length, kind = struct.unpack(">I4s", head[pos : pos + 8])
+        if kind == b"acTL":
+            return ImageHeader("PNG", width, height, True)
+        if kind == b"IDAT":
+            return ImageHeader("PNG", width, height)
+        pos += 12 + length
+    return None
+
+
+def _probe_jpeg(head: bytes) -> ImageHeader | None:
+    pos = 2
+    while True:
+        # Markers may be padded with any number of 0xFF fill bytes.
+        while pos < len(head) and head[pos] == 0xFF:
+            pos += 1
+        if pos >= len(head):
+            return None
+        marker = head[pos]
+        pos += 1
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            continue  # standalone, no length
+        if marker in (0xD9, 0xDA):
+            raise ValueError("JPEG image data before any frame header")
+        if pos + 2 > len(head):
+            return None
+        (length,) = struct.unpack(">H", head[pos : pos + 2])
+        if marker in _JPEG_SOF:
+            if pos + 7 > len(head):
+                return None
+            height, width = struct.unpack(">HH", head[pos + 3 : pos + 7])
+            return ImageHeader("JPEG", width, height)
+        pos += length
+
+
+def _probe_webp(head: bytes) -> ImageHeader | None:
+    if len(head) < 30:
+        return None
+    kind = head[12:16]
+    if kind == b"VP8 ":
+        if head[23:26] != b"\x9d\x01\x2a":
+            raise ValueError("malformed VP8 frame header")
+        width, height = struct.unpack("<HH", head[26:30])
+        return ImageHeader("WEBP", width & 0x3FFF, height & 0x3FFF)
+    if kind == b"VP8L":
+        if head[20] != 0x2F:
+            raise ValueError("malformed VP8L header")
+        (bits,) = struct.unpack("<I", head[21:25])
+        return ImageHeader("WEBP", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if kind == b"VP8X":
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return ImageHeader("WEBP", width, height, bool(head[20] & 0x02))
+    raise ValueError(f"unknown WebP chunk {kind!r}")
+
+
+class AvatarValidator:
+    """Validates custom avatar URLs: a static PNG/JPEG/WebP, square, at most
+    ``max_side`` pixels a side.
+
+    Only the start of the file is streamed, ``chunk_size`` bytes at a time,
+    until probe() can read the dimensions; the response is dropped as soon
+    as there is a verdict. A bad Content-Type or a declared Content-Length
+    over ``max_bytes`` is rejected before any body is read. Verdicts about
+    the image itself are remembered for ``ttl`` seconds, so resubmitting the
+    same URL does not fetch it again; fetch errors are not cached.
+
+    One aiohttp session is shared by every check (created on first use,
+    closed by close()).
+    """
+
+    GIF_ERROR = "GIFs aren't allowed for custom avatars — use a static image."
+
+    def __init__(
+        self,
+        *,
+        max_side: int = 600,
+        max_bytes: int = 4 * 1024 * 1024,
+        probe_limit: int = 256 * 1024,
+        chunk_size: int = 4096,
+        timeout: float = 8.0,
+        ttl: float = 300.0,
+        max_entries: int = 256,
+    ):
+        self.max_side = max_side
+        self.max_bytes = max_bytes
+        # JPEG EXIF/ICC segments can push the frame header past the first
+        # few KB; give up once this much has been read without one.
+        self.probe_limit = probe_limit
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._session: aiohttp.ClientSession | None = None
+        self._verdicts: dict[str, tuple[float, tuple[bool, str]]] = {}
+        self.fetches = 0
+        self.cache_hits = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"User-Agent": "Idleology/1.0"},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def validate(self, url: str) -> tuple[bool, str]:
+        """Returns (is_valid, error_message)."""
+        now = time.monotonic()
+        cached = self._verdicts.get(url)
+        if cached is not None:
+            if cached[0] > now:
+                self.cache_hits += 1
+                return cached[1]
+            del self._verdicts[url]
+
+        self.fetches += 1
+        try:
+            header, verdict = await self._fetch(url)
+        except Exception as exc:
+            return False, f"Could not fetch the URL: {exc}"
+        if verdict is None:
+            verdict = self._judge(header)
+
+        self._verdicts[url] = (now + self.ttl, verdict)
+        while len(self._verdicts) > self.max_entries:
+            del self._verdicts[next(iter(self._verdicts))]
+        return verdict
+
+    async def _fetch(self, url: str) -> tuple[ImageHeader | None, tuple | None]:
+        """Streams just enough of ``url`` to probe it. Returns the header, or
+        a verdict when the response was rejected before one could be read."""
+        async with self._get_session().get(url) as resp:
+            resp.raise_for_status()
+            ct = resp.headers.get("Content-Type", "")
+            if not ct.startswith("image/"):
+                return None, (
+                    False,
+                    "URL must point to a direct image file (jpg, png, webp).",
+                )
+            if ct == "image/gif":
+                return None, (False, self.GIF_ERROR)
+            if resp.content_length is not None and resp.content_length > self.max_bytes:
+                return None, (
+                    False,
+                    f"Image must be {self.max_bytes // (1024 * 1024)} MB or smaller.",
+                )
+
+            head = b""
+            try:
+                async for chunk in resp.content.iter_chunked(self.chunk_size):
+                    head += chunk
+                    header = probe(head)
+                    if header is not None:
+                        return header, None
+                    if len(head) >= self.probe_limit:
+                        break
+            except ValueError as exc:
+                return None, (False, f"Could not read image dimensions: {exc}")
+            return None, (False, "Could not read image dimensions: truncated header")
+
+    def _judge(self, header: ImageHeader) -> tuple[bool, str]:
+        # Content-Type can lie (or be missing/generic) — confirm via the
+        # parsed format too, and reject multi-frame images either way.
+        if header.format == "GIF" or header.animated:
+            return False, self.GIF_ERROR
+        w, h = header.width, header.height
+        if w != h:
+            return False, f"Image must be square (1:1 ratio). Got {w}×{h}."
+        if w > self.max_side:
+            side = self.max_side
+            return False, f"Image must be {side}×{side} or smaller. Got {w}×{h}."
+        return True, ""
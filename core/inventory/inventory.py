@@ -619,15 +619,16 @@ class InventoryUI:
     @staticmethod
     def get_gear_embed(
         player_name: str,
-        all_items: dict,
+        equipped_items: dict,
+        counts: dict,
         active_slot: str,
-        equipped_ids: dict,
         current_page: int,
         total_pages: int,
     ) -> discord.Embed:
         """
         Main embed for the unified GearView.
         Shows the currently equipped item's stats and a one-line overview of all slots.
+        equipped_items maps slot -> equipped model (or None); counts maps slot -> owned.
         """
         slot_emoji = _SLOT_EMOJIS.get(active_slot, "🎒")
         slot_label = _SLOT_LABELS.get(active_slot, active_slot.title())
@@ -643,13 +644,7 @@ class InventoryUI:
         # item's own art — there's no single generic "artefact slot" asset.
 
         # --- Equipped item panel ---
-        equipped_id = equipped_ids.get(active_slot)
-        equipped_item = None
-        if equipped_id:
-            for item in all_items.get(active_slot, []):
-                if item.item_id == equipped_id:
-                    equipped_item = item
-                    break
+        equipped_item = equipped_items.get(active_slot)
 
         if equipped_item:
             if isinstance(equipped_item, Artefact):
@@ -675,18 +670,15 @@ class InventoryUI:
         for slot in _GEAR_OVERVIEW_SLOT_ORDER:
             emoji = _SLOT_EMOJIS[slot]
             label = _SLOT_LABELS[slot]
-            count = len(all_items.get(slot, []))
-            eid = equipped_ids.get(slot)
+            count = counts.get(slot, 0)
+            item = equipped_items.get(slot)
             e_name = "None"
-            if eid:
-                for item in all_items.get(slot, []):
-                    if item.item_id == eid:
-                        e_name = (
-                            item.name
-                            if isinstance(item, Artefact)
-                            else f"{item.name} (Lv.{item.level})"
-                        )
-                        break
+            if item is not None:
+                e_name = (
+                    item.name
+                    if isinstance(item, Artefact)
+                    else f"{item.name} (Lv.{item.level})"
+                )
             line = f"{emoji} **{label}** — {e_name} [{count} owned]"
             if slot == active_slot:
                 line = f"**→ {line}**"
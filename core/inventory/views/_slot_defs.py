@@ -8,10 +8,9 @@ from core.emojis import (
     WEAPON_SLOT,
 )
 
-# The 6 normal equipment-repo-backed slots. Loadouts and the bulk
-# _fetch_all_slots() equipment fetch iterate this — do NOT add "artefact"
-# here, it lives in a separate repo (bot.database.rite) with different
-# server-scoping and no loadout support. GearView's tabs use
+# The 6 normal equipment-repo-backed slots. Loadouts iterate this — do NOT
+# add "artefact" here, it lives in a separate repo (bot.database.rite) with
+# different server-scoping and no loadout support. GearView's tabs use
 # GEAR_SLOT_ORDER below instead.
 SLOT_ORDER = ["weapon", "armor", "helmet", "glove", "boot", "accessory"]
 
@@ -16,7 +16,7 @@ from core.items.factory import (
     create_weapon,
 )
 from core.models import Accessory, Armor, Boot, Glove, Helmet, Weapon
-from core.rite.models import Artefact
+from core.rite.models import Artefact, artefact_list_from_db
 from core.util import stars
 
 from .artefact_detail_view import ArtefactDetailView
@@ -30,6 +30,8 @@ from ._slot_defs import (
     SLOT_ORDER,
 )
 
+PAGE_SIZE = 25
+
 _FACTORIES = {
     "weapon": create_weapon,
     "armor": create_armor,
@@ -55,6 +57,14 @@ class GearView(BaseView):
     Unified gear management view. Shows all six equipment slots via tab buttons
     and uses a Select menu (up to 25 items per page) instead of number buttons.
 
+    Only the page on screen is loaded: ``all_items[slot]`` holds the active
+    slot's current page (EquipmentRepository.get_page, keyset-paginated, list
+    columns only), and per-slot counts and equipped items come from
+    get_inventory_summary. The full row is fetched when an item is selected.
+    Artefacts are few and live in another repository, so that slot is still
+    loaded whole and paged in memory. get_current_embed() re-reads the page,
+    so views returning here after a discard or upgrade see the change.
+
     Exposes the same interface as InventoryListView so that ItemDetailView,
     MassDiscardModal, and all upgrade views work without modification:
       .equipped_id          (property — per active slot)
@@ -71,7 +81,6 @@ class GearView(BaseView):
         bot,
         user_id: str,
         server_id: str,
-        all_items: dict,
         initial_slot: str = "weapon",
         player_name: str = "",
     ):
@@ -79,19 +88,41 @@ class GearView(BaseView):
         self.bot = bot
         self.user_id = user_id
         self.server_id = server_id
-        self.all_items = all_items  # dict[slot -> List[item model]]
+        # dict[slot -> List[item model]]: the current page of the active slot
+        # (the whole list for artefacts). Other slots are loaded on switch.
+        self.all_items: dict = {slot: [] for slot in GEAR_SLOT_ORDER}
+        self.counts: dict = {slot: 0 for slot in GEAR_SLOT_ORDER}
+        self.equipped_items: dict = {slot: None for slot in GEAR_SLOT_ORDER}
         self.active_slot = initial_slot
         self.player_name = player_name
         self.current_page = 0
+        # _page_keys[n] is the keyset cursor page n starts after.
+        self._page_keys: list = [None]
         self._processing = False
 
         # Per-slot equipped IDs — source of truth; updated by ItemDetailView.toggle_equip
         # (and ArtefactDetailView.toggle_equip for the "artefact" slot).
-        self.equipped_ids: dict = {
-            slot: self._scan_equipped_id(slot) for slot in GEAR_SLOT_ORDER
-        }
+        self.equipped_ids: dict = {slot: None for slot in GEAR_SLOT_ORDER}
 
-        self.update_components()
+    @classmethod
+    async def create(
+        cls,
+        bot,
+        user_id: str,
+        server_id: str,
+        *,
+        initial_slot: str = "weapon",
+        player_name: str = "",
+    ) -> "GearView":
+        view = cls(
+            bot,
+            user_id,
+            server_id,
+            initial_slot=initial_slot,
+            player_name=player_name,
+        )
+        await view.refresh()
+        return view
 
     # ------------------------------------------------------------------
     # Adapter interface for ItemDetailView / MassDiscardModal compatibility
@@ -115,7 +146,7 @@ class GearView(BaseView):
 
     @property
     def items_per_page(self):
-        return 25
+        return PAGE_SIZE
 
     @property
     def total_pages(self):
@@ -130,7 +161,8 @@ class GearView(BaseView):
         self.update_components()
 
     async def get_current_embed(self) -> discord.Embed:
-        """Alias used by ItemDetailView.go_back."""
+        """Alias used by ItemDetailView.go_back. Re-reads the page first."""
+        await self.refresh()
         return self.build_embed()
 
     def _get_db_type(self) -> str:
@@ -141,15 +173,57 @@ class GearView(BaseView):
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _scan_equipped_id(self, slot: str):
-        for item in self.all_items.get(slot, []):
-            if getattr(item, "is_equipped", False):
-                return item.item_id
-        return None
+    async def refresh(self):
+        """Reloads the slot counts, equipped items and the current page, then
+        rebuilds the components."""
+        equipment = self.bot.database.equipment
+        summary = await equipment.get_inventory_summary(self.user_id)
+        for slot, (count, row) in summary.items():
+            self.counts[slot] = count
+            self.equipped_items[slot] = SLOT_CONFIG[slot]["factory"](row)
+            self.equipped_ids[slot] = row["item_id"] if row else None
+
+        artefacts = artefact_list_from_db(
+            await self.bot.database.rite.get_artefact_inventory(
+                self.user_id, self.server_id
+            )
+        )
+        self.all_items["artefact"] = artefacts
+        self.counts["artefact"] = len(artefacts)
+        equipped = next((a for a in artefacts if a.is_equipped), None)
+        self.equipped_items["artefact"] = equipped
+        self.equipped_ids["artefact"] = equipped.item_id if equipped else None
+
+        await self._load_page()
+        self.update_components()
+
+    async def _load_page(self):
+        slot = self.active_slot
+        if slot == "artefact":
+            return
+        del self._page_keys[self.current_page + 1 :]
+        # Step back past pages emptied by discards.
+        while True:
+            rows = await self.bot.database.equipment.get_page(
+                self.user_id,
+                slot,
+                after=self._page_keys[self.current_page],
+                limit=PAGE_SIZE,
+            )
+            if rows or self.current_page == 0:
+                break
+            self.current_page -= 1
+            del self._page_keys[self.current_page + 1 :]
+        factory = SLOT_CONFIG[slot]["factory"]
+        self.all_items[slot] = [factory(row) for row in rows]
+
+    def _reset_pages(self):
+        self.current_page = 0
+        self._page_keys = [None]
 
     def _get_total_pages(self) -> int:
-        count = len(self.all_items.get(self.active_slot, []))
-        return max(1, (count + 24) // 25)
+        count = self.counts.get(self.active_slot, 0)
+        return max(1, (count + PAGE_SIZE - 1) // PAGE_SIZE)
 
     def _find_item_by_id(self, item_id: int):
         for item in self.all_items.get(self.active_slot, []):
@@ -285,12 +359,13 @@ class GearView(BaseView):
         slot_items = self.all_items.get(self.active_slot, [])
         total_pages = self._get_total_pages()
 
-        # Clamp page
-        if self.current_page >= total_pages:
-            self.current_page = max(0, total_pages - 1)
-
-        start = self.current_page * 25
-        page_items = slot_items[start : start + 25]
+        if self.active_slot == "artefact":
+            if self.current_page >= total_pages:
+                self.current_page = max(0, total_pages - 1)
+            start = self.current_page * PAGE_SIZE
+            page_items = slot_items[start : start + PAGE_SIZE]
+        else:
+            page_items = slot_items  # already just this page
 
         # Row 0 — Select menu or empty placeholder
         if page_items:
@@ -356,7 +431,10 @@ class GearView(BaseView):
             label="Mass Discard",
             style=ButtonStyle.danger,
             emoji="🗑️",
-            disabled=(len(slot_items) == 0 or self.active_slot == "artefact"),
+            disabled=(
+                self.counts.get(self.active_slot, 0) == 0
+                or self.active_slot == "artefact"
+            ),
             row=4,
         )
         mass.callback = self.mass_discard_callback
@@ -377,9 +455,9 @@ class GearView(BaseView):
     def build_embed(self) -> discord.Embed:
         return InventoryUI.get_gear_embed(
             self.player_name,
-            self.all_items,
+            self.equipped_items,
+            self.counts,
             self.active_slot,
-            self.equipped_ids,
             self.current_page,
             self._get_total_pages(),
         )
@@ -393,7 +471,8 @@ class GearView(BaseView):
 
     async def switch_slot(self, interaction: Interaction, slot_key: str):
         self.active_slot = slot_key
-        self.current_page = 0
+        self._reset_pages()
+        await self._load_page()
         self.update_components()
         await interaction.response.edit_message(embed=self.build_embed(), view=self)
         self.message = await interaction.original_response()
@@ -401,6 +480,12 @@ class GearView(BaseView):
     async def _handle_select(self, interaction: Interaction, select: discord.ui.Select):
         item_id = int(select.values[0])
         item = self._find_item_by_id(item_id)
+        if item is not None and not isinstance(item, Artefact):
+            # The page holds list columns only; the detail view needs them all.
+            row = await self.bot.database.equipment.get_by_id(
+                item_id, self.active_slot
+            )
+            item = SLOT_CONFIG[self.active_slot]["factory"](row)
         if item is None:
             return await interaction.response.send_message(
                 "Item not found.", ephemeral=True
@@ -428,12 +513,23 @@ class GearView(BaseView):
 
     async def prev_page(self, interaction: Interaction):
         self.current_page = max(0, self.current_page - 1)
+        if self.active_slot != "artefact":
+            await self._load_page()
         self.update_components()
         await interaction.response.edit_message(embed=self.build_embed(), view=self)
         self.message = await interaction.original_response()
 
     async def next_page(self, interaction: Interaction):
-        self.current_page = min(self._get_total_pages() - 1, self.current_page + 1)
+        if self.active_slot == "artefact":
+            self.current_page = min(
+                self._get_total_pages() - 1, self.current_page + 1
+            )
+        elif self.all_items[self.active_slot]:
+            last = self.all_items[self.active_slot][-1]
+            del self._page_keys[self.current_page + 1 :]
+            self._page_keys.append((int(last.is_equipped), last.level, last.item_id))
+            self.current_page += 1
+            await self._load_page()
         self.update_components()
         await interaction.response.edit_message(embed=self.build_embed(), view=self)
         self.message = await interaction.original_response()
@@ -398,8 +398,9 @@ class LoadoutView(BaseView):
     async def _go_back_callback(self, interaction: Interaction):
         if self.parent_view is not None and hasattr(self.parent_view, "_processing"):
             self.parent_view._processing = False
+        # A loadout may have changed what is equipped; re-read the gear page.
         await interaction.response.edit_message(
-            embed=self.parent_view.build_embed(),
+            embed=await self.parent_view.get_current_embed(),
             view=self.parent_view,
         )
         self.message = await interaction.original_response()
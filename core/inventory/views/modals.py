@@ -3,10 +3,7 @@ import asyncio
 import discord
 from discord import Interaction
 
-from core.companions.mechanics import CompanionMechanics
 from core.emojis import RUNE_REFINEMENT
-from core.items.equipment_mechanics import EquipmentMechanics
-from core.models import Weapon
 
 
 class MassDiscardModal(discord.ui.Modal, title="Mass Discard"):
@@ -29,53 +26,47 @@ class MassDiscardModal(discord.ui.Modal, title="Mass Discard"):
                 "Please enter a valid number.", ephemeral=True
             )
 
-        # Filter logic: Must not be equipped, must be <= requested level
-        items_to_delete = [
-            item
-            for item in self.parent_view.items
-            if not getattr(item, "is_equipped", False) and item.level <= level_limit
-        ]
-
-        if not items_to_delete:
-            return await interaction.response.send_message(
-                f"No unequipped items found at or below level {level_limit}.",
-                ephemeral=True,
-            )
-
+        # Acknowledge before touching the DB: under write contention the
+        # discard could outlast Discord's 3-second interaction deadline.
         await interaction.response.defer()
 
         itype = self.parent_view._get_db_type()
-        total_xp_val = 0
-        total_runes_back = 0
+        database = self.parent_view.bot.database
 
-        # Execute DB Deletions
-        for item in items_to_delete:
-            total_xp_val += CompanionMechanics.calculate_feed_xp(item)
-            if isinstance(item, Weapon):
-                total_runes_back += EquipmentMechanics.calculate_refine_refund(item)
-            await self.parent_view.bot.database.equipment.discard(item.item_id, itype)
+        # The view may only hold one page, so filter in SQL: unequipped and at
+        # or below the level. One DELETE returns the XP / rune refunds too.
+        async with database.transaction():
+            result = await database.equipment.discard_where(
+                self.parent_view.user_id, itype, max_level=level_limit
+            )
+            total_xp_val = result["feed_xp"]
+            total_runes_back = result["refinement_runes"]
+            ledger = database.reward_ledger(self.parent_view.user_id)
+            # Pool XP for manual distribution via Companions view
+            ledger.currency("companion_pet_xp", total_xp_val)
+            # Weapon refinement rune refund (mirrors single-item discard)
+            ledger.currency("refinement_runes", total_runes_back)
+            await ledger.flush()
+
+        if not result["item_ids"]:
+            return await interaction.followup.send(
+                f"No unequipped items found at or below level {level_limit}.",
+                ephemeral=True,
+            )
 
-        # Pool XP for manual distribution via Companions view
         xp_msg = ""
         if total_xp_val > 0:
-            await self.parent_view.bot.database.users.modify_currency(
-                self.parent_view.user_id, "companion_pet_xp", total_xp_val
-            )
             xp_msg = f"\n🐾 **+{total_xp_val:,} XP** added to your Companion XP pool."
 
-        # Weapon refinement rune refund (mirrors single-item discard)
         rune_msg = ""
         if total_runes_back > 0:
-            await self.parent_view.bot.database.users.modify_currency(
-                self.parent_view.user_id, "refinement_runes", total_runes_back
-            )
             rune_msg = (
                 f"\n{RUNE_REFINEMENT} Recovered **{total_runes_back}** "
                 "Refinement Rune(s)."
             )
 
         # Update List State
-        deleted_ids = {i.item_id for i in items_to_delete}
+        deleted_ids = set(result["item_ids"])
         self.parent_view.items = [
             i for i in self.parent_view.items if i.item_id not in deleted_ids
         ]
@@ -96,7 +87,7 @@ class MassDiscardModal(discord.ui.Modal, title="Mass Discard"):
             title="Mass Discard Complete", color=discord.Color.red()
         )
         temp_embed.description = (
-            f"🗑️ Dismantled **{len(items_to_delete)}** items "
+            f"🗑️ Dismantled **{len(deleted_ids)}** items "
             f"(Level <= {level_limit}).{xp_msg}{rune_msg}"
         )
 
@@ -305,6 +305,7 @@ class EquipmentMechanics:
         """
         Refinement rune refund granted when a weapon is discarded.
         Applies only at higher refinement levels; returns 0 otherwise.
+        EquipmentRepository._RUNE_REFUND_SQL mirrors this for bulk discards.
         """
         if weapon.refinement_lvl <= 0:
             return 0
@@ -699,13 +699,10 @@ class EssenceView(BaseView):
         }
         factory = factories[self.item_type]
 
-        rows = await self.bot.database.equipment.get_all(self.user_id, self.item_type)
-        new_item = None
-        for row in rows:
-            candidate = factory(row)
-            if candidate.item_id == self.item.item_id:
-                new_item = candidate
-                break
+        row = await self.bot.database.equipment.get_by_id(
+            self.item.item_id, self.item_type
+        )
+        new_item = factory(row)
 
         if new_item is not None:
             self.item = new_item
@@ -229,8 +229,8 @@ def create_monster_part(row) -> MonsterPart:
 
 async def load_player(user_id: str, user_data: tuple, database) -> Player:
     """
-    Creates a Player object from the user tuple and asynchronously fetches
-    and attaches all equipped gear using the database connection.
+    Creates a Player object from the user tuple and attaches all equipped gear
+    and passive systems, read in bulk via database.player_snapshot.
 
     Args:
         user_id (str): The Discord User ID
@@ -269,68 +269,58 @@ async def load_player(user_id: str, user_data: tuple, database) -> Player:
 
     server_id = user_data["server_id"]
 
+    # Every lookup below comes from one bulk read (one worker-thread hop).
+    # Optional sections that failed to load are listed in snap["errors"] and
+    # fall back to the Player defaults exactly as the per-call loads did.
+    snap = await database.player_snapshot.fetch(user_id, server_id)
+    errors = snap["errors"]
+
     # Settlement buffs
-    b_tier, b_workers = await database.settlement.get_building_details(
-        user_id, server_id, "barracks"
-    )
-    a_tier, a_workers = await database.settlement.get_building_details(
-        user_id, server_id, "apothecary"
-    )
+    b_tier, b_workers = snap["barracks"]
+    a_tier, a_workers = snap["apothecary"]
 
     player.apothecary_workers = a_workers
     player.barracks_workers = b_workers
 
     # Settlement adjacency bonuses (Apothecary Annex + Shrine Garden / Sacred Ground)
-    try:
-        combat_bonuses = await database.settlement.get_combat_bonuses(
-            user_id, server_id
+    if "combat_bonuses" in errors:
+        print(
+            f"[load_player] settlement combat bonuses failed for {user_id}: {errors['combat_bonuses']}"
         )
+        # defaults to 0.0 / {} from Player dataclass
+    else:
+        combat_bonuses = snap["combat_bonuses"]
         player.apothecary_boost_pct = combat_bonuses["apothecary_boost_pct"]
         player.shrine_effectiveness = combat_bonuses["shrine_effectiveness"]
-    except Exception as e:
-        print(f"[load_player] settlement combat bonuses failed for {user_id}: {e}")
-        # defaults to 0.0 / {} from Player dataclass
-
-    # 2. Fetch and Attach Gear
-    # We await the database calls here so the resulting Player object is fully populated
-
-    wep_data = await database.equipment.get_equipped(user_id, "weapon")
-    if wep_data:
-        player.equipped_weapon = create_weapon(wep_data)
 
-    acc_data = await database.equipment.get_equipped(user_id, "accessory")
-    if acc_data:
-        player.equipped_accessory = create_accessory(acc_data)
-
-    armor_data = await database.equipment.get_equipped(user_id, "armor")
-    if armor_data:
-        player.equipped_armor = create_armor(armor_data)
-
-    glove_data = await database.equipment.get_equipped(user_id, "glove")
-    if glove_data:
-        player.equipped_glove = create_glove(glove_data)
-
-    boot_data = await database.equipment.get_equipped(user_id, "boot")
-    if boot_data:
-        player.equipped_boot = create_boot(boot_data)
-
-    helmet_data = await database.equipment.get_equipped(user_id, "helmet")
-    if helmet_data:
-        player.equipped_helmet = create_helmet(helmet_data)
-
-    comp_rows = await database.companions.get_active(user_id)
+    # 2. Attach Gear
+    gear = snap["gear"]
+    if gear["weapon"]:
+        player.equipped_weapon = create_weapon(gear["weapon"])
+    if gear["accessory"]:
+        player.equipped_accessory = create_accessory(gear["accessory"])
+    if gear["armor"]:
+        player.equipped_armor = create_armor(gear["armor"])
+    if gear["glove"]:
+        player.equipped_glove = create_glove(gear["glove"])
+    if gear["boot"]:
+        player.equipped_boot = create_boot(gear["boot"])
+    if gear["helmet"]:
+        player.equipped_helmet = create_helmet(gear["helmet"])
+
+    comp_rows = snap["active_companions"]
     if comp_rows:
         player.active_companions = [create_companion(row) for row in comp_rows]
 
-    # --- Fetch Companion Mastery ---
-    # Each block below uses bare except so that a missing row (first-time unlock)
-    # or a mid-migration schema gap silently falls back to safe defaults rather
-    # than crashing the entire player load.  The print lets us catch unexpected
-    # DB errors without spamming logs for every new player who hasn't visited
-    # the feature yet.
+    # --- Companion Mastery ---
+    # Each block below falls back to safe defaults when its section failed
+    # (e.g. a mid-migration schema gap) rather than crashing the entire player
+    # load. The print lets us catch unexpected DB errors; a missing row for a
+    # player who hasn't visited the feature yet is not an error.
     try:
-        mastery = await database.companions.get_mastery(user_id, server_id)
-        nodes = mastery.get("nodes_owned", {})
+        if "companion_mastery" in errors:
+            raise errors["companion_mastery"]
+        nodes = snap["companion_mastery"]
         from core.companions.mastery import get_passive_mult, has_elite_bond
 
         player.companion_passive_mult = get_passive_mult(
@@ -341,58 +331,58 @@ async def load_player(user_id: str, user_data: tuple, database) -> Player:
         print(f"[load_player] companion mastery failed for {user_id}: {e}")
         # defaults (1.0 / False) from Player dataclass
 
-    # --- Fetch Slayer Data ---
-    try:
-        # Load Emblem
-        player.slayer_emblem = await database.slayer.get_emblem(user_id, server_id)
-        # Load Active Task to check for Slayer-specific buffs
-        profile = await database.slayer.get_profile(user_id, server_id)
-        player.active_task_species = profile.get("active_task_species")
-    except Exception as e:
-        # Expected for players who haven't opened /slayer yet (no profile row).
-        # Any other exception here is unexpected and worth investigating.
-        print(f"[load_player] slayer data failed for {user_id}: {e}")
+    # --- Slayer Data ---
+    if "slayer" in errors:
+        print(f"[load_player] slayer data failed for {user_id}: {errors['slayer']}")
         player.slayer_emblem = {}
         player.active_task_species = None
+    else:
+        player.slayer_emblem, player.active_task_species = snap["slayer"]
 
-    # --- Fetch Codex Tomes ---
-    try:
-        player.codex_tomes = await database.codex.get_tomes(user_id)
-    except Exception as e:
-        print(f"[load_player] codex tomes failed for {user_id}: {e}")
+    # --- Codex Tomes ---
+    if "codex_tomes" in errors:
+        print(f"[load_player] codex tomes failed for {user_id}: {errors['codex_tomes']}")
         player.codex_tomes = []
+    else:
+        player.codex_tomes = snap["codex_tomes"]
 
-    # --- Fetch Ascension Pinnacle Unlocks ---
-    try:
-        player.ascension_unlocks = await database.ascension.get_unlocked_floors(user_id)
-    except Exception as e:
-        print(f"[load_player] ascension unlocks failed for {user_id}: {e}")
+    # --- Ascension Pinnacle Unlocks ---
+    if "ascension_unlocks" in errors:
+        print(
+            f"[load_player] ascension unlocks failed for {user_id}: {errors['ascension_unlocks']}"
+        )
         player.ascension_unlocks = set()
+    else:
+        player.ascension_unlocks = snap["ascension_unlocks"]
 
-    # --- Fetch Alchemy Potion Passives ---
-    try:
-        player.potion_passives = await database.alchemy.get_potion_passives(user_id)
-    except Exception as e:
-        print(f"[load_player] alchemy passives failed for {user_id}: {e}")
+    # --- Alchemy Potion Passives ---
+    if "potion_passives" in errors:
+        print(
+            f"[load_player] alchemy passives failed for {user_id}: {errors['potion_passives']}"
+        )
         player.potion_passives = []
+    else:
+        player.potion_passives = snap["potion_passives"]
 
-    # --- Fetch Equipped Monster Body Parts ---
-    try:
-        player.equipped_parts = await database.monster_parts.get_equipped_parts(user_id)
-    except Exception as e:
-        print(f"[load_player] monster parts failed for {user_id}: {e}")
+    # --- Equipped Monster Body Parts ---
+    if "equipped_parts" in errors:
+        print(f"[load_player] monster parts failed for {user_id}: {errors['equipped_parts']}")
         player.equipped_parts = {}
+    else:
+        player.equipped_parts = snap["equipped_parts"]
 
-    # --- Fetch Paradise Jewel Data ---
-    try:
-        player.jewel_of_paradise = await database.paradise.get(user_id)
-    except Exception as e:
-        print(f"[load_player] paradise jewel failed for {user_id}: {e}")
+    # --- Paradise Jewel Data ---
+    if "paradise" in errors:
+        print(f"[load_player] paradise jewel failed for {user_id}: {errors['paradise']}")
         # keeps default empty structure
+    else:
+        player.jewel_of_paradise = snap["paradise"]
 
-    # --- Fetch Active Combat Partner ---
+    # --- Active Combat Partner ---
     try:
-        partner_row = await database.partners.get_active_combat(user_id)
+        if "active_partner" in errors:
+            raise errors["active_partner"]
+        partner_row = snap["active_partner"]
         if partner_row:
             from core.models import Partner
             from core.partners.data import PARTNER_DATA
@@ -404,45 +394,51 @@ async def load_player(user_id: str, user_data: tuple, database) -> Player:
         print(f"[load_player] active partner failed for {user_id}: {e}")
         player.active_partner = None
 
-    # --- Fetch Hematurgy Passives ---
+    # --- Hematurgy Passives ---
     try:
-        raw = await database.hematurgy.get_all_passives(user_id)
+        if "hematurgy" in errors:
+            raise errors["hematurgy"]
+        raw = snap["hematurgy"]
         player.hematurgy_passives = {v["passive_id"]: v["tier"] for v in raw.values()}
     except Exception as e:
         print(f"[load_player] hematurgy passives failed for {user_id}: {e}")
         player.hematurgy_passives = {}
 
-    # --- Fetch Soul Stone ---
+    # --- Soul Stone ---
     try:
-        ss_row = await database.apex.get_or_create_soul_stone(user_id, server_id)
+        if "soul_stone" in errors:
+            raise errors["soul_stone"]
         from core.apex.models import soul_stone_from_db
 
-        player.soul_stone = soul_stone_from_db(ss_row)
+        player.soul_stone = soul_stone_from_db(snap["soul_stone"])
     except Exception as e:
         print(f"[load_player] soul stone failed for {user_id}: {e}")
         player.soul_stone = None
 
-    # --- Fetch Rite of Convergence Artefact (equipped one, out of the full
+    # --- Rite of Convergence Artefact (equipped one, out of the full
     # inventory — combat only ever reads the single equipped slot) ---
     try:
-        art_row = await database.rite.get_equipped_artefact(user_id, server_id)
+        if "artefact" in errors:
+            raise errors["artefact"]
         from core.rite.models import artefact_from_db
 
-        player.artefact = artefact_from_db(art_row)
+        player.artefact = artefact_from_db(snap["artefact"])
     except Exception as e:
         print(f"[load_player] artefact failed for {user_id}: {e}")
         player.artefact = None
 
-    # --- Fetch Stat Investments (passive_point allocations) ---
-    try:
-        stat_inv = await database.users.get_stat_investments(user_id)
+    # --- Stat Investments (passive_point allocations) ---
+    if "stat_investments" in errors:
+        print(
+            f"[load_player] stat investments failed for {user_id}: {errors['stat_investments']}"
+        )
+        # defaults to 0 from Player dataclass
+    else:
+        stat_inv = snap["stat_investments"]
         player.stat_invest_atk = stat_inv["atk"]
         player.stat_invest_def = stat_inv["def"]
         player.stat_invest_hp = stat_inv["hp"]
         player.stat_invest_gold = stat_inv["gold"]
-    except Exception as e:
-        print(f"[load_player] stat investments failed for {user_id}: {e}")
-        # defaults to 0 from Player dataclass
 
     # 3. Pre-compute flat stat cache (base + gear + essences + barracks).
     # Must be done after all gear is attached and before any combat begins.
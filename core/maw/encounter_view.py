@@ -143,7 +143,7 @@ class MawEncounterView(BaseView):
             self.monster.hp = self.monster.max_hp  # Maw never dies
             self.last_log = result.log
             try:
-                await message.edit(embed=self.build_embed(), view=self)
+                await self.schedule_edit(message, embed=self.build_embed(), view=self)
             except discord.HTTPException:
                 pass
             await asyncio.sleep(1.0)
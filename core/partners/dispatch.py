@@ -238,6 +238,80 @@ def _extract_skill_modifiers(partner: Partner) -> Dict[str, Any]:
 # ===========================================================================
 
 
+# ===========================================================================
+# Batched sampling
+#
+# A claim can cover dozens of reward rolls, and each roll used to make its
+# own randint / choices call plus up to eight independent bonus checks.
+# The rollers below draw the aggregate outcome directly, with the same
+# distribution: a binomial count per bonus chance, a multinomial split per
+# weighted or uniform pick, and one vectorised draw per summed range.
+# ===========================================================================
+
+
+def _binomial(n: int, p: float) -> int:
+    """Number of successes in ``n`` independent ``random() < p`` checks."""
+    if n <= 0 or p <= 0.0:
+        return 0
+    if p >= 1.0:
+        return n
+    q = 1.0 - p
+    prob = q**n
+    if prob == 0.0:
+        # q**n underflowed (huge n); fall back to the per-trial loop.
+        return sum(1 for _ in range(n) if random.random() < p)
+    # Inverse transform: walk the CDF with one uniform draw.
+    u = random.random()
+    k, cdf, ratio = 0, prob, p / q
+    while u >= cdf and k < n:
+        prob *= (n - k) / (k + 1) * ratio
+        k += 1
+        cdf += prob
+    return k
+
+
+def _multinomial(n: int, weights: list[float]) -> list[int]:
+    """Splits ``n`` weighted picks into per-option counts (conditional
+    binomials), equivalent to ``n`` calls of ``random.choices(k=1)``."""
+    counts = []
+    remaining_weight = float(sum(weights))
+    for w in weights[:-1]:
+        c = _binomial(n, w / remaining_weight) if remaining_weight > 0 else 0
+        counts.append(c)
+        n -= c
+        remaining_weight -= w
+    counts.append(n)
+    return counts
+
+
+def _uniform_counts(n: int, options: list[str]) -> Dict[str, int]:
+    """``n`` draws of ``random.choice(options)``, as non-zero counts."""
+    counts = _multinomial(n, [1.0] * len(options))
+    return {opt: c for opt, c in zip(options, counts) if c}
+
+
+def _sum_scaled_randint(
+    n: int, lo: int, hi: int, mult: float, mult2: float = 1.0
+) -> int:
+    """Sum of ``int(random.randint(lo, hi) * mult * mult2)`` over ``n`` draws
+    (the two factors are applied in that order, as the per-roll code did)."""
+    if n <= 0:
+        return 0
+    values = random.choices(range(lo, hi + 1), k=n)
+    return sum(int(v * mult * mult2) for v in values)
+
+
+def _add_counts(items: Dict[str, int], counts: Dict[str, int]) -> None:
+    for key, c in counts.items():
+        if c:
+            items[key] = items.get(key, 0) + c
+
+
+# ===========================================================================
+# Per-task reward rollers
+# ===========================================================================
+
+
 def _level_mult(level: int) -> float:
     """Linear scaling: 1.0× at Lv.1, 2.0× at Lv.100."""
     return 1.0 + (max(1, min(level, 100)) - 1) / 99.0
@@ -245,71 +319,52 @@ def _level_mult(level: int) -> float:
 
 def _roll_combat(rolls: float, mods: Dict[str, Any], level: int = 1) -> Dict[str, Any]:
     """Rolls combat dispatch rewards for `rolls` reward rolls."""
-    gold = 0
-    exp = 0
+    n = int(rolls)
     items: Dict[str, int] = {}
     lv = _level_mult(level)
 
-    for _ in range(int(rolls)):
-        gold += int(
-            random.randint(_COMBAT_GOLD_MIN, _COMBAT_GOLD_MAX) * mods["gold_mult"] * lv
-        )
-        exp += int(
-            random.randint(_COMBAT_EXP_MIN, _COMBAT_EXP_MAX) * mods["exp_mult"] * lv
-        )
-
-        loot = random.choices(_COMBAT_LOOT_TYPES, weights=_COMBAT_LOOT_WEIGHTS, k=1)[0]
-        if loot != "gold":
-            items[loot] = items.get(loot, 0) + 1
-
-        # di_extra_reward bonus item
-        if random.random() < mods["extra_reward_chance"]:
-            extra = random.choices(
-                _COMBAT_LOOT_TYPES, weights=_COMBAT_LOOT_WEIGHTS, k=1
-            )[0]
-            if extra == "gold":
-                gold += int(
-                    random.randint(_COMBAT_GOLD_MIN, _COMBAT_GOLD_MAX)
-                    * mods["gold_mult"]
-                )
-            else:
-                items[extra] = items.get(extra, 0) + 1
-
-        if (
-            mods["settlement_mat_chance"] > 0
-            and random.random() < mods["settlement_mat_chance"]
-        ):
-            mat = random.choice(["magma_core", "life_root", "spirit_shard"])
-            items[mat] = items.get(mat, 0) + 1
-
-        if mods["contract_chance"] > 0 and random.random() < mods["contract_chance"]:
-            items["guild_ticket"] = items.get("guild_ticket", 0) + 1
-
-        if mods["pinnacle_chance"] > 0 and random.random() < mods["pinnacle_chance"]:
-            drop = random.choice(["antique_tome", "pinnacle_key"])
-            items[drop] = items.get(drop, 0) + 1
-
-        if mods["essence_chance"] > 0 and random.random() < mods["essence_chance"]:
-            items["essence"] = items.get("essence", 0) + 1
-
-        if (
-            mods["spirit_stone_chance"] > 0
-            and random.random() < mods["spirit_stone_chance"]
-        ):
-            items["spirit_stone"] = items.get("spirit_stone", 0) + 1
-
-        if (
-            mods["elemental_key_chance"] > 0
-            and random.random() < mods["elemental_key_chance"]
-        ):
-            ekey = random.choice(_ELEMENTAL_KEY_DROPS)
-            items[ekey] = items.get(ekey, 0) + 1
-
-        if (
-            mods["slayer_drop_chance"] > 0
-            and random.random() < mods["slayer_drop_chance"]
-        ):
-            items["slayer_drop"] = items.get("slayer_drop", 0) + 1
+    gold = _sum_scaled_randint(
+        n, _COMBAT_GOLD_MIN, _COMBAT_GOLD_MAX, mods["gold_mult"], lv
+    )
+    exp = _sum_scaled_randint(n, _COMBAT_EXP_MIN, _COMBAT_EXP_MAX, mods["exp_mult"], lv)
+
+    loot = dict(zip(_COMBAT_LOOT_TYPES, _multinomial(n, _COMBAT_LOOT_WEIGHTS)))
+    loot.pop("gold")
+    _add_counts(items, loot)
+
+    # di_extra_reward bonus item (extra gold ignores the level multiplier)
+    extras = _binomial(n, mods["extra_reward_chance"])
+    extra_loot = dict(
+        zip(_COMBAT_LOOT_TYPES, _multinomial(extras, _COMBAT_LOOT_WEIGHTS))
+    )
+    gold += _sum_scaled_randint(
+        extra_loot.pop("gold"), _COMBAT_GOLD_MIN, _COMBAT_GOLD_MAX, mods["gold_mult"]
+    )
+    _add_counts(items, extra_loot)
+
+    _add_counts(
+        items,
+        _uniform_counts(
+            _binomial(n, mods["settlement_mat_chance"]),
+            ["magma_core", "life_root", "spirit_shard"],
+        ),
+    )
+    _add_counts(items, {"guild_ticket": _binomial(n, mods["contract_chance"])})
+    _add_counts(
+        items,
+        _uniform_counts(
+            _binomial(n, mods["pinnacle_chance"]), ["antique_tome", "pinnacle_key"]
+        ),
+    )
+    _add_counts(items, {"essence": _binomial(n, mods["essence_chance"])})
+    _add_counts(items, {"spirit_stone": _binomial(n, mods["spirit_stone_chance"])})
+    _add_counts(
+        items,
+        _uniform_counts(
+            _binomial(n, mods["elemental_key_chance"]), _ELEMENTAL_KEY_DROPS
+        ),
+    )
+    _add_counts(items, {"slayer_drop": _binomial(n, mods["slayer_drop_chance"])})
 
     return {"gold": gold, "exp": exp, "items": items}
 
@@ -336,22 +391,20 @@ def _roll_gathering(
     items: Dict[str, int] = {}
     lv_mult = _gathering_level_mult(level)
 
-    for _ in range(int(rolls)):
-        skill = random.choice(list(_GATHERING_YIELD_MAP.keys()))
+    for skill, picks in _uniform_counts(
+        int(rolls), list(_GATHERING_YIELD_MAP.keys())
+    ).items():
         yield_table = _GATHERING_YIELD_MAP[skill]
         default_tier = _GATHERING_DEFAULT_TIER[skill]
         tool = skill_tiers.get(skill, default_tier)
         tier_yields = yield_table.get(tool, yield_table[default_tier])
 
-        double = (
-            mods["flora_double_chance"] > 0
-            and random.random() < mods["flora_double_chance"]
-        )
-        mult = mods["skilling_mult"] * (2 if double else 1) * lv_mult
-
-        for material, (qty_min, qty_max) in tier_yields.items():
-            qty = int(random.randint(qty_min, qty_max) * mult)
-            items[material] = items.get(material, 0) + qty
+        doubled = _binomial(picks, mods["flora_double_chance"])
+        for count, double in ((picks - doubled, False), (doubled, True)):
+            mult = mods["skilling_mult"] * (2 if double else 1) * lv_mult
+            for material, (qty_min, qty_max) in tier_yields.items():
+                qty = _sum_scaled_randint(count, qty_min, qty_max, mult)
+                items[material] = items.get(material, 0) + qty
 
     return {"gold": 0, "exp": 0, "items": items}
 
@@ -364,16 +417,9 @@ def _roll_boss(rolls: float, mods: Dict[str, Any]) -> Dict[str, Any]:
     boss_drops = floor(rolls / 4)
     items: Dict[str, int] = {}
 
-    for _ in range(boss_drops):
-        sigil = random.choice(_BOSS_SIGILS)
-        items[sigil] = items.get(sigil, 0) + 1
-
-        if (
-            mods["boss_extra_chance"] > 0
-            and random.random() < mods["boss_extra_chance"]
-        ):
-            extra_sigil = random.choice(_BOSS_SIGILS)
-            items[extra_sigil] = items.get(extra_sigil, 0) + 1
+    _add_counts(items, _uniform_counts(boss_drops, _BOSS_SIGILS))
+    extras = _binomial(boss_drops, mods["boss_extra_chance"])
+    _add_counts(items, _uniform_counts(extras, _BOSS_SIGILS))
 
     return {"gold": 0, "exp": 0, "items": items}
 
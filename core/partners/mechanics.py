@@ -1,29 +1,14 @@
 from __future__ import annotations
 
-import json
 import math
-import os
 import random
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
+from core.assets import registry as assets
+
 if TYPE_CHECKING:
     pass
 
-# ---------------------------------------------------------------------------
-# Load exp table once at import time
-# ---------------------------------------------------------------------------
-
-_EXP_TABLE: dict = {}
-
-
-def _load_exp() -> None:
-    path = os.path.join(os.path.dirname(__file__), "..", "..", "assets", "exp.json")
-    with open(path, encoding="utf-8") as f:
-        _EXP_TABLE.update(json.load(f)["levels"])
-
-
-_load_exp()
-
 # ---------------------------------------------------------------------------
 # Skill key lists
 # ---------------------------------------------------------------------------
@@ -405,7 +390,7 @@ def xp_threshold(level: int) -> int:
     """XP needed to advance from `level` to `level + 1`."""
     if level >= MAX_LEVEL:
         return 0
-    return math.floor(int(_EXP_TABLE.get(str(level), 999_999)) * 0.1)
+    return math.floor(int(assets.exp_levels().get(str(level), 999_999)) * 0.1)
 
 
 def grant_xp(
@@ -111,8 +111,9 @@ async def _apply_dispatch_rewards(
     exp = result.get("exp", 0)
     items_got = result.get("items", {})
 
+    ledger = bot.database.reward_ledger(user_id, server_id)
     if gold > 0:
-        await bot.database.users.modify_gold(user_id, gold)
+        ledger.gold(gold)
     if exp > 0:
         new_level, new_exp, _ = _grant_xp(partner.level, partner.exp, exp)
         partner.level = new_level
@@ -135,7 +136,7 @@ async def _apply_dispatch_rewards(
             elif item_key in _FISHING_ITEMS:
                 fishing_batch[item_key] = fishing_batch.get(item_key, 0) + qty
             elif item_key in ("magma_core", "life_root", "spirit_shard"):
-                await bot.database.settlement_materials.modify(user_id, item_key, qty)
+                ledger.material(item_key, qty)
             elif item_key == "celestial_sigils":
                 await bot.database.uber.increment_sigils(user_id, server_id, qty)
             elif item_key == "infernal_sigils":
@@ -150,31 +151,17 @@ async def _apply_dispatch_rewards(
                 for _ in range(qty):
                     for key_type in _BOSS_KEY_TYPES:
                         if random.random() < 0.20:
-                            await bot.database.users.modify_currency(
-                                user_id, _BOSS_KEY_TYPES[key_type], 1
-                            )
+                            ledger.currency(_BOSS_KEY_TYPES[key_type], 1)
             elif item_key in _RUNE_CURRENCY_MAP:
-                await bot.database.users.modify_currency(
-                    user_id, _RUNE_CURRENCY_MAP[item_key], qty
-                )
+                ledger.currency(_RUNE_CURRENCY_MAP[item_key], qty)
             elif item_key == "guild_ticket":
-                await bot.database.partners.add_tickets(user_id, qty)
+                ledger.tickets(qty)
             elif item_key in ("antique_tome", "pinnacle_key"):
-                await bot.database.users.modify_currency(user_id, item_key, qty)
-            elif item_key == "blessed_bismuth":
-                await bot.database.skills.increment_blessed_bismuth(
-                    user_id, server_id, qty
-                )
-            elif item_key == "sparkling_sprig":
-                await bot.database.skills.increment_sparkling_sprig(
-                    user_id, server_id, qty
-                )
-            elif item_key == "capricious_carp":
-                await bot.database.skills.increment_capricious_carp(
-                    user_id, server_id, qty
-                )
+                ledger.currency(item_key, qty)
+            elif item_key in ("blessed_bismuth", "sparkling_sprig", "capricious_carp"):
+                ledger.mastery(item_key, qty)
             elif item_key == "spirit_stone":
-                await bot.database.users.modify_currency(user_id, "spirit_stones", qty)
+                ledger.currency("spirit_stones", qty)
             elif item_key == "essence":
                 from database.repositories.essences import (
                     COMMON_ESSENCE_TYPES,
@@ -183,9 +170,11 @@ async def _apply_dispatch_rewards(
 
                 pool = list(COMMON_ESSENCE_TYPES) + list(RARE_ESSENCE_TYPES)
                 for _ in range(qty):
-                    await bot.database.essences.add(user_id, random.choice(pool), 1)
+                    ledger.essence(random.choice(pool))
             elif item_key == "slayer_drop":
                 try:
+                    # add_rewards only updates; make sure the profile row exists.
+                    await bot.database.slayer.get_profile(user_id, server_id)
                     await bot.database.slayer.add_rewards(user_id, server_id, 0, qty)
                 except Exception:
                     pass
@@ -212,6 +201,8 @@ async def _apply_dispatch_rewards(
             except Exception:
                 pass
 
+    await ledger.flush()
+
     now_str = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
     await bot.database.partners.reset_dispatch_timer(
         user_id, partner.partner_id, now_str
@@ -49,6 +49,30 @@ _MONSTER_NAMES_FOR_PARTS = [
 _PART_SLOTS = ["head", "torso", "right_arm", "left_arm", "right_leg", "left_leg"]
 
 
+# Quest lookups for the progress tick, which runs several times per action.
+_QUESTS_BY_ID: dict[str, dict] = {}
+for _quest in DAILY_QUESTS:
+    _QUESTS_BY_ID.setdefault(_quest["id"], _quest)
+_QUEST_EVENT_TYPES = frozenset(
+    [q["event_type"] for q in DAILY_QUESTS]
+    + [p["event_type"] for p in HORIZON_PATHS.values()]
+)
+
+# Events that tick by their raw value (damage amount, gold won, runes used,
+# etc.); every other event ticks by 1.
+_VALUE_EVENTS = frozenset(
+    {
+        "damage",
+        "casino_win",
+        "rune_refinement",
+        "rune_shatter",
+        "rune_potential",
+        "zeal_spent",
+        "partner_recruit",
+    }
+)
+
+
 def get_eligible_quests(level: int) -> list:
     """Returns daily quest templates the player can receive."""
     return [q for q in DAILY_QUESTS if level >= q["level_required"]]
@@ -115,7 +139,7 @@ def get_board_cooldown_remaining(locked_at_iso: str) -> timedelta:
 
 def compute_goal_for_quest(quest_id: str, tier: int, level: int) -> int:
     """Compute the goal value for a quest+tier given player level."""
-    quest_def = next((q for q in DAILY_QUESTS if q["id"] == quest_id), None)
+    quest_def = _QUESTS_BY_ID.get(quest_id)
     if quest_def is None:
         return 5
     if quest_def["goals"] == "banded":
@@ -126,7 +150,7 @@ def compute_goal_for_quest(quest_id: str, tier: int, level: int) -> int:
 
 def format_goal_description(quest_id: str, tier: int, goal: int) -> str:
     """Return a human-readable objective string."""
-    quest_def = next((q for q in DAILY_QUESTS if q["id"] == quest_id), None)
+    quest_def = _QUESTS_BY_ID.get(quest_id)
     if quest_def is None:
         return f"Complete {goal} times"
     event = quest_def.get("event_type", "")
@@ -175,78 +199,72 @@ async def tick_quest_progress(
     Called from victory/completion hooks. Ticks matching contracts and horizon quest.
     Returns list of display strings for the victory embed Quests field.
     """
+    return await tick_quest_events(bot, user_id, server_id, {event_type: value})
+
+
+async def tick_quest_events(
+    bot, user_id: str, server_id: str, events: dict[str, int]
+) -> list:
+    """
+    tick_quest_progress for several events at once ({event_type: value}).
+    Reads quest state once, applies every event in memory and writes all
+    progress with one commit. Messages come out in the order the events are
+    given, exactly as the equivalent sequence of tick_quest_progress calls.
+    """
     if not server_id:
         return []
+    events = {e: v for e, v in events.items() if e in _QUEST_EVENT_TYPES}
+    if not events:
+        return []
 
     msgs = []
 
     try:
-        # Ensure meta exists
-        await bot.database.quests.ensure_meta(user_id)
-        meta = await bot.database.quests.get_meta(user_id)
-
-        # Find contracts matching this event_type
-        contracts = await bot.database.quests.get_contracts(user_id, server_id)
-        for contract in contracts:
-            if contract["turned_in"] or contract["completed"]:
-                continue
-            quest_def = next(
-                (q for q in DAILY_QUESTS if q["id"] == contract["quest_id"]), None
-            )
-            if quest_def is None:
-                continue
-            if quest_def["event_type"] != event_type:
-                continue
-
-            # Some events use the raw value (damage amount, gold won, runes used, etc.)
-            _VALUE_EVENTS = {
-                "damage",
-                "casino_win",
-                "rune_refinement",
-                "rune_shatter",
-                "rune_potential",
-                "zeal_spent",
-                "partner_recruit",
-            }
-            tick_amount = value if event_type in _VALUE_EVENTS else 1
-            updated = await bot.database.quests.tick_contract_progress(
-                user_id, server_id, contract["quest_id"], tick_amount
-            )
-            for row in updated:
-                if row["slot"] != contract["slot"]:
+        contracts, horizon, boost_uses = await bot.database.quests.get_tick_state(
+            user_id, server_id
+        )
+        path_def = HORIZON_PATHS.get(horizon["path_id"]) if horizon else None
+
+        contract_ticks = []
+        horizon_amount = 0
+        boost_used = False
+        for event_type, value in events.items():
+            for contract in contracts:
+                quest_def = _QUESTS_BY_ID.get(contract["quest_id"])
+                if quest_def is None or quest_def["event_type"] != event_type:
                     continue
+                # Some events use the raw value (damage amount, gold won, runes used, etc.)
+                tick_amount = value if event_type in _VALUE_EVENTS else 1
+                contract_ticks.append((tick_amount, contract["slot"]))
+                progress = contract["progress"] + tick_amount
                 label = quest_def["label"]
-                progress = min(row["progress"], row["goal"])
-                if row["completed"]:
+                if progress >= contract["goal"]:
                     msgs.append(f"{QUEST_COMPLETE} {label}  Complete!")
                 else:
-                    msgs.append(f"📋 {label}  {progress}/{row['goal']}")
+                    msgs.append(f"📋 {label}  {progress}/{contract['goal']}")
 
-        # Horizon quest
-        horizon = await bot.database.quests.get_horizon(user_id, server_id)
-        if horizon and not horizon["turned_in"] and not horizon["completed"]:
-            path_def = HORIZON_PATHS.get(horizon["path_id"])
+            # Horizon quest
             if path_def and path_def["event_type"] == event_type:
                 # Horizon boost: count as 2
                 tick_amount = 1
-                boost_uses = meta.get("horizon_boost_uses", 0)
                 if boost_uses > 0:
                     tick_amount = 2
-                    await bot.database.quests.decrement_horizon_boost(user_id)
+                    boost_used = True
+                horizon_amount += tick_amount
+                path_name = path_def["name"]
+                progress = horizon["progress"] + horizon_amount
+                if progress >= horizon["goal"]:
+                    msgs.append(f"{QUEST_COMPLETE} {path_name}  Complete!")
+                else:
+                    msgs.append(f"🌀 {path_name}  {progress}/{horizon['goal']}")
 
-                updated_h = await bot.database.quests.tick_horizon_progress(
-                    user_id, server_id, tick_amount
-                )
-                if updated_h:
-                    path_name = path_def["name"]
-                    progress = min(updated_h["progress"], updated_h["goal"])
-                    if updated_h["completed"]:
-                        msgs.append(f"{QUEST_COMPLETE} {path_name}  Complete!")
-                    else:
-                        msgs.append(f"🌀 {path_name}  {progress}/{updated_h['goal']}")
+        await bot.database.quests.apply_ticks(
+            user_id, server_id, contract_ticks, horizon_amount, boost_used
+        )
 
     except Exception as e:
         print(f"[tick_quest_progress error]: {e}")
+        return []
 
     return msgs
 
@@ -10,6 +10,7 @@ Pure functions for the Settlement Turns Economy:
 
 from __future__ import annotations
 
+import logging
 import math
 import random
 from typing import TYPE_CHECKING
@@ -40,6 +41,8 @@ from core.settlement.constants import (
 if TYPE_CHECKING:
     pass
 
+logger = logging.getLogger("discord_bot")
+
 
 # ---------------------------------------------------------------------------
 # Zeal economy
@@ -123,6 +126,93 @@ def meta_construction_dt_cost(
 # Next Turn processor
 # ---------------------------------------------------------------------------
 
+# Batch read-cache keys holding building/plot state; dropped whenever a turn
+# step may have built, upgraded, disabled or re-staffed something.
+_BUILDING_KEYS = ("settlement", "plots", "building:nursery", "building:idlem_foundry")
+
+
+class _TurnBatch:
+    """State shared by the turns of one process_turns() call.
+
+    The batch runs inside a single transaction, so no other task can write
+    this settlement until it finishes: a read stays valid until one of the
+    batch's own writes touches it, and the turn steps that make such writes
+    drop the affected keys. Production, follower growth and Hall of Firsts
+    checks are additive, so they accumulate here and are applied once.
+    """
+
+    def __init__(self) -> None:
+        self._reads: dict = {}
+        self.production: dict = {}
+        self.market_gold = 0
+        self.war_camp_stamina = 0
+        self.companion_cookie = 0
+        self.followers: dict[str, int] = {}
+        self.follower_totals: dict[str, int] = {}
+        self.developed_plots: int | None = None
+
+    async def read(self, key: str, loader):
+        if key not in self._reads:
+            self._reads[key] = await loader()
+        return self._reads[key]
+
+    def put(self, key: str, value) -> None:
+        self._reads[key] = value
+
+    def peek(self, key: str):
+        return self._reads.get(key)
+
+    def drop(self, *keys: str) -> None:
+        for key in keys:
+            self._reads.pop(key, None)
+
+
+def _new_turn_summary() -> dict:
+    return {
+        "turns_gained": 0,
+        "zeal_spent": 0,
+        "projects_completed": [],
+        "deal_completed": None,
+        "deal_rewards": None,
+        "events_fired": [],
+        "crisis_events_fired": [],
+        "events_expired": [],
+        "workers_from_nursery": 0,
+        "nursery_ideology": "",
+        "idlem_from_foundry": 0,
+        "dt_resources": {},
+    }
+
+
+def _merge_turn_summary(total: dict, turn: dict) -> None:
+    """Folds one turn's summary into a running multi-turn summary."""
+    total["turns_gained"] += turn.get("turns_gained", 1)
+    total["zeal_spent"] += turn.get("zeal_spent", 0)
+    total["projects_completed"].extend(turn.get("projects_completed", []))
+    if turn.get("deal_completed"):
+        total["deal_completed"] = turn["deal_completed"]
+        total["deal_rewards"] = turn.get("deal_rewards")
+    total["events_fired"].extend(turn.get("events_fired", []))
+    total["crisis_events_fired"].extend(turn.get("crisis_events_fired", []))
+    total["events_expired"].extend(turn.get("events_expired", []))
+    total["workers_from_nursery"] += turn.get("workers_from_nursery", 0)
+    if turn.get("nursery_ideology"):
+        total["nursery_ideology"] = turn["nursery_ideology"]
+    total["idlem_from_foundry"] += turn.get("idlem_from_foundry", 0)
+    for k, v in (turn.get("dt_resources") or {}).items():
+        total["dt_resources"][k] = total["dt_resources"].get(k, 0) + v
+
+
+def _crisis_pending(active_events: list[dict]) -> bool:
+    """True while a combat crisis is waiting out its advance warning."""
+    return any(
+        ev["event_type"] == "upcoming"
+        and SETTLEMENT_EVENTS.get(ev["event_key"], {})
+        .get("effects", {})
+        .get("spawn_combat")
+        for ev in active_events
+    )
+
 
 async def process_next_turn(
     bot,
@@ -142,24 +232,90 @@ async def process_next_turn(
       - workers_from_nursery: int
       - idlem_from_foundry: int
     """
-    summary: dict = {
-        "turns_gained": 1,
-        "zeal_spent": ZEAL_TO_DT,
-        "projects_completed": [],
-        "deal_completed": None,
-        "deal_rewards": None,
-        "events_fired": [],
-        "crisis_events_fired": [],
-        "events_expired": [],
-        "workers_from_nursery": 0,
-        "nursery_ideology": "",
-        "idlem_from_foundry": 0,
-        "dt_resources": {},
-    }
+    return await process_turns(
+        bot, user_id, server_id, town_hall_tier, 1, stop_on_crisis=False
+    )
+
+
+async def process_turns(
+    bot,
+    user_id: str,
+    server_id: str,
+    town_hall_tier: int,
+    turns: int,
+    stop_on_crisis: bool = True,
+) -> dict:
+    """
+    Processes up to `turns` Development Turns as one transaction and returns
+    their merged summary (same keys as process_next_turn). Each turn runs the
+    full single-turn sequence in order, so projects, deals and events resolve
+    exactly as if the turns were taken one at a time.
+
+    With stop_on_crisis, the batch stops after the turn that leaves a combat
+    crisis pending — otherwise its whole warning window could elapse inside
+    the batch before the player ever gets a Confront button. The caller reads
+    summary["turns_gained"] to see how many turns were actually processed.
+    """
+    summary = _new_turn_summary()
+    batch = _TurnBatch()
+    async with bot.database.transaction():
+        for _ in range(max(0, turns)):
+            _merge_turn_summary(summary, await _run_turn(bot, user_id, server_id, batch))
+            if stop_on_crisis and _crisis_pending(
+                await _batch_events(bot, user_id, server_id, batch)
+            ):
+                break
+        await _flush_turn_batch(bot, user_id, server_id, batch)
+
+    # Claims announce publicly — only once the turns they came from are committed.
+    for new_total in batch.follower_totals.values():
+        await hof_triggers.check_cult_leader(bot, user_id, new_total)
+    if batch.developed_plots is not None:
+        await hof_triggers.check_king(bot, user_id, batch.developed_plots)
+    return summary
+
+
+async def _flush_turn_batch(
+    bot, user_id: str, server_id: str, batch: _TurnBatch
+) -> None:
+    """Writes out the production and follower growth accumulated so far."""
+    if batch.production:
+        await bot.database.settlement.commit_production(
+            user_id, server_id, batch.production
+        )
+    if batch.market_gold > 0:
+        await bot.database.users.modify_gold(user_id, batch.market_gold)
+    if batch.war_camp_stamina > 0:
+        await bot.database.users.add_stamina_capped(user_id, batch.war_camp_stamina)
+    if batch.companion_cookie > 0:
+        await bot.database.users.modify_currency(
+            user_id, "companion_pet_xp", batch.companion_cookie
+        )
+    for ideology_name, workers in batch.followers.items():
+        current = await bot.database.social.get_follower_count(ideology_name)
+        new_total = current + workers
+        await bot.database.social.update_followers(ideology_name, new_total)
+        batch.follower_totals[ideology_name] = new_total
+    batch.production = {}
+    batch.market_gold = batch.war_camp_stamina = batch.companion_cookie = 0
+    batch.followers = {}
+
+
+async def _batch_events(bot, user_id: str, server_id: str, batch: _TurnBatch):
+    return await batch.read(
+        "events", lambda: bot.database.settlement.get_active_events(user_id, server_id)
+    )
+
+
+async def _run_turn(bot, user_id: str, server_id: str, batch: _TurnBatch) -> dict:
+    """One Development Turn within a process_turns() batch."""
+    summary = _new_turn_summary()
+    summary["turns_gained"] = 1
+    summary["zeal_spent"] = ZEAL_TO_DT
 
     # 1. Read active ongoing events BEFORE advancing projects so their multipliers
     #    apply to any projects that complete this turn.
-    active_events = await bot.database.settlement.get_active_events(user_id, server_id)
+    active_events = await _batch_events(bot, user_id, server_id, batch)
     event_effects: dict = {}
     for _ev in active_events:
         _ev_def = SETTLEMENT_EVENTS.get(_ev.get("event_key", ""), {})
@@ -171,7 +327,9 @@ async def process_next_turn(
     # 2. Advance all projects; collect completed ones
     completed = await bot.database.settlement.advance_projects(user_id, server_id)
     for proj in completed:
-        result = await _complete_project(bot, user_id, server_id, proj, event_effects)
+        result = await _complete_project(
+            bot, user_id, server_id, proj, event_effects, batch
+        )
         await bot.database.settlement.delete_project(proj["id"])
         summary["projects_completed"].append(
             {
@@ -182,10 +340,15 @@ async def process_next_turn(
         )
         if proj["project_type"] == "foundry_idlem":
             summary["idlem_from_foundry"] += result.get("idlem", 0)
+    if completed:
+        batch.drop(*_BUILDING_KEYS)
 
     # 2b. Nursery: automatically produce workers each DT if staffed
-    nursery_building = await bot.database.settlement.get_building_by_type(
-        user_id, server_id, "nursery"
+    nursery_building = await batch.read(
+        "building:nursery",
+        lambda: bot.database.settlement.get_building_by_type(
+            user_id, server_id, "nursery"
+        ),
     )
     if (
         nursery_building
@@ -199,19 +362,23 @@ async def process_next_turn(
             * nursery_mult
         )
         workers += random.randint(0, 1)
-        user_row = await bot.database.users.get(user_id, server_id)
+        user_row = await batch.read(
+            "user", lambda: bot.database.users.get(user_id, server_id)
+        )
         ideology_name = (user_row["ideology"] or "") if user_row else ""
         if ideology_name:
-            current = await bot.database.social.get_follower_count(ideology_name)
-            new_total = current + workers
-            await bot.database.social.update_followers(ideology_name, new_total)
-            await hof_triggers.check_cult_leader(bot, user_id, new_total)
+            batch.followers[ideology_name] = (
+                batch.followers.get(ideology_name, 0) + workers
+            )
         summary["workers_from_nursery"] = workers
         summary["nursery_ideology"] = ideology_name
 
     # 2c. Idlem Foundry: automatically produce Idlem each DT if staffed
-    foundry_building = await bot.database.settlement.get_building_by_type(
-        user_id, server_id, "idlem_foundry"
+    foundry_building = await batch.read(
+        "building:idlem_foundry",
+        lambda: bot.database.settlement.get_building_by_type(
+            user_id, server_id, "idlem_foundry"
+        ),
     )
     if (
         foundry_building
@@ -227,12 +394,17 @@ async def process_next_turn(
         summary["idlem_from_foundry"] += idlem
 
     # 3. Advance pending Black Market deal
-    deal = await bot.database.settlement.get_pending_deal(user_id, server_id)
+    deal = await batch.read(
+        "deal", lambda: bot.database.settlement.get_pending_deal(user_id, server_id)
+    )
     if deal:
         deal = await bot.database.settlement.decrement_deal_turn(user_id, server_id)
+        batch.put("deal", deal)
         if deal and deal["turns_remaining"] <= 0:
             # Deal complete — roll rewards
-            user_row = await bot.database.users.get(user_id, server_id)
+            user_row = await batch.read(
+                "user", lambda: bot.database.users.get(user_id, server_id)
+            )
             player_level = user_row["level"] if user_row else 1
             deal_tree_nodes = await bot.database.settlement.get_bm_tree(
                 user_id, server_id
@@ -249,16 +421,24 @@ async def process_next_turn(
                 bm_logger=bm_log,
             )
             bm_log.close()
-            # Atomic: a crash between granting and deleting would re-grant the
-            # deal on the next turn.
-            async with bot.database.transaction():
-                await _grant_bm_rewards(bot, user_id, server_id, rewards)
-                await bot.database.settlement.delete_pending_deal(user_id, server_id)
+            await _grant_bm_rewards(bot, user_id, server_id, rewards)
+            await bot.database.settlement.delete_pending_deal(user_id, server_id)
+            batch.put("deal", None)
+            # Rewards can include raw gathering resources; re-read the stock
+            # only after the production held back so far has been written.
+            await _flush_turn_batch(bot, user_id, server_id, batch)
+            batch.drop("user", "raw_inventory")
             summary["deal_completed"] = deal
             summary["deal_rewards"] = rewards
 
     # 4. Tick events
-    newly_fired, expired = await bot.database.settlement.tick_events(user_id, server_id)
+    if active_events:
+        newly_fired, expired = await bot.database.settlement.tick_events(
+            user_id, server_id
+        )
+        batch.drop("events")
+    else:
+        newly_fired, expired = [], []
     for ev in expired:
         await bot.database.settlement.remove_event(ev["id"])
         summary["events_expired"].append(
@@ -293,14 +473,20 @@ async def process_next_turn(
             summary["crisis_events_fired"].append(entry)
         else:
             summary["events_fired"].append(ev_name)
+    if newly_fired:
+        batch.drop(*_BUILDING_KEYS)
 
     # 5. Increment total turns
+    turns_data = await batch.read(
+        "turns", lambda: bot.database.settlement.get_turns_data(user_id, server_id)
+    )
     await bot.database.settlement.increment_turns(user_id, server_id)
-    turns_data = await bot.database.settlement.get_turns_data(user_id, server_id)
+    turns_data["total_development_turns"] += 1
     new_total = turns_data["total_development_turns"]
 
     # 6. Check for new events to schedule
-    await _check_schedule_events(bot, user_id, server_id, new_total)
+    if await _check_schedule_events(bot, user_id, server_id, new_total, batch):
+        batch.drop("events", *_BUILDING_KEYS)
 
     # 7. DT-based resource production (generators + converters at 5× hourly rate)
     (
@@ -308,48 +494,36 @@ async def process_next_turn(
         market_gold,
         war_camp_stamina,
         companion_cookie,
-    ) = await _calculate_dt_production(bot, user_id, server_id)
+    ) = await _calculate_dt_production(bot, user_id, server_id, batch)
     if dt_changes:
-        # Snapshot resources BEFORE commit_production pops "timber"/"stone" from the dict.
         summary["dt_resources"] = {k: v for k, v in dt_changes.items() if v > 0}
-        await bot.database.settlement.commit_production(user_id, server_id, dt_changes)
+        for k, v in dt_changes.items():
+            batch.production[k] = batch.production.get(k, 0) + v
+        # Later turns' converters must see this turn's output and deductions.
+        raw_inv = batch.peek("raw_inventory")
+        if raw_inv:
+            for k in raw_inv.keys() & dt_changes.keys():
+                raw_inv[k] += dt_changes[k]
     if market_gold > 0:
-        await bot.database.users.modify_gold(user_id, market_gold)
+        batch.market_gold += market_gold
         summary["dt_resources"]["market_gold"] = market_gold
     if war_camp_stamina > 0:
-        await bot.database.users.add_stamina_capped(user_id, war_camp_stamina)
+        batch.war_camp_stamina += war_camp_stamina
         summary["dt_resources"]["war_camp_stamina"] = war_camp_stamina
     if companion_cookie > 0:
         summary["dt_resources"]["companion_xp"] = companion_cookie
-        await bot.database.users.modify_currency(
-            user_id, "companion_pet_xp", companion_cookie
-        )
+        batch.companion_cookie += companion_cookie
 
     return summary
 
 
-async def _calculate_dt_production(
-    bot, user_id: str, server_id: str
-) -> tuple[dict, int, int, int]:
-    """
-    Calculates per-DT resource output for all active generator and converter buildings.
-    Rate = 5× the base hourly rate (i.e. equivalent to 5 hours of passive generation).
-
-    Returns (changes_dict, market_gold, war_camp_stamina, companion_cookie_xp).
-    Does NOT include Nursery or Idlem Foundry — those are handled via projects.
-    """
-    from core.settlement.mechanics import SettlementMechanics
-
-    settlement = await bot.database.settlement.get_settlement(user_id, server_id)
-    if not settlement or not settlement.buildings:
-        return {}, 0, 0, 0
-
-    # Fetch raw inventories for converters
+async def _load_raw_inventory(bot, user_id: str, server_id: str) -> dict:
+    """Raw gathering stock that DT converters draw from ({} if unavailable)."""
     try:
         mining = await bot.database.skills.get_data(user_id, server_id, "mining")
         wood = await bot.database.skills.get_data(user_id, server_id, "woodcutting")
         fish = await bot.database.skills.get_data(user_id, server_id, "fishing")
-        raw_inv = {
+        return {
             "iron_ore": mining["iron_ore"],
             "coal_ore": mining["coal_ore"],
             "gold_ore": mining["gold_ore"],
@@ -367,26 +541,32 @@ async def _calculate_dt_production(
             "titanium_bones": fish["titanium_bones"],
         }
     except Exception:
-        raw_inv = {}
+        return {}
 
-    _DT_HOURS = 5.0  # 1 DT = 5× hourly rate
-    # Market is a pure passive generator (real-time hourly accrual only via Collect) —
-    # it does not additionally receive the per-DT burst other hybrid buildings get.
-    _SKIP = {
-        "nursery",
-        "idlem_foundry",
-        "black_market",
-        "hatchery",
-        "war_camp",
-        "market",
-    }
 
-    # Adjacency bonuses from meta buildings (Servant's Quarters, Supply Depot, etc.)
+async def _load_refining_bonus(bot, user_id: str, server_id: str) -> float:
+    """Mastery converter output bonus (Master Quarry / Seasoned Timber synergy nodes)."""
+    refining_bonus = 0.0
+    try:
+        mastery_row = await bot.database.skills.get_mastery(user_id, server_id)
+        if mastery_row:
+            from core.skills.mastery import has_master_quarry, has_seasoned_timber
+
+            if has_master_quarry(mastery_row):
+                refining_bonus += 0.10
+            if has_seasoned_timber(mastery_row):
+                refining_bonus += 0.10
+    except Exception:
+        pass
+    return refining_bonus
+
+
+async def _load_plots(bot, user_id: str, server_id: str) -> list:
     from core.settlement.models import Plot as PlotModel
 
     try:
         _plot_rows = await bot.database.plots.get_plots(user_id, server_id)
-        plots = [
+        return [
             PlotModel(
                 plot_index=r["plot_index"],
                 is_developed=bool(r["is_developed"]),
@@ -395,7 +575,49 @@ async def _calculate_dt_production(
             for r in _plot_rows
         ]
     except Exception:
-        plots = []
+        return []
+
+
+async def _calculate_dt_production(
+    bot, user_id: str, server_id: str, batch: _TurnBatch
+) -> tuple[dict, int, int, int]:
+    """
+    Calculates per-DT resource output for all active generator and converter buildings.
+    Rate = 5× the base hourly rate (i.e. equivalent to 5 hours of passive generation).
+
+    Returns (changes_dict, market_gold, war_camp_stamina, companion_cookie_xp).
+    Does NOT include Nursery or Idlem Foundry — those are handled via projects.
+    """
+    from core.settlement.mechanics import SettlementMechanics
+
+    settlement = await batch.read(
+        "settlement", lambda: bot.database.settlement.get_settlement(user_id, server_id)
+    )
+    if not settlement or not settlement.buildings:
+        return {}, 0, 0, 0
+
+    # Raw inventories for converters. Copied: the deductions mirrored below are
+    # this turn's only, the batch's running stock is updated once it commits.
+    raw_inv = dict(
+        await batch.read(
+            "raw_inventory", lambda: _load_raw_inventory(bot, user_id, server_id)
+        )
+    )
+
+    _DT_HOURS = 5.0  # 1 DT = 5× hourly rate
+    # Market is a pure passive generator (real-time hourly accrual only via Collect) —
+    # it does not additionally receive the per-DT burst other hybrid buildings get.
+    _SKIP = {
+        "nursery",
+        "idlem_foundry",
+        "black_market",
+        "hatchery",
+        "war_camp",
+        "market",
+    }
+
+    # Adjacency bonuses from meta buildings (Servant's Quarters, Supply Depot, etc.)
+    plots = await batch.read("plots", lambda: _load_plots(bot, user_id, server_id))
     adj_bonuses = SettlementMechanics.calculate_adjacency_bonuses(
         plots, settlement.buildings
     )
@@ -405,22 +627,12 @@ async def _calculate_dt_production(
         {p.plot_index: p.bonus_type for p in plots} if plots else {}
     )
 
-    # Mastery converter output bonus (Master Quarry / Seasoned Timber synergy nodes)
-    refining_bonus = 0.0
-    try:
-        mastery_row = await bot.database.skills.get_mastery(user_id, server_id)
-        if mastery_row:
-            from core.skills.mastery import has_master_quarry, has_seasoned_timber
-
-            if has_master_quarry(mastery_row):
-                refining_bonus += 0.10
-            if has_seasoned_timber(mastery_row):
-                refining_bonus += 0.10
-    except Exception:
-        pass
+    refining_bonus = await batch.read(
+        "refining_bonus", lambda: _load_refining_bonus(bot, user_id, server_id)
+    )
 
     # Extract event production bonuses/penalties for this turn.
-    _active_evs = await bot.database.settlement.get_active_events(user_id, server_id)
+    _active_evs = await _batch_events(bot, user_id, server_id, batch)
     _dt_gen_bonus = 0.0
     _dt_conv_bonus = 0.0
     _dt_market_gold_bonus = 0.0
@@ -500,7 +712,12 @@ async def _calculate_dt_production(
 
 
 async def _complete_project(
-    bot, user_id: str, server_id: str, proj: dict, event_effects: dict | None = None
+    bot,
+    user_id: str,
+    server_id: str,
+    proj: dict,
+    event_effects: dict | None = None,
+    batch: _TurnBatch | None = None,
 ) -> dict:
     """Apply the effects of a completed project. Returns a label dict."""
     ptype = proj["project_type"]
@@ -544,9 +761,17 @@ async def _complete_project(
             await bot.database.plots.develop_plot(
                 user_id, server_id, plot_index, bonus_type
             )
-            plots = await bot.database.plots.get_plots(user_id, server_id)
-            developed_count = sum(1 for p in plots if p["is_developed"])
-            await hof_triggers.check_king(bot, user_id, developed_count)
+            if batch is not None:
+                # Checked by process_turns once the batch has committed.
+                batch.drop("plots")
+                plots = await batch.read(
+                    "plots", lambda: _load_plots(bot, user_id, server_id)
+                )
+                batch.developed_plots = sum(1 for p in plots if p.is_developed)
+            else:
+                plots = await bot.database.plots.get_plots(user_id, server_id)
+                developed_count = sum(1 for p in plots if p["is_developed"])
+                await hof_triggers.check_king(bot, user_id, developed_count)
         return {"label": f"Plot {plot_index} Excavated"}
 
     elif ptype == "foundry_idlem":
@@ -651,15 +876,18 @@ _COMBAT_EVENTS: frozenset[str] = frozenset(
 
 
 async def _check_schedule_events(
-    bot, user_id: str, server_id: str, total_turns: int
-) -> None:
-    """Schedules upcoming events that are due based on total turns."""
-    existing = await bot.database.settlement.get_active_events(user_id, server_id)
+    bot, user_id: str, server_id: str, total_turns: int, batch: _TurnBatch
+) -> bool:
+    """Schedules upcoming events that are due based on total turns.
+    Returns True if any event was scheduled or applied."""
+    existing = await _batch_events(bot, user_id, server_id, batch)
     existing_keys = {ev["event_key"] for ev in existing}
     combat_event_active = bool(existing_keys & _COMBAT_EVENTS)
 
     # Fetch the player's buildings so we can enforce requirements and pick targets.
-    settlement = await bot.database.settlement.get_settlement(user_id, server_id)
+    settlement = await batch.read(
+        "settlement", lambda: bot.database.settlement.get_settlement(user_id, server_id)
+    )
     player_building_types: set[str] = set()
     if settlement and settlement.buildings:
         player_building_types = {
@@ -710,6 +938,7 @@ async def _check_schedule_events(
     if combat_due and not combat_event_active:
         to_fire.append(random.choice(combat_due))
 
+    scheduled = False
     for key, ev_def in to_fire:
         # Roll banded modifier.
         ev_data: dict = {}
@@ -773,6 +1002,11 @@ async def _check_schedule_events(
             )
         elif etype == "instant":
             await _apply_event_effects(bot, user_id, server_id, ev_def, ev_data)
+        else:
+            continue
+        scheduled = True
+
+    return scheduled
 
 
 # ---------------------------------------------------------------------------
@@ -1216,30 +1450,26 @@ _GATHERING_SKILL_MAP: dict[str, str] = {
 
 async def _grant_bm_rewards(bot, user_id: str, server_id: str, rewards: dict) -> None:
     """Applies a rolled BM reward dict to the player."""
+    ledger = bot.database.reward_ledger(user_id, server_id)
     if rewards.get("gold", 0) > 0:
-        await bot.database.users.modify_gold(user_id, rewards["gold"])
+        ledger.gold(rewards["gold"])
 
     for cur, qty in rewards.get("currencies", {}).items():
         if cur.startswith("essence_"):
-            ess_type = cur[len("essence_") :]
-            for _ in range(qty):
-                await bot.database.essences.add(user_id, ess_type)
+            ledger.essence(cur[len("essence_") :], qty)
         elif cur in ("guild_ticket",):
-            await bot.database.partners.add_tickets(user_id, qty)
+            ledger.tickets(qty)
         elif cur == "cosmic_dust":
-            await bot.database.alchemy.modify_cosmic_dust(user_id, qty)
+            ledger.cosmic_dust(qty)
         elif cur in _GATHERING_SKILL_MAP:
-            skill = _GATHERING_SKILL_MAP[cur]
             try:
-                await bot.database.skills.update_single_resource(
-                    user_id, server_id, skill, cur, qty
-                )
-            except Exception:
+                ledger.resource(_GATHERING_SKILL_MAP[cur], cur, qty)
+            except ValueError:
                 pass
         elif cur in _SETTLEMENT_MATERIAL_COLS:
             try:
-                await bot.database.settlement_materials.modify(user_id, cur, qty)
-            except Exception:
+                ledger.material(cur, qty)
+            except ValueError:
                 pass
         elif cur == "paradise_jewels":
             try:
@@ -1250,9 +1480,17 @@ async def _grant_bm_rewards(bot, user_id: str, server_id: str, rewards: dict) ->
                 pass
         else:
             try:
-                await bot.database.users.modify_currency(user_id, cur, qty)
-            except Exception:
+                ledger.currency(cur, qty)
+            except ValueError:
                 pass
+    try:
+        await ledger.flush()
+    except Exception:
+        # Runs inside process_turns' transaction: losing this deal's rewards
+        # must not roll back the turns already resolved around it.
+        logger.error(
+            "BM reward grant failed for %s/%s", user_id, server_id, exc_info=True
+        )
 
     for item_spec in rewards.get("items", []):
         try:
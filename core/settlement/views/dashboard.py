@@ -42,7 +42,11 @@ from core.settlement.plots import (
     get_meta_slots,
     render_grid,
 )
-from core.settlement.turn_engine import passive_zeal_for_period, process_next_turn
+from core.settlement.turn_engine import (
+    passive_zeal_for_period,
+    process_next_turn,
+    process_turns,
+)
 from core.settlement.ui import (
     build_building_list_embed,
     build_meta_buildings_embed,
@@ -1367,64 +1371,15 @@ class SettlementDashboardView(SettlementBaseView):
             except Exception:
                 pass
 
-            # Process 3 turns back-to-back, merging their summaries for display.
-            summary: dict = {
-                "turns_gained": 0,
-                "zeal_spent": cost,
-                "projects_completed": [],
-                "deal_completed": None,
-                "deal_rewards": None,
-                "events_fired": [],
-                "crisis_events_fired": [],
-                "events_expired": [],
-                "workers_from_nursery": 0,
-                "nursery_ideology": "",
-                "idlem_from_foundry": 0,
-                "dt_resources": {},
-            }
-            turns_done = 0
-            for _ in range(3):
-                _turn = await process_next_turn(
-                    self.bot, uid, sid, self.settlement.town_hall_tier
-                )
-                turns_done += 1
-                summary["turns_gained"] += _turn.get("turns_gained", 1)
-                summary["projects_completed"].extend(
-                    _turn.get("projects_completed", [])
-                )
-                if _turn.get("deal_completed"):
-                    summary["deal_completed"] = _turn["deal_completed"]
-                    summary["deal_rewards"] = _turn.get("deal_rewards")
-                summary["events_fired"].extend(_turn.get("events_fired", []))
-                summary["crisis_events_fired"].extend(
-                    _turn.get("crisis_events_fired", [])
-                )
-                summary["events_expired"].extend(_turn.get("events_expired", []))
-                summary["workers_from_nursery"] += _turn.get("workers_from_nursery", 0)
-                if _turn.get("nursery_ideology"):
-                    summary["nursery_ideology"] = _turn["nursery_ideology"]
-                summary["idlem_from_foundry"] += _turn.get("idlem_from_foundry", 0)
-                for _k, _v in (_turn.get("dt_resources") or {}).items():
-                    summary["dt_resources"][_k] = (
-                        summary["dt_resources"].get(_k, 0) + _v
-                    )
-
-                # Stop fast-forwarding the moment a combat crisis becomes
-                # pending. Otherwise its whole advance-warning window can
-                # elapse — firing as an unconfronted failure and vanishing —
-                # inside this same batch, before the player ever sees it in
-                # Active Events or gets a Confront button.
-                _mid_events = await self.bot.database.settlement.get_active_events(
-                    uid, sid
-                )
-                if any(
-                    ev["event_type"] == "upcoming"
-                    and SETTLEMENT_EVENTS.get(ev["event_key"], {})
-                    .get("effects", {})
-                    .get("spawn_combat")
-                    for ev in _mid_events
-                ):
-                    break
+            # Process 3 turns as one batch. process_turns stops early the
+            # moment a combat crisis becomes pending; otherwise its whole
+            # advance-warning window could elapse — firing as an unconfronted
+            # failure and vanishing — inside this same batch, before the
+            # player ever sees it in Active Events or gets a Confront button.
+            summary = await process_turns(
+                self.bot, uid, sid, self.settlement.town_hall_tier, 3
+            )
+            turns_done = summary["turns_gained"]
 
             # Refund Zeal for any turns we stopped short of, so pausing for a
             # crisis doesn't cost the player Zeal they never spent turns on.
@@ -672,24 +672,21 @@ def roll_rich_event(skill: SkillType, mastery_row: dict) -> bool:
     return random.random() < chance if chance > 0 else False
 
 
-def roll_remnant_generation(skill: SkillType, mastery_row: dict, is_rich: bool) -> int:
-    """
-    Returns number of remnants of the skill's type.
-    Quality 3pt node (geode_cores etc) required for any chance.
-    """
+def has_remnant_unlock(skill: SkillType, mastery_row: dict) -> bool:
+    """Quality 3pt node (geode_cores etc) — required for any remnant chance."""
     alloc = json.loads(mastery_row.get(f"{skill}_alloc", "{}") or "{}")
     quality_nodes = alloc.get("quality", {}).get("unlocked", [])
-    has_unlock = False
-    if skill == "mining" and "geode_cores" in quality_nodes:
-        has_unlock = True
-    elif skill == "fishing" and "tide_relics" in quality_nodes:
-        has_unlock = True
-    elif skill == "woodcutting" and "heartwood_shards" in quality_nodes:
-        has_unlock = True
-
-    if not has_unlock:
-        return 0
+    if skill == "mining":
+        return "geode_cores" in quality_nodes
+    if skill == "fishing":
+        return "tide_relics" in quality_nodes
+    if skill == "woodcutting":
+        return "heartwood_shards" in quality_nodes
+    return False
+
 
+def roll_remnant_count(is_rich: bool) -> int:
+    """Remnants for one tick of a player who has the remnant unlock."""
     if is_rich:
         # Guaranteed 3-5 average ~4
         return max(3, min(5, int(random.gauss(4.0, 0.8))))
@@ -700,6 +697,16 @@ def roll_remnant_generation(skill: SkillType, mastery_row: dict, is_rich: bool)
     return 0
 
 
+def roll_remnant_generation(skill: SkillType, mastery_row: dict, is_rich: bool) -> int:
+    """
+    Returns number of remnants of the skill's type.
+    Quality 3pt node (geode_cores etc) required for any chance.
+    """
+    if not has_remnant_unlock(skill, mastery_row):
+        return 0
+    return roll_remnant_count(is_rich)
+
+
 def get_remnant_column(skill: SkillType) -> str:
     return {
         "mining": "geode_cores",
@@ -1141,6 +1148,31 @@ def get_total_invested_for_skill(skill: SkillType, mastery_row: dict | None) ->
     return total
 
 
+def split_excess_points(
+    mining_points: int, fishing_points: int, woodcutting_points: int, conversion_rate: int
+) -> Tuple[int, int, int, int]:
+    """Converts full sets of ``conversion_rate`` unspent points (summed across the
+    three skills) into Mastery Insight.
+
+    Returns (new_mining, new_fishing, new_woodcutting, insight_gain). The
+    remainder (< conversion_rate) is handed back to the pools in mining →
+    fishing → woodcutting order. insight_gain is 0 when nothing converts.
+    """
+    total_points = mining_points + fishing_points + woodcutting_points
+    if conversion_rate <= 0 or total_points < conversion_rate:
+        return mining_points, fishing_points, woodcutting_points, 0
+
+    insight_gain = total_points // conversion_rate
+    remainder = total_points % conversion_rate
+
+    new_mining = min(remainder, mining_points)
+    remainder -= new_mining
+    new_fishing = min(remainder, fishing_points)
+    remainder -= new_fishing
+    new_woodcutting = remainder  # whatever is left
+    return new_mining, new_fishing, new_woodcutting, insight_gain
+
+
 def has_nature_attunement_unlocked(mastery_row: dict) -> bool:
     """
     Gate check: player must have at least 20 points invested in EACH of the three
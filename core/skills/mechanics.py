@@ -346,9 +346,19 @@ class SkillMechanics:
         if not mastery_row:
             return base
 
-        y_mult = Mastery.get_yield_multiplier(skill_type, mastery_row)
-        sig_mult = Mastery.get_signature_resource_bonus(skill_type, mastery_row)
+        return SkillMechanics.apply_mastery_multipliers(
+            skill_type,
+            base,
+            Mastery.get_yield_multiplier(skill_type, mastery_row),
+            Mastery.get_signature_resource_bonus(skill_type, mastery_row),
+        )
 
+    @staticmethod
+    def apply_mastery_multipliers(
+        skill_type: str, base: Dict[str, int], y_mult: float, sig_mult: float
+    ) -> Dict[str, int]:
+        """Scales a base yield by the Yield branch multiplier, and the signature
+        resource additionally by the Quality signature bonus."""
         # Map display/internal names for signature resources
         sig_map = {
             "mining": ("idea_ore", "idea_ore"),
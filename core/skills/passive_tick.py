@@ -0,0 +1,277 @@
+"""
+Hourly passive gathering tick — pure batch computation.
+
+The Skills cog's schedule_skills task used to walk every (user, server) pair
+and issue several reads and self-committing writes per skill. The tick is now
+split into three phases:
+
+  1. SkillRepository.get_passive_tick_state() reads every skill row and every
+     mastery row in one worker-thread hop.
+  2. compute_passive_tick() (this module) rolls yields, Rich events, remnants,
+     procs, triple ticks, Artisan Points and Insight conversion for everyone.
+     No I/O, no Discord.
+  3. SkillRepository.apply_passive_tick() writes the result back with one
+     executemany per table.
+
+Everything derived from a player's node allocation is memoized on the raw
+alloc JSON, so the many players sharing a build (most commonly an empty one)
+parse and evaluate it once per process instead of several times per tick.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple
+
+from core.skills import mastery as Mastery
+from core.skills.mechanics import SkillMechanics
+
+SKILLS = ("mining", "fishing", "woodcutting")
+
+TOOL_COLUMNS = {
+    "mining": "pickaxe_tier",
+    "fishing": "fishing_rod",
+    "woodcutting": "axe_type",
+}
+
+# Raw resource columns the passive tick can yield, in write order.
+RESOURCE_COLUMNS = {
+    "mining": ["iron_ore", "coal_ore", "gold_ore", "platinum_ore", "idea_ore"],
+    "fishing": [
+        "desiccated_bones",
+        "regular_bones",
+        "sturdy_bones",
+        "reinforced_bones",
+        "titanium_bones",
+    ],
+    "woodcutting": [
+        "oak_logs",
+        "willow_logs",
+        "mahogany_logs",
+        "magic_logs",
+        "idea_logs",
+    ],
+}
+
+# Below-tier signature resource granted by the Quality 2pt nodes.
+SIGNATURE_RESOURCES = {
+    "mining": "idea_ore",
+    "fishing": "titanium_bones",
+    "woodcutting": "idea_logs",
+}
+
+RICH_EVENT_MULT = 2.6
+NEVER_EMPTY_MULT = 1.70
+TRIPLED_TICK_MULT = 3
+
+# What SkillRepository.get_mastery() returns for a player with no row yet.
+DEFAULT_MASTERY_ROW = {
+    "mining_points": 0,
+    "fishing_points": 0,
+    "woodcutting_points": 0,
+    "mining_alloc": "{}",
+    "fishing_alloc": "{}",
+    "woodcutting_alloc": "{}",
+    "last_point_claim": None,
+    "geode_cores": 0,
+    "tide_relics": 0,
+    "heartwood_shards": 0,
+    "mining_tripled_ticks": 0,
+    "fishing_tripled_ticks": 0,
+    "woodcutting_tripled_ticks": 0,
+    "total_mastery_invested": 0,
+    "blessed_bismuth": 0,
+    "sparkling_sprig": 0,
+    "capricious_carp": 0,
+}
+
+
+class _SkillProfile(NamedTuple):
+    yield_mult: float
+    signature_mult: float
+    below_tier_chance: float
+    rich_chance: float
+    remnant_unlocked: bool
+    never_empty_chance: float
+
+
+@lru_cache(maxsize=4096)
+def _skill_profile(skill: str, alloc_json: str | None, insight: int) -> _SkillProfile:
+    row = {f"{skill}_alloc": alloc_json, "mastery_insight": insight}
+    return _SkillProfile(
+        yield_mult=Mastery.get_yield_multiplier(skill, row),
+        signature_mult=Mastery.get_signature_resource_bonus(skill, row),
+        below_tier_chance=Mastery.get_below_tier_chance(skill, row),
+        rich_chance=Mastery.get_rich_event_chance(skill, row),
+        remnant_unlocked=Mastery.has_remnant_unlock(skill, row),
+        never_empty_chance=Mastery.get_never_empty_proc_chance(skill, row),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _converts_to_insight(
+    mining_alloc: str | None,
+    fishing_alloc: str | None,
+    woodcutting_alloc: str | None,
+    attunement_alloc: str | None,
+) -> bool:
+    """Fully maxed trees + completed Nature's Attunement."""
+    row = {
+        "mining_alloc": mining_alloc,
+        "fishing_alloc": fishing_alloc,
+        "woodcutting_alloc": woodcutting_alloc,
+    }
+    if not Mastery.has_nature_attunement_unlocked(row):
+        return False
+    return Mastery.get_attunement_progress(attunement_alloc or "{}")["complete"]
+
+
+@dataclass
+class PassiveTickResult:
+    # (user_id, server_id) pairs that had no gathering_mastery row yet.
+    new_mastery_keys: List[Tuple[str, str]] = field(default_factory=list)
+    # skill -> [(*RESOURCE_COLUMNS[skill] deltas, user_id, server_id)]
+    resource_rows: Dict[str, List[tuple]] = field(
+        default_factory=lambda: {skill: [] for skill in SKILLS}
+    )
+    # (mining_pts, fishing_pts, woodcutting_pts, geode_cores, tide_relics,
+    #  heartwood_shards, mining_tt, fishing_tt, woodcutting_tt,
+    #  last_point_claim or None, user_id, server_id) — all counts are deltas;
+    #  tripled ticks are amounts consumed.
+    mastery_rows: List[tuple] = field(default_factory=list)
+    # (mining_pts, fishing_pts, woodcutting_pts, insight_gain, user_id,
+    #  server_id) — points are amounts converted away from each pool.
+    insight_rows: List[tuple] = field(default_factory=list)
+    # (user_id, server_id, skill or None, exception)
+    errors: List[tuple] = field(default_factory=list)
+
+
+def _roll_skill(skill: str, tool_tier: str, mrow: dict) -> Tuple[Dict[str, int], int]:
+    """One skill's passive tick for one player: (resources, remnants)."""
+    profile = _skill_profile(
+        skill,
+        mrow.get(f"{skill}_alloc", "{}"),
+        Mastery.get_mastery_insight(mrow),
+    )
+    resources = SkillMechanics.apply_mastery_multipliers(
+        skill,
+        SkillMechanics.calculate_yield(skill, tool_tier),
+        profile.yield_mult,
+        profile.signature_mult,
+    )
+
+    if profile.below_tier_chance > 0 and random.random() < profile.below_tier_chance:
+        sig = SIGNATURE_RESOURCES[skill]
+        resources[sig] = resources.get(sig, 0) + 1
+
+    is_rich = profile.rich_chance > 0 and random.random() < profile.rich_chance
+    if is_rich:
+        for k in resources:
+            resources[k] = int(resources[k] * RICH_EVENT_MULT)
+
+    remnants = Mastery.roll_remnant_count(is_rich) if profile.remnant_unlocked else 0
+
+    if profile.never_empty_chance > 0 and random.random() < profile.never_empty_chance:
+        for k in resources:
+            resources[k] = int(resources[k] * NEVER_EMPTY_MULT)
+
+    return resources, remnants
+
+
+def compute_passive_tick(
+    skill_rows: Dict[str, list],
+    mastery_rows: Dict[Tuple[str, str], dict],
+    now_iso: str,
+) -> PassiveTickResult:
+    """Rolls one hourly tick for every player with at least one skill row.
+
+    ``skill_rows`` maps each skill to its table rows (needs user_id,
+    server_id and the tool column); ``mastery_rows`` maps (user_id,
+    server_id) to that player's gathering_mastery row as a dict. A failure
+    for one player or skill is recorded in ``errors`` and skipped.
+    """
+    result = PassiveTickResult()
+    by_skill = {
+        skill: {(r["user_id"], r["server_id"]): r for r in skill_rows.get(skill, ())}
+        for skill in SKILLS
+    }
+    all_users = set()
+    for rows in by_skill.values():
+        all_users.update(rows)
+
+    for key in sorted(all_users):
+        user_id, server_id = key
+        try:
+            mrow = mastery_rows.get(key)
+            if mrow is None:
+                mrow = DEFAULT_MASTERY_ROW
+                result.new_mastery_keys.append(key)
+            last_claim = mrow.get("last_point_claim")
+            points = {skill: 0 for skill in SKILLS}
+            remnants = {skill: 0 for skill in SKILLS}
+            tripled_used = {skill: 0 for skill in SKILLS}
+
+            for skill in SKILLS:
+                data = by_skill[skill].get(key)
+                if data is None:
+                    continue
+                try:
+                    tool_tier = data[TOOL_COLUMNS[skill]]
+                    points[skill] = Mastery.compute_catchup_points(
+                        last_claim, tool_tier, now_iso
+                    )
+                    resources, remnants[skill] = _roll_skill(skill, tool_tier, mrow)
+
+                    # Triple tick consumption (prestige boss reward)
+                    if (mrow.get(f"{skill}_tripled_ticks", 0) or 0) > 0:
+                        for k in resources:
+                            resources[k] = int(resources[k] * TRIPLED_TICK_MULT)
+                        tripled_used[skill] = 1
+
+                    deltas = [resources.get(c, 0) for c in RESOURCE_COLUMNS[skill]]
+                    if any(deltas):
+                        result.resource_rows[skill].append((*deltas, user_id, server_id))
+                except Exception as e:
+                    points[skill] = remnants[skill] = tripled_used[skill] = 0
+                    result.errors.append((user_id, server_id, skill, e))
+
+            # last_point_claim only advances when points were actually awarded,
+            # so fractional hours accumulate across ticks for sub-daily rates.
+            any_pts = any(p > 0 for p in points.values())
+            row = (
+                *(points[s] for s in SKILLS),
+                *(remnants[s] for s in SKILLS),
+                *(tripled_used[s] for s in SKILLS),
+                now_iso if any_pts else None,
+                user_id,
+                server_id,
+            )
+            if any(row[:9]):
+                result.mastery_rows.append(row)
+
+            # Post-max Mastery Insight conversion, on the post-tick point pools.
+            if _converts_to_insight(
+                mrow.get("mining_alloc"),
+                mrow.get("fishing_alloc"),
+                mrow.get("woodcutting_alloc"),
+                mrow.get("attunement_alloc"),
+            ):
+                pools = [(mrow.get(f"{s}_points") or 0) + points[s] for s in SKILLS]
+                *remaining, gain = Mastery.split_excess_points(
+                    *pools, Mastery.INSIGHT_CONVERSION_RATE
+                )
+                if gain > 0:
+                    result.insight_rows.append(
+                        (
+                            *(before - after for before, after in zip(pools, remaining)),
+                            gain,
+                            user_id,
+                            server_id,
+                        )
+                    )
+        except Exception as e:
+            result.errors.append((user_id, server_id, None, e))
+
+    return result
@@ -1,9 +1,8 @@
-import csv
-import os
 import random
-from collections import Counter
 from typing import Callable, Tuple
 
+from core.assets import registry as assets
+
 
 def _slayer_xp_threshold(lvl: int) -> int:
     """XP required to advance from level `lvl` to `lvl+1`."""
@@ -205,36 +204,26 @@ class SlayerMechanics:
 
     @staticmethod
     def generate_task(player_level: int, slayer_level: int) -> Tuple[str, int]:
-        """Reads monsters.csv, weights species by frequency in bracket, returns
+        """Weights monsters.csv species by frequency in bracket, returns
         (Species, Amount). Species selection is scoped to `player_level` (character
         level) so the assigned species matches what you're actually fighting;
         task *size* is banded off `slayer_level` instead, so difficulty tracks
         actual Slayer progress rather than combat level — mirrors the slot-unlock
         breakpoints (20/50) in get_unlocked_slots."""
-        csv_path = os.path.join(os.path.dirname(__file__), "../../assets/monsters.csv")
         bracket_min = max(1, player_level - 50)
         bracket_max = min(110, player_level + 10)
 
-        species_pool = []
         try:
-            with open(csv_path, newline="") as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    m_lvl = int(row["level"]) * 10
-                    if bracket_min <= m_lvl <= bracket_max:
-                        species_pool.append(row.get("species", "Humanoid"))
+            species, weights = assets.monsters().species_weights(
+                bracket_min, bracket_max
+            )
         except Exception:
-            species_pool = ["Humanoid"]  # Fallback
-
-        if not species_pool:
-            species_pool = ["Humanoid"]
-
-        counts = Counter(species_pool)
+            species, weights = [], []
+        if not species:
+            species, weights = ["Humanoid"], [1]  # Fallback
 
         # Weight species selection by how frequently each appears in the bracket pool
-        chosen_species = random.choices(
-            list(counts.keys()), weights=list(counts.values()), k=1
-        )[0]
+        chosen_species = random.choices(species, weights=weights, k=1)[0]
 
         # Slayer-level-banded task sizes with variance
         if slayer_level < 20:
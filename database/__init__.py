@@ -1,9 +1,11 @@
-import asyncio
 from contextlib import asynccontextmanager
 
 import aiosqlite
 
-from .base import GuardedConnection
+from .base import GroupCommit, GuardedConnection
+from .query_stats import QueryStats
+from .read_pool import ReadPool
+from .reward_ledger import RewardLedger
 from .repositories.apex import ApexRepository
 from .repositories.codes import CodesRepository
 from .repositories.quests import QuestsRepository
@@ -30,6 +32,7 @@ from .repositories.paradise import ParadiseRepository
 from .repositories.partners import PartnerRepository
 from .repositories.prestige import PrestigeRepository
 from .repositories.settings import SettingsRepository
+from .repositories.player_snapshot import PlayerSnapshotRepository
 from .repositories.plots import PlotRepository
 from .repositories.rite import RiteRepository
 from .repositories.settlement import SettlementRepository
@@ -43,11 +46,21 @@ from .repositories.users import UserRepository
 
 class DatabaseManager:
     def __init__(
-        self, *, connection: "aiosqlite.Connection | GuardedConnection"
+        self,
+        *,
+        connection: "aiosqlite.Connection | GuardedConnection",
+        player_cache_size: int = 1024,
+        player_cache_ttl: float = 600.0,
+        leaderboard_size: int = 50,
     ) -> None:
         if not isinstance(connection, GuardedConnection):
             connection = GuardedConnection(connection)
         self.connection = connection
+        self.player_cache = connection.player_cache
+        self.player_cache.max_entries = player_cache_size
+        self.player_cache.ttl_seconds = player_cache_ttl
+        self.leaderboards = connection.leaderboards
+        self.leaderboards.capacity = leaderboard_size
 
         # Initialize sub-repositories
         self.users = UserRepository(connection)
@@ -85,6 +98,61 @@ class DatabaseManager:
         self.nether_market = NetherMarketRepository(connection)
         self.rite = RiteRepository(connection)
         self.hall_of_firsts = HallOfFirstsRepository(connection)
+        self.player_snapshot = PlayerSnapshotRepository(connection)
+
+    async def open_read_pool(self, path: str, size: int = 3) -> None:
+        """Attaches a ReadPool of ``size`` read-only connections to the
+        database file at ``path`` (WAL mode; not for in-memory databases)."""
+        pool = ReadPool(path, size)
+        await pool.open()
+        pool.query_stats = self.connection.query_stats
+        self.connection.readers = pool
+
+    def enable_query_stats(
+        self, *, slow_ms: float = 100.0, slow_log_path: str | None = None
+    ) -> QueryStats:
+        """Starts per-statement timing on the writer and the read pool."""
+        stats = QueryStats(slow_ms=slow_ms, slow_log_path=slow_log_path)
+        self.connection.query_stats = stats
+        if self.connection.readers is not None:
+            self.connection.readers.query_stats = stats
+        return stats
+
+    def enable_group_commit(
+        self, *, window_ms: float = 10.0, max_pending: int = 64
+    ) -> GroupCommit:
+        """Coalesces inline commits into one COMMIT per ``window_ms`` (or per
+        ``max_pending`` commits). Writes inside the window are not durable
+        until it closes; see GuardedConnection for the full trade-off."""
+        group = GroupCommit(window_ms, max_pending)
+        self.connection.group_commit = group
+        return group
+
+    def connection_stats(self) -> dict:
+        """Queue depth / latency counters: {"writer": {...}, "readers": [...],
+        "group_commit": {...} or None}."""
+        readers = self.connection.readers
+        group = self.connection.group_commit
+        return {
+            "writer": self.connection.stats.snapshot(),
+            "readers": readers.stats() if readers is not None else [],
+            "group_commit": group.snapshot() if group is not None else None,
+        }
+
+    async def close(self) -> None:
+        # Group commit may still be holding back the last window of writes.
+        await self.connection.flush()
+        readers = self.connection.readers
+        if readers is not None:
+            self.connection.readers = None
+            await readers.close()
+        await self.connection.close()
+
+    def reward_ledger(
+        self, user_id: str, server_id: "str | None" = None
+    ) -> RewardLedger:
+        """A RewardLedger for batching one player's reward grants."""
+        return RewardLedger(self, user_id, server_id)
 
     @asynccontextmanager
     async def transaction(self):
@@ -93,20 +161,12 @@ class DatabaseManager:
         Inline commits/rollbacks issued by repository methods inside the
         block are suppressed; everything commits together on exit or rolls
         back together if the block raises. Statements from other tasks wait
-        until the transaction finishes. Do not nest transaction() calls.
+        until the transaction finishes. A nested transaction() (including the
+        ones repository methods open themselves) joins the enclosing one.
 
             async with bot.database.transaction():
                 await bot.database.users.modify_gold(...)
                 await bot.database.equipment.transfer(...)
         """
-        conn = self.connection
-        async with conn._tx_lock:
-            conn._tx_owner = asyncio.current_task()
-            try:
-                yield
-                await conn._real.commit()
-            except BaseException:
-                await conn._real.rollback()
-                raise
-            finally:
-                conn._tx_owner = None
+        async with self.connection.transaction():
+            yield
@@ -1,8 +1,18 @@
 # database/base.py
 import asyncio
+import logging
+import sqlite3
+import time
+from contextlib import asynccontextmanager
 
 import aiosqlite
 
+from .leaderboards import LeaderboardCache
+from .player_cache import PlayerSnapshotCache
+from .settlement_projection import SettlementProjectionCache
+
+logger = logging.getLogger("discord_bot")
+
 
 class _CursorContext:
     """Mirrors aiosqlite's Result: usable as `await conn.execute(...)` and
@@ -24,6 +34,73 @@ class _CursorContext:
             await self._cursor.close()
 
 
+class ConnectionStats:
+    """Queue depth and latency counters for one sqlite connection. Latency
+    is measured from the call, so it includes time queued on the worker."""
+
+    __slots__ = ("in_flight", "peak_in_flight", "calls", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def begin(self) -> float:
+        self.in_flight += 1
+        if self.in_flight > self.peak_in_flight:
+            self.peak_in_flight = self.in_flight
+        return time.perf_counter()
+
+    def end(self, started: float) -> None:
+        elapsed = (time.perf_counter() - started) * 1000
+        self.in_flight -= 1
+        self.calls += 1
+        self.total_ms += elapsed
+        if elapsed > self.max_ms:
+            self.max_ms = elapsed
+
+    def snapshot(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "calls": self.calls,
+            "avg_ms": self.total_ms / self.calls if self.calls else 0.0,
+            "max_ms": self.max_ms,
+        }
+
+
+class GroupCommit:
+    """Settings and counters for GuardedConnection's group-commit mode."""
+
+    __slots__ = (
+        "window",
+        "max_pending",
+        "pending",
+        "timer",
+        "requested",
+        "commits",
+    )
+
+    def __init__(self, window_ms: float, max_pending: int) -> None:
+        self.window = window_ms / 1000
+        self.max_pending = max(1, max_pending)
+        self.pending = 0  # commit() calls since the last real COMMIT
+        self.timer: asyncio.Task | None = None
+        self.requested = 0
+        self.commits = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "window_ms": self.window * 1000,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "requested": self.requested,
+            "commits": self.commits,
+        }
+
+
 class GuardedConnection:
     """Wraps the shared aiosqlite connection to support managed transactions.
 
@@ -34,14 +111,63 @@ class GuardedConnection:
     rolls back at exit. While a transaction is in flight, statements from
     other tasks wait for it to finish so their writes can never be swept
     into (or lost with) someone else's rollback.
+
+    Display-only reads can go through read_all / read_one / run_read instead,
+    which use the ReadPool (database/read_pool.py) when one is attached.
+
+    Group commit (opt-in, DatabaseManager.enable_group_commit) turns the
+    inline commits into a write-behind queue: commit() returns at once and
+    the real COMMIT runs ``window_ms`` after the first queued one, or as
+    soon as ``max_pending`` have queued, covering every write since. What
+    that trades away:
+
+    - A write is durable only once its group commits. A crash or kill
+      inside the window loses it even though the command already replied;
+      DatabaseManager.close() flushes, so a clean shutdown loses nothing.
+    - Readers on the ReadPool see it up to one window later. Reads on this
+      connection see it at once.
+    - An inline rollback() outside a managed transaction cannot tell the
+      caller's writes from those other tasks already had acknowledged, so
+      it commits the queue first and undoes nothing queued before it. Write
+      paths that must be able to undo their own writes run them under
+      transaction(), which flushes the queue before it starts.
     """
 
-    _WRAPPER_ATTRS = frozenset({"_real", "_tx_lock", "_tx_owner"})
+    _WRAPPER_ATTRS = frozenset(
+        {
+            "_real",
+            "_tx_lock",
+            "_tx_owner",
+            "player_cache",
+            "leaderboards",
+            "settlement_projections",
+            "stats",
+            "readers",
+            "query_stats",
+            "group_commit",
+        }
+    )
 
     def __init__(self, real: aiosqlite.Connection):
         object.__setattr__(self, "_real", real)
         object.__setattr__(self, "_tx_lock", asyncio.Lock())
         object.__setattr__(self, "_tx_owner", None)
+        # Shared by every repository on this connection: write paths bump
+        # per-user versions here, PlayerSnapshotRepository reads through it.
+        object.__setattr__(self, "player_cache", PlayerSnapshotCache())
+        # Materialised rankings, kept current by the same write paths.
+        object.__setattr__(self, "leaderboards", LeaderboardCache(self))
+        # Derived settlement bonuses, versioned by the layout write paths.
+        object.__setattr__(
+            self, "settlement_projections", SettlementProjectionCache()
+        )
+        # Writer-side counterpart of ReadPool.stats().
+        object.__setattr__(self, "stats", ConnectionStats())
+        object.__setattr__(self, "readers", None)
+        # Optional per-statement timing (database/query_stats.py).
+        object.__setattr__(self, "query_stats", None)
+        # Optional write-behind commit batching (GroupCommit).
+        object.__setattr__(self, "group_commit", None)
 
     def __getattr__(self, name):
         return getattr(self._real, name)
@@ -55,14 +181,26 @@ class GuardedConnection:
     def _owns_transaction(self) -> bool:
         return self._tx_owner is not None and self._tx_owner is asyncio.current_task()
 
-    async def _wait_for_foreign_tx(self) -> None:
+    async def _wait_for_foreign_tx(self) -> float:
+        """Waits out another task's transaction. Returns the ms spent."""
         if self._tx_owner is not None and not self._owns_transaction():
+            started = time.perf_counter()
             async with self._tx_lock:
                 pass
+            return (time.perf_counter() - started) * 1000
+        return 0.0
 
     async def _guarded(self, method, *args, **kwargs):
-        await self._wait_for_foreign_tx()
-        return await method(*args, **kwargs)
+        qs = self.query_stats
+        token = qs.start() if qs is not None else None
+        wait_ms = await self._wait_for_foreign_tx()
+        started = self.stats.begin()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            self.stats.end(started)
+            if token is not None:
+                qs.record(token, args[0] if args else method.__name__, wait_ms)
 
     def execute(self, *args, **kwargs):
         return _CursorContext(self._guarded(self._real.execute, *args, **kwargs))
@@ -73,20 +211,169 @@ class GuardedConnection:
     def executescript(self, *args, **kwargs):
         return _CursorContext(self._guarded(self._real.executescript, *args, **kwargs))
 
+    async def run_sync(self, fn, *args):
+        """Run ``fn(sqlite3_connection, *args)`` on the aiosqlite worker thread.
+
+        Every ``execute`` is its own hop onto the worker thread; a read that
+        needs a dozen statements pays that hop a dozen times. Bulk readers
+        pass a plain function here instead so all of its statements run
+        back-to-back in a single hop. ``fn`` must only read — it bypasses the
+        commit bookkeeping above.
+        """
+        qs = self.query_stats
+        token = qs.start() if qs is not None else None
+        wait_ms = await self._wait_for_foreign_tx()
+        real = self._real
+        started = self.stats.begin()
+        try:
+            return await real._execute(fn, real._conn, *args)
+        finally:
+            self.stats.end(started)
+            if token is not None:
+                qs.record(token, f"run_sync {fn.__qualname__}", wait_ms)
+
+    def _read_pool(self):
+        # The owner of a transaction must see its own uncommitted writes.
+        if self.readers is None or self._owns_transaction():
+            return None
+        return self.readers
+
+    async def read_all(self, sql: str, params=()) -> list:
+        """fetchall() of a SELECT whose result is only displayed. Reads the
+        last committed state from the ReadPool, without waiting on the
+        writer; falls back to the writer when there is no pool."""
+        pool = self._read_pool()
+        if pool is None:
+            async with self.execute(sql, params) as cursor:
+                return await cursor.fetchall()
+        return await pool.fetchall(sql, params)
+
+    async def read_one(self, sql: str, params=()):
+        pool = self._read_pool()
+        if pool is None:
+            async with self.execute(sql, params) as cursor:
+                return await cursor.fetchone()
+        return await pool.fetchone(sql, params)
+
+    async def run_read(self, fn, *args):
+        """run_sync for display-only readers, routed like read_all."""
+        pool = self._read_pool()
+        if pool is None:
+            return await self.run_sync(fn, *args)
+        return await pool.run(fn, *args)
+
     async def commit(self):
         if self._owns_transaction():
             return  # deferred to the managed transaction's exit
-        await self._wait_for_foreign_tx()
-        await self._real.commit()
+        group = self.group_commit
+        if group is not None:
+            group.requested += 1
+            group.pending += 1
+            if group.pending < group.max_pending:
+                if group.timer is None:
+                    group.timer = asyncio.create_task(self._flush_after(group))
+                return
+        await self._commit_now()
+
+    async def _commit_now(self):
+        qs = self.query_stats
+        token = qs.start() if qs is not None else None
+        wait_ms = await self._wait_for_foreign_tx()
+        if self.group_commit is None:
+            await self._real.commit()
+        else:
+            # Hold other tasks' statements back while the group commits, the
+            # same way a managed transaction does.
+            async with self._tx_lock:
+                self._tx_owner = asyncio.current_task()
+                try:
+                    await self._commit_group()
+                finally:
+                    self._tx_owner = None
+        if token is not None:
+            qs.record(token, "COMMIT", wait_ms)
+
+    async def _commit_group(self, attempts: int = 20):
+        """The real COMMIT for every write queued so far. Callers hold
+        ``_tx_lock``."""
+        group = self.group_commit
+        if not group.pending:
+            return  # Someone else's flush got here first.
+        group.pending = 0
+        if group.timer is not None and group.timer is not asyncio.current_task():
+            group.timer.cancel()
+        group.timer = None
+        group.commits += 1
+        # Another task may have stepped an UPDATE ... RETURNING without
+        # fetching its row yet, and SQLite will not commit under it. Its fetch
+        # is next in line on the worker, so yield and retry.
+        for attempt in range(attempts):
+            try:
+                await self._real.commit()
+                return
+            except sqlite3.OperationalError as e:
+                if "statements in progress" not in str(e) or attempt == attempts - 1:
+                    raise
+                await asyncio.sleep(0)
+
+    async def _flush_after(self, group: GroupCommit):
+        await asyncio.sleep(group.window)
+        try:
+            await self.flush()
+        except Exception:
+            logger.error("Group commit failed", exc_info=True)
+
+    async def flush(self):
+        """Commits whatever group commit is still holding back. A no-op when
+        the mode is off, nothing is queued, or the caller owns a managed
+        transaction (its exit commits everything)."""
+        group = self.group_commit
+        if group is not None and group.pending and not self._owns_transaction():
+            await self._commit_now()
 
     async def rollback(self):
         if self._owns_transaction():
-            # A nested rollback (e.g. fuse_companions' internal handler) must
-            # not tear down the outer transaction; the exception it raises
-            # propagates and the transaction context rolls back once.
+            # A nested rollback must not tear down the outer transaction; the
+            # exception that prompted it propagates and the transaction
+            # context rolls back once.
             return
+        # The open SQLite transaction holds writes other tasks were already
+        # told are committed; never take them down with this one.
+        await self.flush()
         await self._wait_for_foreign_tx()
         await self._real.rollback()
+        self._discard_caches()
+
+    def _discard_caches(self):
+        # Another task may have cached a snapshot that read the rolled-back
+        # writes off this shared connection.
+        self.player_cache.clear()
+        self.leaderboards.invalidate()
+        self.settlement_projections.clear()
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Runs the block as one atomic transaction (see
+        DatabaseManager.transaction). Inside a transaction the calling task
+        already owns, the block simply joins it."""
+        if self._owns_transaction():
+            yield
+            return
+        async with self._tx_lock:
+            self._tx_owner = asyncio.current_task()
+            try:
+                if self.group_commit is not None:
+                    # Commit queued writes first, so a rollback here only
+                    # undoes this block's own.
+                    await self._commit_group()
+                yield
+                await self._real.commit()
+            except BaseException:
+                await self._real.rollback()
+                self._discard_caches()
+                raise
+            finally:
+                self._tx_owner = None
 
 
 class BaseRepository:
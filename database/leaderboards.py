@@ -0,0 +1,293 @@
+# database/leaderboards.py
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class BoardSpec:
+    """One ranking. ``sql`` selects ``columns`` for the top rows, ``ORDER BY
+    <sort_cols> DESC``, and takes ``LIMIT ?`` as its last parameter (after
+    ``server_id`` for per-server boards). ``eligible`` mirrors the query's
+    WHERE clause."""
+
+    sql: str
+    columns: tuple[str, ...]
+    id_cols: tuple[str, ...]
+    sort_cols: tuple[str, ...]
+    per_server: bool = False
+    eligible: Callable[[dict], bool] | None = None
+
+
+BOARDS: dict[str, BoardSpec] = {
+    "levels": BoardSpec(
+        "SELECT user_id, name, level, ascension FROM users "
+        "ORDER BY level DESC, ascension DESC LIMIT ?",
+        ("user_id", "name", "level", "ascension"),
+        ("user_id",),
+        ("level", "ascension"),
+    ),
+    "ascensions": BoardSpec(
+        "SELECT user_id, name, highest_ascension_stage, level FROM users "
+        "ORDER BY highest_ascension_stage DESC, level DESC LIMIT ?",
+        ("user_id", "name", "highest_ascension_stage", "level"),
+        ("user_id",),
+        ("highest_ascension_stage", "level"),
+    ),
+    "wealth": BoardSpec(
+        "SELECT user_id, name, gold FROM users ORDER BY gold DESC LIMIT ?",
+        ("user_id", "name", "gold"),
+        ("user_id",),
+        ("gold",),
+    ),
+    "slayer": BoardSpec(
+        "SELECT s.user_id, s.server_id, u.name, s.level, s.xp "
+        "FROM slayer_profiles s "
+        "JOIN users u ON s.user_id = u.user_id AND s.server_id = u.server_id "
+        "WHERE s.level > 1 ORDER BY s.level DESC, s.xp DESC LIMIT ?",
+        ("user_id", "server_id", "name", "level", "xp"),
+        ("user_id", "server_id"),
+        ("level", "xp"),
+        eligible=lambda row: row["level"] > 1,
+    ),
+    "ideologies": BoardSpec(
+        "SELECT id, name, followers FROM ideologies ORDER BY followers DESC LIMIT ?",
+        ("id", "name", "followers"),
+        ("id",),
+        ("followers",),
+    ),
+    "duels": BoardSpec(
+        "SELECT user_id, wins, losses FROM duel_stats ORDER BY wins DESC LIMIT ?",
+        ("user_id", "wins", "losses"),
+        ("user_id",),
+        ("wins",),
+    ),
+    "monuments": BoardSpec(
+        "SELECT user_id, name, prestige_monument, prestige_title, "
+        "prestige_display_name, prestige_emblem, level FROM users "
+        "WHERE server_id = ? AND prestige_monument IS NOT NULL "
+        "AND prestige_monument != '' ORDER BY level DESC LIMIT ?",
+        (
+            "user_id",
+            "name",
+            "prestige_monument",
+            "prestige_title",
+            "prestige_display_name",
+            "prestige_emblem",
+            "level",
+        ),
+        ("user_id",),
+        ("level",),
+        per_server=True,
+    ),
+}
+
+
+@dataclass
+class _Board:
+    spec: BoardSpec
+    rows: dict[tuple, dict] = field(default_factory=dict)
+    order: list[tuple] = field(default_factory=list)
+    # The load filled every slot, so rows outside it may exist: nobody
+    # outside ranks above ``floor`` (the last row's sort key).
+    full: bool = False
+    floor: tuple | None = None
+    loaded: bool = False
+    # Offers that arrived while a load was in flight, replayed onto it.
+    pending: list | None = None
+    # Bumped by invalidate(), so a load that read the discarded state does
+    # not leave the board marked loaded.
+    epoch: int = 0
+
+    def key(self, row: dict) -> tuple:
+        return tuple(row[c] for c in self.spec.sort_cols)
+
+    def resort(self) -> None:
+        self.order.sort(key=lambda rid: self.key(self.rows[rid]), reverse=True)
+
+    def install(self, rows: list, capacity: int) -> None:
+        self.rows = {}
+        self.order = []
+        for row in rows:
+            row = dict(row)
+            rid = tuple(row[c] for c in self.spec.id_cols)
+            self.rows[rid] = row
+            self.order.append(rid)
+        self.full = len(rows) >= capacity
+        self.floor = self.key(self.rows[self.order[-1]]) if self.full else None
+        self.loaded = True
+
+    def offer(self, rid: tuple, values: dict, capacity: int) -> bool:
+        """Applies a row's new values. Returns False when the board can no
+        longer vouch for its ranking and must be reloaded."""
+        row = self.rows.get(rid)
+        if row is not None:
+            row.update(values)
+            if self.spec.eligible is not None and not self.spec.eligible(row):
+                del self.rows[rid]
+                self.order.remove(rid)
+                return not self.full
+            self.resort()
+            # Dropped below rows that were never loaded.
+            return not (self.full and self.key(row) < self.floor)
+
+        try:
+            key = tuple(values[c] for c in self.spec.sort_cols)
+        except KeyError:
+            return True  # Sort key unknown; only members are adjusted.
+        if self.spec.eligible is not None and not self.spec.eligible(values):
+            return True
+        if self.full and key <= self.floor:
+            return True
+        if not all(c in values for c in self.spec.columns):
+            return False  # Belongs on the board, but cannot be displayed.
+        self.rows[rid] = {c: values[c] for c in self.spec.columns}
+        self.order.append(rid)
+        self.resort()
+        if len(self.order) > capacity:
+            del self.rows[self.order.pop()]
+        if self.full:
+            self.floor = self.key(self.rows[self.order[-1]])
+        return True
+
+
+class LeaderboardCache:
+    """Materialised top-``capacity`` rankings, served from memory.
+
+    Each board (see BOARDS; ``monuments`` is kept per server) is loaded once
+    through the writer and then kept current by the repository write paths
+    that touch its columns: they call offer() with the row's new values,
+    usually straight from the UPDATE's RETURNING clause. A row that climbs
+    above the board's last row joins it, and a member that falls below it
+    marks the board for reload, since someone never loaded may now outrank
+    it. Writes the hooks do not cover (admin edits, renames) are picked up
+    by reconcile(), which bot.py runs periodically. A rollback drops every
+    board, since offers made inside the transaction never happened.
+
+    Rows are plain dicts. Pages beyond ``capacity`` go straight to the
+    database.
+    """
+
+    def __init__(self, connection, capacity: int = 50):
+        self.connection = connection
+        self.capacity = capacity
+        self._boards: dict[tuple[str, str | None], _Board] = {}
+        self._locks: dict[tuple[str, str | None], asyncio.Lock] = {}
+        self.hits = 0
+        self.loads = 0
+        self.forced_reloads = 0
+
+    def _key(self, name: str, server_id: str | None) -> tuple[str, str | None]:
+        return (name, server_id if BOARDS[name].per_server else None)
+
+    async def top(
+        self,
+        name: str,
+        limit: int = 10,
+        offset: int = 0,
+        server_id: str | None = None,
+    ) -> list[dict]:
+        """Rows ``offset`` .. ``offset + limit`` of a board, best first."""
+        spec = BOARDS[name]
+        params = (server_id,) if spec.per_server else ()
+        if offset + limit > self.capacity:
+            rows = await self.connection.read_all(spec.sql, (*params, offset + limit))
+            return [dict(row) for row in rows[offset:]]
+
+        key = self._key(name, server_id)
+        board = self._boards.get(key)
+        if board is None:
+            board = self._boards[key] = _Board(spec)
+        if board.loaded:
+            self.hits += 1
+        else:
+            await self._load(key, board)
+        return [dict(board.rows[rid]) for rid in board.order[offset : offset + limit]]
+
+    async def _load(self, key: tuple[str, str | None], board: _Board) -> None:
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if board.loaded:
+                return
+            epoch = board.epoch
+            params = (key[1],) if board.spec.per_server else ()
+            board.pending = []
+            try:
+                # Not the read pool: it would miss a write that has run but
+                # not committed yet and whose offer() came before pending was
+                # registered. The writer sees those (and group commit's
+                # unflushed ones), and waits out other tasks' transactions.
+                async with self.connection.execute(
+                    board.spec.sql, (*params, self.capacity)
+                ) as cursor:
+                    rows = await cursor.fetchall()
+            finally:
+                pending, board.pending = board.pending, None
+            board.install(rows, self.capacity)
+            self.loads += 1
+            for rid, values in pending:
+                if not board.offer(rid, values, self.capacity):
+                    board.loaded = False
+                    break
+            if board.epoch != epoch:
+                # Serve what was read, but reload on the next request.
+                board.loaded = False
+
+    def offer(self, name: str, row: dict, server_id: str | None = None) -> None:
+        """New values for one row of ``name``: its id columns plus whichever
+        other columns the write knows."""
+        board = self._boards.get(self._key(name, server_id))
+        if board is None:
+            return
+        rid = tuple(row[c] for c in board.spec.id_cols)
+        if board.pending is not None:
+            board.pending.append((rid, dict(row)))
+        elif board.loaded and not board.offer(rid, row, self.capacity):
+            board.loaded = False
+            self.forced_reloads += 1
+
+    def adjust(self, name: str, row_id: tuple, column: str, delta: int) -> None:
+        """Relative change to a row, when the write does not know the new
+        value (e.g. gold spent). Only rows already on the board change; a
+        row outside it cannot climb on a decrease."""
+        board = self._boards.get((name, None))
+        if board is None:
+            return
+        if board.pending is not None:
+            board.epoch += 1  # A delta can't be replayed onto the load.
+            return
+        row = board.rows.get(row_id)
+        if board.loaded and row is not None:
+            self.offer(name, {**row, column: row[column] + delta})
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Drops ``name`` (every board by default); the next read reloads."""
+        for (board_name, _), board in self._boards.items():
+            if name is None or board_name == name:
+                board.loaded = False
+                board.epoch += 1
+
+    async def reconcile(self) -> int:
+        """Reloads every loaded board from the source tables. Returns how
+        many had drifted from them."""
+        drifted = 0
+        for key, board in list(self._boards.items()):
+            if not board.loaded:
+                continue
+            before = [board.rows[rid] for rid in board.order]
+            board.loaded = False
+            await self._load(key, board)
+            if [board.rows[rid] for rid in board.order] != before:
+                drifted += 1
+        return drifted
+
+    def stats(self) -> dict:
+        return {
+            "boards": sum(1 for b in self._boards.values() if b.loaded),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "loads": self.loads,
+            "forced_reloads": self.forced_reloads,
+        }
@@ -0,0 +1,296 @@
+"""
+database/migrations.py — Versioned schema migrations.
+
+schema.sql only ever creates missing tables (CREATE TABLE IF NOT EXISTS), so
+columns, renames and indexes added after a table first shipped are applied
+here instead. The schema version lives in SQLite's ``PRAGMA user_version``;
+run_migrations() applies every migration above it, each inside its own
+transaction that also bumps the version, so a crash mid-migration leaves the
+database at the previous version and the step is simply retried next boot.
+
+To change the schema, append a new Migration with the next version number.
+Never edit or reorder a migration that has already shipped.
+
+QUERY_PLAN_CHECKS pins the hot read paths to the indexes that serve them.
+check_query_plans() runs EXPLAIN QUERY PLAN over each one at startup so that
+a dropped index, or a query edited into a shape the index no longer covers,
+is reported instead of silently turning into a full table scan.
+"""
+
+import sqlite3
+from dataclasses import dataclass, field
+
+import aiosqlite
+
+from .leaderboards import BOARDS
+from .repositories.equipment import LOADOUT_SLOT_DEFS
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    statements: list[str]
+    # Error-message fragments that mean "this step already happened". Only
+    # the pre-versioning migrations need these: databases created before
+    # user_version was tracked may already have some of their changes.
+    already_applied: tuple[str, ...] = field(default=())
+
+
+_GEAR_TABLES = [table for _slot, _col, table in LOADOUT_SLOT_DEFS]
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(
+        version=1,
+        description="Columns added after the base schema.sql",
+        statements=[
+            "ALTER TABLE users ADD COLUMN combat_stamina INTEGER NOT NULL DEFAULT 10",
+            "ALTER TABLE users ADD COLUMN last_stamina_regen TIMESTAMP DEFAULT NULL",
+            # Maw rework: add fights_this_cycle cap tracking.
+            "ALTER TABLE maw_participants ADD COLUMN fights_this_cycle INTEGER NOT NULL DEFAULT 0",
+            # Maw rework: rename last_damage_check → last_fight_ts (SQLite 3.25+).
+            "ALTER TABLE maw_participants RENAME COLUMN last_damage_check TO last_fight_ts",
+            "ALTER TABLE uber_shrine_statues ADD COLUMN tier INTEGER NOT NULL DEFAULT 1",
+            "ALTER TABLE uber_shrine_statues ADD COLUMN slot_index INTEGER NOT NULL DEFAULT 0",
+            # Nether Market: expand rotation from 1 to 2 items per tier (lo = below
+            # true value, hi = above true value); old single cheap/med/expensive
+            # columns are left in place unused.
+            "ALTER TABLE nether_market_rotation ADD COLUMN cheap_lo_item TEXT",
+            "ALTER TABLE nether_market_rotation ADD COLUMN cheap_lo_price INTEGER",
+            "ALTER TABLE nether_market_rotation ADD COLUMN cheap_hi_item TEXT",
+            "ALTER TABLE nether_market_rotation ADD COLUMN cheap_hi_price INTEGER",
+            "ALTER TABLE nether_market_rotation ADD COLUMN med_lo_item TEXT",
+            "ALTER TABLE nether_market_rotation ADD COLUMN med_lo_price INTEGER",
+            "ALTER TABLE nether_market_rotation ADD COLUMN med_hi_item TEXT",
+            "ALTER TABLE nether_market_rotation ADD COLUMN med_hi_price INTEGER",
+            "ALTER TABLE nether_market_rotation ADD COLUMN expensive_lo_item TEXT",
+            "ALTER TABLE nether_market_rotation ADD COLUMN expensive_lo_price INTEGER",
+            "ALTER TABLE nether_market_rotation ADD COLUMN expensive_hi_item TEXT",
+            "ALTER TABLE nether_market_rotation ADD COLUMN expensive_hi_price INTEGER",
+            # Nether Market: one-shot notice shown next time a plundered victim opens /nether.
+            "ALTER TABLE nether_market_profile ADD COLUMN pending_plunder_notice TEXT DEFAULT NULL",
+            # Corrupted Monsters / Paradise moved to level 70: new player settings.
+            "ALTER TABLE users ADD COLUMN corrupted_encounters_enabled INTEGER NOT NULL DEFAULT 1",
+            "ALTER TABLE users ADD COLUMN auto_potion_reload INTEGER NOT NULL DEFAULT 0",
+            # Prestige rework: emoji "Emblem" cosmetic (replaces title/flair catalogues).
+            "ALTER TABLE users ADD COLUMN prestige_emblem TEXT DEFAULT NULL",
+            # Rite of Convergence: 5 tradeable entry keys.
+            "ALTER TABLE player_currencies ADD COLUMN rite_key_apex_of_dreams INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE player_currencies ADD COLUMN rite_key_corruption_of_memories INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE player_currencies ADD COLUMN rite_key_scales_of_judgment INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE player_currencies ADD COLUMN rite_key_devoid_of_thoughts INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE player_currencies ADD COLUMN rite_key_zenith_of_nightmares INTEGER NOT NULL DEFAULT 0",
+        ],
+        # Fresh databases get these columns from schema.sql; older ones picked
+        # them up from the unversioned ALTER list this migration replaces.
+        already_applied=("duplicate column name", "no such column"),
+    ),
+    Migration(
+        version=2,
+        description="Fold single-slot player_artefacts into rite_artefact_items",
+        statements=[
+            # Skips any user/server already present in rite_artefact_items, so
+            # databases that ran this before versioning are left untouched.
+            """INSERT INTO rite_artefact_items
+                   (user_id, server_id, artefact_key, roll_1, roll_2, roll_3, is_equipped)
+               SELECT pa.user_id, pa.server_id, pa.artefact_key,
+                      pa.roll_1, pa.roll_2, pa.roll_3, 1
+               FROM player_artefacts pa
+               WHERE NOT EXISTS (
+                   SELECT 1 FROM rite_artefact_items ri
+                   WHERE ri.user_id = pa.user_id AND ri.server_id = pa.server_id
+               )""",
+        ],
+    ),
+    Migration(
+        version=3,
+        description="Indexes for gear, companion, leaderboard and Maw lookups",
+        statements=[
+            # Inventory listings filter on user_id; loading a player filters on
+            # user_id AND is_equipped = 1. One index serves both.
+            *(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_user_equipped "
+                f"ON {table}(user_id, is_equipped)"
+                for table in _GEAR_TABLES
+            ),
+            "CREATE INDEX IF NOT EXISTS idx_companions_user_active "
+            "ON companions(user_id, is_active)",
+            "CREATE INDEX IF NOT EXISTS idx_user_partners_user "
+            "ON user_partners(user_id, partner_id)",
+            # Leaderboards read the top N rows in index order instead of
+            # sorting the whole users table. The narrower boards are covering.
+            "CREATE INDEX IF NOT EXISTS idx_users_level_board "
+            "ON users(level DESC, ascension DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_users_ascension_board "
+            "ON users(highest_ascension_stage DESC, level DESC, name)",
+            "CREATE INDEX IF NOT EXISTS idx_users_gold_board "
+            "ON users(gold DESC, name)",
+            "CREATE INDEX IF NOT EXISTS idx_duel_stats_wins_board "
+            "ON duel_stats(wins DESC, user_id, losses)",
+            # Only profiles past level 1 ever appear on the slayer board.
+            "CREATE INDEX IF NOT EXISTS idx_slayer_profiles_board "
+            "ON slayer_profiles(level DESC, xp DESC) WHERE level > 1",
+            "CREATE INDEX IF NOT EXISTS idx_maw_participants_cycle_damage "
+            "ON maw_participants(cycle_id, damage_dealt DESC, user_id)",
+        ],
+    ),
+    Migration(
+        version=4,
+        description="Cached Deep Reserves chance on inner_sanctum",
+        statements=[
+            # Left NULL here; regen_stamina_tick derives it from nodes_owned.
+            "ALTER TABLE inner_sanctum ADD COLUMN stamina_regen_bonus_chance REAL DEFAULT NULL",
+        ],
+        already_applied=("duplicate column name",),
+    ),
+    Migration(
+        version=5,
+        description="Indexes for per-skill gathering rows",
+        statements=[
+            # The skill tables have no primary key; every per-player read and
+            # the batched hourly tick's UPDATEs look rows up by this pair.
+            *(
+                f"CREATE INDEX IF NOT EXISTS idx_{skill}_user_server "
+                f"ON {skill}(user_id, server_id)"
+                for skill in ("mining", "fishing", "woodcutting")
+            ),
+        ],
+    ),
+    Migration(
+        version=6,
+        description="Keyset index for paged inventory listings",
+        statements=[
+            # Serves EquipmentRepository.get_page's ORDER BY is_equipped DESC,
+            # item_level DESC, item_id DESC straight from the index, and the
+            # equipped-item lookups idx_{table}_user_equipped used to.
+            *(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_user_listing "
+                f"ON {table}(user_id, is_equipped, item_level, item_id)"
+                for table in _GEAR_TABLES
+            ),
+            *(f"DROP INDEX IF EXISTS idx_{table}_user_equipped" for table in _GEAR_TABLES),
+        ],
+    ),
+]
+
+
+# (description, query, params, index the plan must use)
+QUERY_PLAN_CHECKS: list[tuple[str, str, tuple, str]] = [
+    *(
+        (
+            f"equipped {slot}",
+            f"SELECT * FROM {table} WHERE user_id = ? AND is_equipped = 1",
+            ("0",),
+            f"idx_{table}_user_listing",
+        )
+        for slot, _col, table in LOADOUT_SLOT_DEFS
+    ),
+    *(
+        (
+            f"{slot} inventory page",
+            f"SELECT item_id FROM {table} WHERE user_id = ? "
+            "AND (is_equipped, item_level, item_id) < (?, ?, ?) "
+            "ORDER BY is_equipped DESC, item_level DESC, item_id DESC LIMIT ?",
+            ("0", 0, 0, 0, 25),
+            f"idx_{table}_user_listing",
+        )
+        for slot, _col, table in LOADOUT_SLOT_DEFS
+    ),
+    (
+        "active companions",
+        "SELECT * FROM companions WHERE user_id = ? AND is_active = 1",
+        ("0",),
+        "idx_companions_user_active",
+    ),
+    (
+        "active partner",
+        "SELECT * FROM user_partners WHERE user_id = ? AND is_active_combat = 1",
+        ("0",),
+        "idx_user_partners_user",
+    ),
+    # The leaderboards are checked with the SQL LeaderboardCache actually runs.
+    *(
+        (
+            f"{board} leaderboard",
+            BOARDS[board].sql,
+            (10,),
+            index,
+        )
+        for board, index in (
+            ("levels", "idx_users_level_board"),
+            ("ascensions", "idx_users_ascension_board"),
+            ("wealth", "idx_users_gold_board"),
+            ("duels", "idx_duel_stats_wins_board"),
+            ("slayer", "idx_slayer_profiles_board"),
+        )
+    ),
+    *(
+        (
+            f"{skill} row",
+            f"SELECT * FROM {skill} WHERE user_id=? AND server_id=?",
+            ("0", "0"),
+            f"idx_{skill}_user_server",
+        )
+        for skill in ("mining", "fishing", "woodcutting")
+    ),
+    (
+        "maw top damage",
+        "SELECT user_id FROM maw_participants "
+        "WHERE cycle_id = ? ORDER BY damage_dealt DESC LIMIT ?",
+        (0, 3),
+        "idx_maw_participants_cycle_damage",
+    ),
+]
+
+
+def _already_applied(migration: Migration, error: Exception) -> bool:
+    message = str(error).lower()
+    return any(fragment in message for fragment in migration.already_applied)
+
+
+async def get_schema_version(db: aiosqlite.Connection) -> int:
+    async with db.execute("PRAGMA user_version") as cursor:
+        row = await cursor.fetchone()
+    return row[0]
+
+
+async def run_migrations(db: aiosqlite.Connection) -> list[Migration]:
+    """Applies every migration newer than the database's user_version.
+
+    Returns the migrations that were applied (empty when already current).
+    A failing statement rolls its whole migration back and re-raises.
+    """
+    current = await get_schema_version(db)
+    applied = []
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        if migration.version <= current:
+            continue
+        await db.execute("BEGIN")
+        try:
+            for stmt in migration.statements:
+                try:
+                    await db.execute(stmt)
+                except sqlite3.OperationalError as e:
+                    if not _already_applied(migration, e):
+                        raise
+            # PRAGMA arguments cannot be bound; version is always an int.
+            await db.execute(f"PRAGMA user_version = {int(migration.version)}")
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        applied.append(migration)
+    return applied
+
+
+async def check_query_plans(db: aiosqlite.Connection) -> list[str]:
+    """Returns one message per QUERY_PLAN_CHECKS entry whose plan does not use
+    its expected index (an empty list means every hot path is indexed)."""
+    problems = []
+    for description, query, params, index in QUERY_PLAN_CHECKS:
+        async with db.execute(f"EXPLAIN QUERY PLAN {query}", params) as cursor:
+            details = [row[-1] for row in await cursor.fetchall()]
+        if not any(index in detail for detail in details):
+            problems.append(f"{description}: expected {index}, got {'; '.join(details)}")
+    return problems
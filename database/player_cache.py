@@ -0,0 +1,171 @@
+# database/player_cache.py
+
+import copy
+import time
+from collections import OrderedDict
+
+# Sections holding sqlite3.Row objects (or plain containers of them). Rows are
+# immutable, so clones share them; everything else is deep-copied on read
+# because combat mutates it in place (paradise skill charges, equipped parts…).
+_SHARED_SECTIONS = frozenset({"gear", "active_companions", "refs"})
+
+
+class PlayerSnapshotCache:
+    """LRU + TTL cache of PlayerSnapshotRepository.fetch() results.
+
+    Keyed by (user_id, server_id). Each user has a version counter that
+    repository write paths bump via invalidate(); an entry is only served
+    while its stored version still matches, so a snapshot read that raced
+    a write is discarded instead of served stale.
+
+    Writes that only know a row id (item_id, companion id…) call
+    invalidate_ref(table, row_id). Only rows that are part of a cached
+    snapshot can change it — an unequipped sword being forged cannot — so
+    the cache keeps a reverse index from those rows to their owner and
+    ignores the rest.
+
+    The cache sits below load_player rather than caching Player objects:
+    a Player also carries the volatile users row (hp, exp, potions) that
+    changes every fight, so load_player still builds a fresh Player — with
+    a fresh CombatState — from the caller's users row and a copy of the
+    cached snapshot.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._ref_owner: dict[tuple, str] = {}
+        # Bumped by clear(), so a read still in flight when a rollback wiped
+        # the cache cannot repopulate it with rolled-back data.
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    # ------------------------------------------------------------------
+    # Read / populate
+    # ------------------------------------------------------------------
+
+    def version(self, user_id: str) -> tuple[int, int]:
+        """Opaque token to take before a read and hand back to put()."""
+        return (self._epoch, self._versions.get(str(user_id), 0))
+
+    def get(self, user_id: str, server_id: str) -> dict | None:
+        """Returns a private copy of the cached snapshot, or None on a miss."""
+        key = (str(user_id), str(server_id))
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        version, expires_at, snapshot = entry
+        if version != self.version(user_id):
+            self._drop(key)
+            self.misses += 1
+            return None
+        if time.monotonic() >= expires_at:
+            self._drop(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return self.clone(snapshot)
+
+    def put(self, user_id: str, server_id: str, version: tuple, snapshot: dict) -> None:
+        """Stores a snapshot read at ``version`` (taken *before* the read).
+        Snapshots with failed sections are never cached."""
+        if self.max_entries <= 0 or snapshot["errors"]:
+            return
+        if version != self.version(user_id):
+            return  # a write landed while this snapshot was being read
+        key = (str(user_id), str(server_id))
+        self._drop(key)
+        self._entries[key] = (version, time.monotonic() + self.ttl_seconds, snapshot)
+        for ref in snapshot.get("refs", ()):
+            self._ref_owner[ref] = key[0]
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+        if len(self._ref_owner) > 64 * self.max_entries:
+            self._rebuild_refs()
+
+    @staticmethod
+    def clone(snapshot: dict) -> dict:
+        return {
+            k: (v if k in _SHARED_SECTIONS else copy.deepcopy(v))
+            for k, v in snapshot.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate(self, user_id: str) -> None:
+        """Bumps the user's version; every cached snapshot of theirs goes stale."""
+        user_id = str(user_id)
+        self._versions[user_id] = self._versions.get(user_id, 0) + 1
+        self.invalidations += 1
+
+    def patch(self, user_id: str, section: str, fn) -> None:
+        """Write-through for hot writes that fire every fight (partner exp,
+        paradise charges): replaces ``section`` in each cached snapshot of
+        the user with ``fn(old_value)`` instead of discarding the snapshot.
+
+        The version is still bumped — patched entries are re-stamped with the
+        new one — so a read that was in flight during the write is refused
+        by put() rather than cached without the patch.
+        """
+        self.invalidate(user_id)
+        user_id = str(user_id)
+        version = self.version(user_id)
+        for key, (_v, expires_at, snapshot) in self._entries.items():
+            if key[0] == user_id and section in snapshot:
+                snapshot[section] = fn(snapshot[section])
+                self._entries[key] = (version, expires_at, snapshot)
+
+    def invalidate_ref(self, table: str, row_id) -> None:
+        """Invalidates the owner of a row, if that row is in a cached snapshot."""
+        owner = self._ref_owner.get((table, row_id))
+        if owner is not None:
+            self.invalidate(owner)
+
+    def clear(self) -> None:
+        """Drops everything (used when a rollback may have undone cached reads)."""
+        self._epoch += 1
+        self._entries.clear()
+        self._ref_owner.clear()
+
+    def _drop(self, key: tuple) -> None:
+        # The reverse index is left alone here: the same user may still have
+        # an entry for another server holding those rows. A stale ref only
+        # costs a spurious invalidation; put() trims the index periodically.
+        self._entries.pop(key, None)
+
+    def _rebuild_refs(self) -> None:
+        self._ref_owner = {
+            ref: key[0]
+            for key, (_v, _exp, snapshot) in self._entries.items()
+            for ref in snapshot.get("refs", ())
+        }
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
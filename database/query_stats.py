@@ -0,0 +1,150 @@
+# database/query_stats.py
+from __future__ import annotations
+
+import json
+import re
+import sys
+import time
+from collections import deque
+
+_WS_RE = re.compile(r"\s+")
+_STR_RE = re.compile(r"'(?:[^']|'')*'")
+_NUM_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+# Frames in these modules are plumbing, never the caller being attributed.
+_PLUMBING = frozenset({"database.base", "database.read_pool", "database.query_stats"})
+
+
+def normalise(sql: str) -> str:
+    """One key per statement shape: whitespace collapsed, literals and IN
+    lists replaced by placeholders."""
+    sql = _WS_RE.sub(" ", sql).strip()
+    sql = _STR_RE.sub("?", sql)
+    sql = _NUM_RE.sub("?", sql)
+    return _IN_RE.sub("(?, ...)", sql)
+
+
+def _caller() -> str:
+    """The repository method (Class.method) that issued the statement, or
+    module:function for code outside database/."""
+    frame = sys._getframe(2)
+    for _ in range(12):
+        if frame is None:
+            break
+        module = frame.f_globals.get("__name__", "")
+        if module not in _PLUMBING:
+            owner = frame.f_locals.get("self")
+            if owner is not None and module.startswith("database"):
+                return f"{type(owner).__name__}.{frame.f_code.co_name}"
+            return f"{module}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "?"
+
+
+class _Entry:
+    __slots__ = ("count", "total_ms", "wait_ms", "samples")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.total_ms = 0.0
+        self.wait_ms = 0.0
+        self.samples: deque[float] = deque(maxlen=window)
+
+
+class QueryStats:
+    """Per-statement timing for the shared connection and the read pool.
+
+    Statements are keyed by (calling repository method, normalised SQL).
+    Each key keeps a count, total execution time, time spent waiting behind
+    another task's transaction (``_tx_lock``), and the last ``window``
+    durations for p50/p95/p99. Times cover ``execute`` itself, which for a
+    SELECT includes the first step (where SQLite does its sorting); rows
+    fetched afterwards are not timed.
+
+    With ``slow_log_path`` set, every statement slower than ``slow_ms``
+    (execution plus wait) is appended to that file as one JSON line.
+    Parameters are never logged.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = 1000,
+        slow_ms: float = 100.0,
+        slow_log_path: str | None = None,
+    ):
+        self.window = window
+        self.slow_ms = slow_ms
+        self.slow_log_path = slow_log_path
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        self._normalised: dict[str, str] = {}
+        self.tx_wait_ms = 0.0
+        self.tx_waits = 0
+        self.slow_logged = 0
+
+    def start(self) -> tuple[str, float]:
+        """Captures the caller; call first thing, before any await."""
+        return _caller(), time.perf_counter()
+
+    def record(self, token: tuple[str, float], sql: str, wait_ms: float = 0.0) -> None:
+        caller, started = token
+        elapsed = (time.perf_counter() - started) * 1000 - wait_ms
+        key_sql = self._normalised.get(sql)
+        if key_sql is None:
+            key_sql = normalise(sql)
+            if len(self._normalised) < 4096:
+                self._normalised[sql] = key_sql
+        entry = self._entries.get((caller, key_sql))
+        if entry is None:
+            entry = self._entries[(caller, key_sql)] = _Entry(self.window)
+        entry.count += 1
+        entry.total_ms += elapsed
+        entry.samples.append(elapsed)
+        if wait_ms:
+            entry.wait_ms += wait_ms
+            self.tx_wait_ms += wait_ms
+            self.tx_waits += 1
+        if self.slow_log_path and elapsed + wait_ms >= self.slow_ms:
+            self._log_slow(caller, key_sql, elapsed, wait_ms)
+
+    def _log_slow(self, caller: str, sql: str, elapsed: float, wait_ms: float):
+        line = {
+            "ts": time.time(),
+            "caller": caller,
+            "sql": sql,
+            "ms": round(elapsed, 3),
+            "wait_ms": round(wait_ms, 3),
+        }
+        try:
+            with open(self.slow_log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(line) + "\n")
+            self.slow_logged += 1
+        except OSError:
+            pass
+
+    def top(self, limit: int = 10, *, by: str = "total_ms") -> list[dict]:
+        """The ``limit`` heaviest statements, sorted by ``by`` (any key of
+        the returned dicts)."""
+        rows = []
+        for (caller, sql), entry in self._entries.items():
+            samples = sorted(entry.samples)
+            n = len(samples)
+
+            def pct(q: float) -> float:
+                return samples[min(n - 1, int(q * n))] if n else 0.0
+
+            rows.append(
+                {
+                    "caller": caller,
+                    "sql": sql,
+                    "count": entry.count,
+                    "total_ms": entry.total_ms,
+                    "wait_ms": entry.wait_ms,
+                    "p50_ms": pct(0.50),
+                    "p95_ms": pct(0.95),
+                    "p99_ms": pct(0.99),
+                }
+            )
+        rows.sort(key=lambda r: r[by], reverse=True)
+        return rows[:limit]
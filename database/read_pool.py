@@ -0,0 +1,88 @@
+# database/read_pool.py
+from __future__ import annotations
+
+import pathlib
+import sqlite3
+
+import aiosqlite
+
+from .base import ConnectionStats
+
+
+def _fetchall(conn, sql: str, params) -> list:
+    return conn.execute(sql, params).fetchall()
+
+
+def _fetchone(conn, sql: str, params):
+    return conn.execute(sql, params).fetchone()
+
+
+class _Reader:
+    __slots__ = ("conn", "stats")
+
+    def __init__(self, conn: aiosqlite.Connection):
+        self.conn = conn
+        self.stats = ConnectionStats()
+
+
+class ReadPool:
+    """A few read-only connections to the same WAL database.
+
+    Every repository shares one aiosqlite connection, and so one worker
+    thread: a leaderboard SELECT queues behind whatever settlement turn or
+    skills tick is writing, and waits out any managed transaction in flight.
+    Readers are opened ``mode=ro`` with ``query_only`` set, each with its own
+    worker thread. Under WAL they read the last committed state without
+    blocking the writer or each other.
+
+    Only display reads go through the pool (GuardedConnection.read_all /
+    read_one / run_read). A task that owns a transaction, or a bot without
+    a pool (in-memory databases), reads on the writer as before.
+    """
+
+    def __init__(self, path: str, size: int = 3):
+        self.path = path
+        self.size = max(1, size)
+        self._readers: list[_Reader] = []
+        # Shared with the writer's GuardedConnection when attached.
+        self.query_stats = None
+
+    async def open(self) -> None:
+        uri = pathlib.Path(self.path).resolve().as_uri() + "?mode=ro"
+        for _ in range(self.size):
+            conn = await aiosqlite.connect(uri, uri=True)
+            conn.row_factory = sqlite3.Row
+            await conn.execute("PRAGMA query_only=1")
+            await conn.execute("PRAGMA busy_timeout=30000")
+            self._readers.append(_Reader(conn))
+
+    async def close(self) -> None:
+        readers, self._readers = self._readers, []
+        for reader in readers:
+            try:
+                await reader.conn.close()
+            except Exception:
+                pass
+
+    async def run(self, fn, *args, label: str | None = None):
+        """Runs ``fn(sqlite3_connection, *args)`` on the least busy reader's
+        worker thread, all of it in one hop."""
+        qs = self.query_stats
+        token = qs.start() if qs is not None else None
+        reader = min(self._readers, key=lambda r: r.stats.in_flight)
+        started = reader.stats.begin()
+        try:
+            return await reader.conn._execute(fn, reader.conn._conn, *args)
+        finally:
+            reader.stats.end(started)
+            if token is not None:
+                qs.record(token, label or f"run_read {fn.__qualname__}")
+
+    async def fetchall(self, sql: str, params=()) -> list:
+        return await self.run(_fetchall, sql, params, label=sql)
+
+    async def fetchone(self, sql: str, params=()):
+        return await self.run(_fetchone, sql, params, label=sql)
+
+    def stats(self) -> list[dict]:
+        return [reader.stats.snapshot() for reader in self._readers]
@@ -45,6 +45,22 @@ _SKILL_COLUMNS = frozenset(
 )
 _UBER_COLUMNS = frozenset({"capricious_carp", "blessed_bismuth", "sparkling_sprig"})
 
+POTION_PASSIVES_SQL = (
+    "SELECT slot, passive_type, passive_value, passive_duration FROM potion_passives "
+    "WHERE user_id = ? ORDER BY slot"
+)
+
+
+def _potion_passive_from_row(r) -> dict:
+    return {
+        "slot": r["slot"],
+        "passive_type": r["passive_type"],
+        "passive_value": r["passive_value"],
+        "passive_duration": r["passive_duration"]
+        if r["passive_duration"] is not None
+        else 2.0,
+    }
+
 
 class AlchemyRepository(BaseRepository):
     _passive_duration_col_added: bool = False
@@ -132,23 +148,9 @@ class AlchemyRepository(BaseRepository):
     async def get_potion_passives(self, user_id: str) -> List[dict]:
         """Returns [{slot, passive_type, passive_value, passive_duration}, ...] ordered by slot."""
         await self._ensure_passive_duration_column()
-        async with self.connection.execute(
-            "SELECT slot, passive_type, passive_value, passive_duration FROM potion_passives "
-            "WHERE user_id = ? ORDER BY slot",
-            (user_id,),
-        ) as cursor:
+        async with self.connection.execute(POTION_PASSIVES_SQL, (user_id,)) as cursor:
             rows = await cursor.fetchall()
-        return [
-            {
-                "slot": r["slot"],
-                "passive_type": r["passive_type"],
-                "passive_value": r["passive_value"],
-                "passive_duration": r["passive_duration"]
-                if r["passive_duration"] is not None
-                else 2.0,
-            }
-            for r in rows
-        ]
+        return [_potion_passive_from_row(r) for r in rows]
 
     async def set_passive(
         self,
@@ -169,6 +171,7 @@ class AlchemyRepository(BaseRepository):
             (user_id, slot, passive_type, passive_value, passive_duration),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def delete_passive(self, user_id: str, slot: int) -> None:
         await self.connection.execute(
@@ -176,6 +179,7 @@ class AlchemyRepository(BaseRepository):
             (user_id, slot),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     # ------------------------------------------------------------------
     # Transmutation helpers
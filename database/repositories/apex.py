@@ -33,6 +33,15 @@ _META_KEYS = (
 )
 
 
+def _empty_soul_stone(user_id: str, server_id: str) -> dict:
+    row = {"user_id": user_id, "server_id": server_id}
+    for n in (1, 2, 3):
+        row[f"slot_{n}_passive"] = None
+        row[f"slot_{n}_tier"] = None
+        row[f"slot_{n}_category"] = None
+    return row
+
+
 class ApexRepository(BaseRepository):
     # ------------------------------------------------------------------
     # Hunt Profile
@@ -140,19 +149,7 @@ class ApexRepository(BaseRepository):
             (user_id, server_id),
         )
         await self.connection.commit()
-        return {
-            "user_id": user_id,
-            "server_id": server_id,
-            "slot_1_passive": None,
-            "slot_1_tier": None,
-            "slot_1_category": None,
-            "slot_2_passive": None,
-            "slot_2_tier": None,
-            "slot_2_category": None,
-            "slot_3_passive": None,
-            "slot_3_tier": None,
-            "slot_3_category": None,
-        }
+        return _empty_soul_stone(user_id, server_id)
 
     async def set_slot(
         self,
@@ -171,6 +168,7 @@ class ApexRepository(BaseRepository):
             (passive, tier, category, user_id, server_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def clear_slot(self, user_id: str, server_id: str, slot: int) -> None:
         await self.get_or_create_soul_stone(user_id, server_id)
@@ -181,6 +179,7 @@ class ApexRepository(BaseRepository):
             (user_id, server_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def upgrade_slot_tier(
         self, user_id: str, server_id: str, slot: int, new_tier: int
@@ -191,6 +190,7 @@ class ApexRepository(BaseRepository):
             (new_tier, user_id, server_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     # ------------------------------------------------------------------
     # Shards
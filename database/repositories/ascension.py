@@ -31,3 +31,4 @@ class AscensionRepository(BaseRepository):
             (user_id, floor),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
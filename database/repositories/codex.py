@@ -137,6 +137,7 @@ class CodexRepository:
             (user_id, slot, passive_type),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return CodexTome(slot=slot, passive_type=passive_type, tier=0, value=0.0)
 
     async def upgrade_tome(self, user_id: str, slot: int) -> tuple[bool, float]:
@@ -161,6 +162,7 @@ class CodexRepository:
             (new_tier, new_value, user_id, slot),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return True, new_value
 
     async def reroll_tome_value(self, user_id: str, slot: int) -> tuple[bool, float]:
@@ -184,6 +186,7 @@ class CodexRepository:
             (new_value, user_id, slot),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return True, new_value
 
     async def reroll_tome_type(self, user_id: str, slot: int) -> tuple[bool, str]:
@@ -213,6 +216,7 @@ class CodexRepository:
             (new_type, user_id, slot),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return True, new_type
 
     # ------------------------------------------------------------------
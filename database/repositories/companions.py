@@ -66,6 +66,7 @@ class CompanionRepository:
             (companion_id, user_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def set_active(
         self,
@@ -99,6 +100,7 @@ class CompanionRepository:
             (val, companion_id, user_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return True
 
     async def add_exp(self, companion_id: int, amount: int) -> None:
@@ -107,6 +109,7 @@ class CompanionRepository:
             "UPDATE companions SET exp = exp + ? WHERE id = ?", (amount, companion_id)
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref("companions", companion_id)
 
     async def level_up(self, companion_id: int) -> None:
         """Increments level."""
@@ -114,6 +117,7 @@ class CompanionRepository:
             "UPDATE companions SET level = level + 1 WHERE id = ?", (companion_id,)
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref("companions", companion_id)
 
     async def update_passive(self, companion_id: int, p_type: str, p_tier: int) -> None:
         """Rerolls the passive."""
@@ -122,6 +126,7 @@ class CompanionRepository:
             (p_type, p_tier, companion_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref("companions", companion_id)
 
     async def update_balanced_passive(
         self, companion_id: int, b_type: str, b_tier: int
@@ -132,12 +137,14 @@ class CompanionRepository:
             (b_type, b_tier, companion_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref("companions", companion_id)
 
     async def rename(self, companion_id: int, new_name: str) -> None:
         await self.connection.execute(
             "UPDATE companions SET name = ? WHERE id = ?", (new_name, companion_id)
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref("companions", companion_id)
 
     async def update_stats(
         self, companion_id: int, new_level: int, new_exp: int
@@ -148,6 +155,7 @@ class CompanionRepository:
             (new_level, new_exp, companion_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref("companions", companion_id)
 
     async def fuse_companions(
         self, user_id: str, id_a: int, id_b: int, new_stats: dict, cost: int
@@ -158,7 +166,7 @@ class CompanionRepository:
         rolled back atomically if any step fails.
         """
         # new_stats dict keys: name, species, image_url, passive_type, passive_tier, level, exp
-        try:
+        async with self.connection.transaction():
             # 1. Deduct Gold (guard prevents going negative)
             cursor = await self.connection.execute(
                 "UPDATE users SET gold = gold - ? WHERE user_id = ? AND gold >= ?",
@@ -192,11 +200,8 @@ class CompanionRepository:
                     new_stats.get("balanced_passive_tier", 0),
                 ),
             )
-
-            await self.connection.commit()
-        except Exception:
-            await self.connection.rollback()
-            raise
+        self.connection.player_cache.invalidate(user_id)
+        self.connection.leaderboards.adjust("wealth", (user_id,), "gold", -cost)
 
     # ------------------------------------------------------------------
     # Companion Mastery
@@ -257,6 +262,7 @@ class CompanionRepository:
             (json.dumps(nodes), cost, cost, user_id, server_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return True
 
     async def update_mastery_node_choice(
@@ -280,6 +286,7 @@ class CompanionRepository:
             (json.dumps(nodes), user_id, server_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return True
 
     async def spend_kinship_points(
@@ -13,13 +13,18 @@ class DuelStatsRepository:
     async def record_result(self, winner_id: str, loser_id: str) -> None:
         await self._ensure_row(winner_id)
         await self._ensure_row(loser_id)
-        await self.connection.execute(
-            "UPDATE duel_stats SET wins = wins + 1 WHERE user_id = ?", (winner_id,)
-        )
-        await self.connection.execute(
-            "UPDATE duel_stats SET losses = losses + 1 WHERE user_id = ?", (loser_id,)
-        )
+        rows = []
+        for sql, user_id in (
+            ("UPDATE duel_stats SET wins = wins + 1 WHERE user_id = ?", winner_id),
+            ("UPDATE duel_stats SET losses = losses + 1 WHERE user_id = ?", loser_id),
+        ):
+            cursor = await self.connection.execute(
+                sql + " RETURNING user_id, wins, losses", (user_id,)
+            )
+            rows.append(await cursor.fetchone())
         await self.connection.commit()
+        for row in rows:
+            self.connection.leaderboards.offer("duels", dict(row))
 
     async def get_stats(self, user_id: str):
         """Returns (wins, losses) for a user, or (0, 0) if not found."""
@@ -30,9 +35,5 @@ class DuelStatsRepository:
         return row if row else (0, 0)
 
     async def get_leaderboard(self, limit: int = 10):
-        """Returns [(user_id, wins, losses), ...] ordered by wins desc."""
-        async with self.connection.execute(
-            "SELECT user_id, wins, losses FROM duel_stats ORDER BY wins DESC LIMIT ?",
-            (limit,),
-        ) as cursor:
-            return await cursor.fetchall()
+        """Returns [{user_id, wins, losses}, ...] ordered by wins desc."""
+        return await self.connection.leaderboards.top("duels", limit)
@@ -75,6 +75,7 @@ class EquipmentRepository:
             f"UPDATE {table} SET is_equipped = 1 WHERE item_id = ?", (item_id,)
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def unequip(self, user_id: str, item_type: ItemType) -> None:
         """Unequips item of type."""
@@ -84,6 +85,7 @@ class EquipmentRepository:
             (user_id,),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def discard(self, item_id: int, item_type: ItemType) -> None:
         """Permanently delete an item."""
@@ -92,6 +94,7 @@ class EquipmentRepository:
             f"DELETE FROM {table} WHERE item_id = ?", (item_id,)
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref(table, item_id)
 
     async def transfer(
         self, item_id: int, new_user_id: str, item_type: ItemType
@@ -104,6 +107,7 @@ class EquipmentRepository:
             (new_user_id, item_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref(table, item_id)
 
     async def get_count(self, user_id: str, item_type: ItemType) -> int:
         """Count items of a type (for inventory limits)."""
@@ -114,6 +118,148 @@ class EquipmentRepository:
         res = await rows.fetchone()
         return res[0] if res else 0
 
+    # ---------------------------------------------------------
+    # Paged Listing (gear view)
+    # ---------------------------------------------------------
+
+    # What the gear list renders (select label and one-line summary) plus the
+    # columns the core.items.factory builders require. Models built from
+    # these rows are for display only; get_by_id has the full row.
+    _LIST_COLUMNS = {
+        "items": (
+            "item_id, user_id, item_name, item_level, attack, defence, rarity, "
+            "base_rarity, passive, pinnacle_passive, utmost_passive, "
+            "infernal_passive, forges_remaining, refines_remaining, "
+            "refinement_lvl, is_equipped"
+        ),
+        "armor": (
+            "item_id, user_id, item_name, item_level, main_stat_type, main_stat, "
+            "block, evasion, ward, pdr, fdr, armor_passive, "
+            "celestial_armor_passive, temper_remaining, imbue_remaining, "
+            "reinforcement_lvl, is_equipped"
+        ),
+        "accessories": (
+            "item_id, user_id, item_name, item_level, attack, defence, rarity, "
+            "ward, crit, passive, passive_lvl, void_passive, potential_remaining, "
+            "is_equipped"
+        ),
+        "gloves": (
+            "item_id, user_id, item_name, item_level, attack, defence, ward, pdr, "
+            "fdr, passive, passive_lvl, potential_remaining, reinforcement_lvl, "
+            "is_equipped"
+        ),
+        "boots": (
+            "item_id, user_id, item_name, item_level, attack, defence, ward, pdr, "
+            "fdr, passive, passive_lvl, potential_remaining, reinforcement_lvl, "
+            "is_equipped"
+        ),
+        "helmets": (
+            "item_id, user_id, item_name, item_level, defence, ward, pdr, fdr, "
+            "passive, passive_lvl, potential_remaining, reinforcement_lvl, "
+            "is_equipped"
+        ),
+    }
+
+    async def get_page(
+        self,
+        user_id: str,
+        item_type: ItemType,
+        *,
+        after: Optional[Tuple[int, int, int]] = None,
+        limit: int = 25,
+    ) -> List[Tuple]:
+        """One page of a user's items: equipped first, then highest level,
+        newest first on ties. ``after`` is the (is_equipped, level, item_id)
+        of the previous page's last row; the index seeks straight to it, so
+        every page costs the same however many items precede it."""
+        table = self.tables[item_type]
+        sql = f"SELECT {self._LIST_COLUMNS[table]} FROM {table} WHERE user_id = ?"
+        params: tuple = (user_id,)
+        if after is not None:
+            sql += " AND (is_equipped, item_level, item_id) < (?, ?, ?)"
+            params += tuple(after)
+        sql += " ORDER BY is_equipped DESC, item_level DESC, item_id DESC LIMIT ?"
+        return await self.connection.read_all(sql, (*params, limit))
+
+    async def get_inventory_summary(self, user_id: str) -> dict:
+        """{item_type: (count, equipped full row or None)} for the six gear
+        slots, read in one hop."""
+        slots = [(slot, table) for slot, _col, table in LOADOUT_SLOT_DEFS]
+
+        def _read(conn):
+            summary = {}
+            for slot, table in slots:
+                count = conn.execute(
+                    f"SELECT COUNT(*) FROM {table} WHERE user_id = ?", (user_id,)
+                ).fetchone()[0]
+                equipped = conn.execute(
+                    f"SELECT * FROM {table} WHERE user_id = ? AND is_equipped = 1",
+                    (user_id,),
+                ).fetchone()
+                summary[slot] = (count, equipped)
+            return summary
+
+        return await self.connection.run_read(_read)
+
+    # ---------------------------------------------------------
+    # Bulk Operations (one statement each)
+    # ---------------------------------------------------------
+
+    # Per-row refund terms, in SQL so a bulk discard can return them from the
+    # DELETE itself. Keep in step with CompanionMechanics.calculate_feed_xp
+    # and EquipmentMechanics.calculate_refine_refund.
+    _FEED_XP_SQL = {
+        "items": (
+            "5 * (10 + item_level / 2 + (rarity > 0) * 10"
+            " + MAX(refinement_lvl, 0) * 50 + (passive != 'none') * 50)"
+        ),
+        "armor": "5 * (10 + item_level / 2)",
+    }
+    _FEED_XP_WITH_PASSIVE_LVL = "5 * (10 + item_level / 2 + MAX(passive_lvl, 0) * 50)"
+    _RUNE_REFUND_SQL = "MAX(0, CAST(refinement_lvl - 6 * 0.8 AS INTEGER))"
+
+    async def _discard_returning(self, table: str, where: str, params: tuple) -> dict:
+        feed_xp = self._FEED_XP_SQL.get(table, self._FEED_XP_WITH_PASSIVE_LVL)
+        runes = self._RUNE_REFUND_SQL if table == "items" else "0"
+        cursor = await self.connection.execute(
+            f"DELETE FROM {table} WHERE {where} "
+            f"RETURNING item_id, {feed_xp}, {runes}",
+            params,
+        )
+        rows = await cursor.fetchall()
+        await self.connection.commit()
+        for row in rows:
+            self.connection.player_cache.invalidate_ref(table, row[0])
+        return {
+            "item_ids": [row[0] for row in rows],
+            "feed_xp": sum(row[1] for row in rows),
+            "refinement_runes": sum(row[2] for row in rows),
+        }
+
+    async def discard_where(
+        self,
+        user_id: str,
+        item_type: ItemType,
+        *,
+        max_level: Optional[int] = None,
+        no_passive: bool = False,
+    ) -> dict:
+        """Deletes every unequipped item matching the filters (level at most
+        ``max_level``; no main passive) in one statement. Returns {"item_ids",
+        "feed_xp", "refinement_runes"}: the ids deleted and the summed
+        companion XP / rune refunds."""
+        table = self.tables[item_type]
+        where = "user_id = ? AND is_equipped = 0"
+        params: tuple = (user_id,)
+        if max_level is not None:
+            where += " AND item_level <= ?"
+            params += (max_level,)
+        if no_passive:
+            where += " AND {} = 'none'".format(
+                "armor_passive" if table == "armor" else "passive"
+            )
+        return await self._discard_returning(table, where, params)
+
     # ---------------------------------------------------------
     # Creation (Insert)
     # ---------------------------------------------------------
@@ -271,6 +417,7 @@ class EquipmentRepository:
             (passive_name, item_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref(table, item_id)
 
     async def update_counter(
         self, item_id: int, item_type: ItemType, column: str, new_value: int
@@ -300,6 +447,7 @@ class EquipmentRepository:
             f"UPDATE {table} SET {column} = ? WHERE item_id = ?", (new_value, item_id)
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref(table, item_id)
 
     async def increase_stat(
         self, item_id: int, item_type: ItemType, stat: str, amount: int
@@ -311,6 +459,7 @@ class EquipmentRepository:
             (amount, item_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref(table, item_id)
 
     # ---------------------------------------------------------
     # Essence Management
@@ -371,6 +520,7 @@ class EquipmentRepository:
             (essence_type, value, item_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref(table, item_id)
 
     async def apply_corrupted_essence(
         self, item_id: int, item_type: ItemType, essence_type: str
@@ -383,6 +533,7 @@ class EquipmentRepository:
             (essence_type, item_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref(table, item_id)
 
     async def clear_essences(self, item_id: int, item_type: ItemType) -> None:
         """Removes all 3 regular essence slots (Essence of Cleansing)."""
@@ -395,6 +546,7 @@ class EquipmentRepository:
             (item_id,),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref(table, item_id)
 
     async def reroll_essences(
         self, item_id: int, item_type: ItemType, new_values: list
@@ -415,6 +567,7 @@ class EquipmentRepository:
                 (new_val, item_id),
             )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref(table, item_id)
 
     async def remove_random_essence(self, item_id: int, item_type: ItemType) -> int:
         """
@@ -434,6 +587,7 @@ class EquipmentRepository:
             (item_id,),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref(table, item_id)
         return slot_index
 
     async def apply_mirage(
@@ -467,6 +621,7 @@ class EquipmentRepository:
             f"UPDATE {table} SET {set_clause} WHERE item_id = ?", values
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref(table, item_id)
 
     # ---------------------------------------------------------
     # Loadout Application
@@ -503,6 +658,7 @@ class EquipmentRepository:
                 skipped.append(slot_type)
 
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return skipped
 
     async def fetch_void_forge_candidates(self, user_id: str) -> List[Tuple]:
@@ -70,6 +70,19 @@ class EssencesRepository:
         )
         await self.connection.commit()
 
+    async def add_many(self, user_id: str, quantities: Dict[str, int]) -> None:
+        """add() for several essence types at once, in one executemany."""
+        rows = [(user_id, etype, qty) for etype, qty in quantities.items() if qty]
+        if not rows:
+            return
+        await self.connection.executemany(
+            """INSERT INTO player_essences (user_id, essence_type, quantity)
+               VALUES (?, ?, ?)
+               ON CONFLICT(user_id, essence_type) DO UPDATE SET quantity = quantity + excluded.quantity""",
+            rows,
+        )
+        await self.connection.commit()
+
     async def consume(self, user_id: str, essence_type: str, quantity: int = 1) -> bool:
         """
         Removes essence(s) from inventory. Returns True if successful, False if insufficient stock.
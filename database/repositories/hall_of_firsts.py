@@ -4,10 +4,29 @@ import aiosqlite
 class HallOfFirstsRepository:
     """Global 'first player to reach X' tracker. One row per category,
     first-write-wins via INSERT OR IGNORE (no transaction needed for a
-    single insert — SQLite's own uniqueness check resolves the race)."""
+    single insert — SQLite's own uniqueness check resolves the race).
+
+    Claims are permanent, so the set of claimed category keys is loaded once
+    (load_claimed, at startup) and kept write-through by try_claim. Trigger
+    sites check is_claimed() first and skip the database entirely for
+    categories that can no longer be won."""
 
     def __init__(self, connection: aiosqlite.Connection):
         self.connection = connection
+        # None until load_claimed() runs; is_claimed() then reports False so
+        # callers fall through to the authoritative INSERT OR IGNORE.
+        self._claimed: set[str] | None = None
+
+    async def load_claimed(self) -> int:
+        """Loads every claimed category key into memory. Returns the count."""
+        cursor = await self.connection.execute(
+            "SELECT category_key FROM hall_of_firsts"
+        )
+        self._claimed = {row[0] for row in await cursor.fetchall()}
+        return len(self._claimed)
+
+    def is_claimed(self, category_key: str) -> bool:
+        return self._claimed is not None and category_key in self._claimed
 
     async def try_claim(
         self,
@@ -38,12 +57,16 @@ class HallOfFirstsRepository:
             ),
         )
         await self.connection.commit()
+        # Won now or held by someone already — either way, it is taken. Inside
+        # a caller's transaction the insert could still be rolled back, so
+        # leave the set alone; the next claim attempt after commit adds it.
+        if self._claimed is not None and not self.connection._owns_transaction():
+            self._claimed.add(category_key)
         return cursor.rowcount > 0
 
     async def get_all(self) -> dict:
         """Returns {category_key: row} for every claimed category."""
-        cursor = await self.connection.execute("SELECT * FROM hall_of_firsts")
-        rows = await cursor.fetchall()
+        rows = await self.connection.read_all("SELECT * FROM hall_of_firsts")
         return {row["category_key"]: row for row in rows}
 
     async def get_one(self, category_key: str):
@@ -75,6 +75,7 @@ class HematurgyRepository(BaseRepository):
             (user_id, slot_type, passive_id, tier),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def upgrade_passive(self, user_id: str, slot_type: str) -> int:
         """Increments the tier by 1 (max 5). Returns the new tier, or -1 if no passive exists."""
@@ -87,6 +88,7 @@ class HematurgyRepository(BaseRepository):
             (new_tier, user_id, slot_type),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return new_tier
 
     async def delete_passive(self, user_id: str, slot_type: str) -> None:
@@ -96,6 +98,7 @@ class HematurgyRepository(BaseRepository):
             (user_id, slot_type),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def get_unlocked_passive_ids(self, user_id: str) -> set:
         """Returns the set of passive_ids currently owned across all slots."""
@@ -2,6 +2,8 @@ import json
 
 import aiosqlite
 
+from core.inner_sanctum.mechanics import get_tree_bonuses
+
 
 class InnerSanctumRepository:
     def __init__(self, connection: aiosqlite.Connection):
@@ -42,18 +44,21 @@ class InnerSanctumRepository:
         nodes_owned = data["nodes_owned"]
         nodes_owned[node_id] = value
         await self.connection.execute(
-            """INSERT INTO inner_sanctum (user_id, server_id, points_available, points_spent, nodes_owned)
-               VALUES (?, ?, ?, ?, ?)
+            """INSERT INTO inner_sanctum (user_id, server_id, points_available, points_spent,
+                                          nodes_owned, stamina_regen_bonus_chance)
+               VALUES (?, ?, ?, ?, ?, ?)
                ON CONFLICT(user_id, server_id) DO UPDATE SET
                  points_available = excluded.points_available,
                  points_spent = excluded.points_spent,
-                 nodes_owned = excluded.nodes_owned""",
+                 nodes_owned = excluded.nodes_owned,
+                 stamina_regen_bonus_chance = excluded.stamina_regen_bonus_chance""",
             (
                 user_id,
                 server_id,
                 data["points_available"] - cost,
                 data["points_spent"] + cost,
                 json.dumps(nodes_owned),
+                get_tree_bonuses(nodes_owned)["stamina_regen_bonus_chance"],
             ),
         )
         await self.connection.commit()
@@ -64,12 +69,14 @@ class InnerSanctumRepository:
         data = await self.get(user_id, server_id)
         refunded = data["points_spent"]
         await self.connection.execute(
-            """INSERT INTO inner_sanctum (user_id, server_id, points_available, points_spent, nodes_owned)
-               VALUES (?, ?, ?, 0, '{}')
+            """INSERT INTO inner_sanctum (user_id, server_id, points_available, points_spent,
+                                          nodes_owned, stamina_regen_bonus_chance)
+               VALUES (?, ?, ?, 0, '{}', 0)
                ON CONFLICT(user_id, server_id) DO UPDATE SET
                  points_available = excluded.points_available,
                  points_spent = 0,
-                 nodes_owned = '{}'""",
+                 nodes_owned = '{}',
+                 stamina_regen_bonus_chance = 0""",
             (user_id, server_id, data["points_available"] + refunded),
         )
         await self.connection.commit()
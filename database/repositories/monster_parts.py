@@ -111,6 +111,7 @@ class MonsterPartsRepository(BaseRepository):
             (user_id, slot_type, hp_value, monster_name),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def equip_and_remove_part(
         self,
@@ -133,6 +134,7 @@ class MonsterPartsRepository(BaseRepository):
             (part_id, user_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def unequip_slot(self, user_id: str, slot_type: str) -> None:
         await self.connection.execute(
@@ -140,3 +142,4 @@ class MonsterPartsRepository(BaseRepository):
             (user_id, slot_type),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
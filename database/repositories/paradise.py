@@ -76,6 +76,17 @@ class ParadiseRepository:
     async def save(self, user_id: str, data: dict) -> None:
         """Persists the full paradise jewel data dict."""
         await self._ensure_row(user_id)
+        row = {
+            "unlocked_skills": json.dumps(data["unlocked_skills"]),
+            "equipped_skill": data.get("equipped_skill"),
+            "skill_levels": json.dumps(data["skill_levels"]),
+            "skill_charges": json.dumps(data["skill_charges"]),
+            "skill_engrams": json.dumps(data.get("skill_engrams", {})),
+            "passive_slots": json.dumps(data["passive_slots"]),
+            "passive_jewels_invested": data["passive_jewels_invested"],
+            "total_jewels_obtained": data["total_jewels_obtained"],
+            "total_jewels_consumed": data["total_jewels_consumed"],
+        }
         await self.connection.execute(
             """UPDATE paradise_jewel_data
                SET unlocked_skills = ?, equipped_skill = ?, skill_levels = ?,
@@ -83,20 +94,13 @@ class ParadiseRepository:
                    passive_jewels_invested = ?, total_jewels_obtained = ?,
                    total_jewels_consumed = ?
                WHERE user_id = ?""",
-            (
-                json.dumps(data["unlocked_skills"]),
-                data.get("equipped_skill"),
-                json.dumps(data["skill_levels"]),
-                json.dumps(data["skill_charges"]),
-                json.dumps(data.get("skill_engrams", {})),
-                json.dumps(data["passive_slots"]),
-                data["passive_jewels_invested"],
-                data["total_jewels_obtained"],
-                data["total_jewels_consumed"],
-                user_id,
-            ),
+            (*row.values(), user_id),
         )
         await self.connection.commit()
+        # Saved after every jewel fight: patch cached snapshots in place.
+        self.connection.player_cache.patch(
+            user_id, "paradise", lambda _old: _row_to_dict(row)
+        )
 
     async def update_skill_charges(self, user_id: str, skill_charges: dict) -> None:
         """Lightweight update for charge counters only (called after every combat)."""
@@ -106,6 +110,7 @@ class ParadiseRepository:
             (json.dumps(skill_charges), user_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def update_skill_levels(self, user_id: str, skill_levels: dict) -> None:
         """Lightweight update for skill level progression."""
@@ -115,6 +120,7 @@ class ParadiseRepository:
             (json.dumps(skill_levels), user_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     def passive_slot_count(self, data: dict) -> int:
         """Returns how many passive slots are currently unlocked from invested jewels."""
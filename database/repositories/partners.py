@@ -224,6 +224,7 @@ class PartnerRepository(BaseRepository):
             (user_id, partner_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def clear_active_combat(self, user_id: str) -> None:
         await self.connection.execute(
@@ -231,6 +232,7 @@ class PartnerRepository(BaseRepository):
             (user_id,),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def set_dispatch(
         self,
@@ -252,6 +254,7 @@ class PartnerRepository(BaseRepository):
             (task, start_time, user_id, partner_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def set_dispatch_2(
         self,
@@ -268,6 +271,7 @@ class PartnerRepository(BaseRepository):
             (task, start_time, user_id, partner_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def reset_dispatch_timer(
         self, user_id: str, partner_id: int, new_start: str
@@ -278,6 +282,7 @@ class PartnerRepository(BaseRepository):
             (new_start, user_id, partner_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def reset_dispatch_timer_2(
         self, user_id: str, partner_id: int, new_start: str
@@ -287,6 +292,7 @@ class PartnerRepository(BaseRepository):
             (new_start, user_id, partner_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def clear_dispatch(self, user_id: str, partner_id: int) -> None:
         await self.connection.execute(
@@ -298,6 +304,7 @@ class PartnerRepository(BaseRepository):
             (user_id, partner_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def set_boss_party_dispatch(
         self,
@@ -317,6 +324,7 @@ class PartnerRepository(BaseRepository):
                 (start_time, user_id, pid),
             )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def clear_boss_party_dispatch(
         self,
@@ -335,6 +343,7 @@ class PartnerRepository(BaseRepository):
                 (user_id, pid),
             )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     # ------------------------------------------------------------------
     # Skill upgrades / rerolls
@@ -356,6 +365,7 @@ class PartnerRepository(BaseRepository):
             (key, lvl, user_id, partner_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def update_skill_level(
         self,
@@ -371,6 +381,7 @@ class PartnerRepository(BaseRepository):
             (lvl, user_id, partner_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     # ------------------------------------------------------------------
     # Leveling
@@ -384,6 +395,14 @@ class PartnerRepository(BaseRepository):
             (exp, level, user_id, partner_id),
         )
         await self.connection.commit()
+        # Fires after every victory: patch the cached active partner in place.
+        self.connection.player_cache.patch(
+            user_id,
+            "active_partner",
+            lambda p: {**p, "exp": exp, "level": level}
+            if p and p["partner_id"] == partner_id
+            else p,
+        )
 
     # ------------------------------------------------------------------
     # Affinity
@@ -396,6 +415,13 @@ class PartnerRepository(BaseRepository):
             (user_id, partner_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.patch(
+            user_id,
+            "active_partner",
+            lambda p: {**p, "affinity_encounters": p["affinity_encounters"] + 1}
+            if p and p["partner_id"] == partner_id
+            else p,
+        )
 
     async def update_affinity_story_seen(
         self, user_id: str, partner_id: int, story_index: int
@@ -405,6 +431,7 @@ class PartnerRepository(BaseRepository):
             (story_index, user_id, partner_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def update_portrait(
         self, user_id: str, partner_id: int, variant: int
@@ -414,3 +441,4 @@ class PartnerRepository(BaseRepository):
             (variant, user_id, partner_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
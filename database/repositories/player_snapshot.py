@@ -0,0 +1,262 @@
+"""
+database/repositories/player_snapshot.py — bulk, read-only loader for load_player.
+
+load_player used to await ~25 repository calls in sequence, each a separate
+hop onto the single aiosqlite worker thread. PlayerSnapshotRepository.fetch()
+runs every one of those SELECTs back-to-back inside a single hop
+(GuardedConnection.run_sync) and returns the results already shaped the way
+the individual repository getters return them.
+
+Sections that load_player historically wrapped in try/except are isolated the
+same way here: a failing query is recorded in ``snapshot["errors"]`` under its
+section name and the rest of the snapshot still loads. Gear, active
+companions and building details were never isolated, so their errors
+propagate to the caller exactly as before.
+
+The loader never inserts. Where a getter would lazily create a default row
+(slayer profile, companion mastery, paradise jewel, soul stone), the
+snapshot returns the same defaults that freshly-created row would hold.
+"""
+
+import json
+
+from core.models import CodexTome
+from database.base import BaseRepository
+
+from .alchemy import POTION_PASSIVES_SQL, AlchemyRepository, _potion_passive_from_row
+from .apex import _empty_soul_stone
+from .equipment import LOADOUT_SLOT_DEFS
+from .paradise import _default_data as _default_paradise
+from .paradise import _row_to_dict as _paradise_from_row
+from .settlement import COMBAT_BUILDINGS_SQL, COMBAT_PLOTS_SQL, SettlementRepository
+from .slayer import _emblem_from_row
+
+
+def _isolated(snapshot: dict, section: str, fn, *args):
+    """Runs one optional section, recording (not raising) its failure."""
+    try:
+        snapshot[section] = fn(*args)
+    except Exception as e:
+        snapshot["errors"][section] = e
+
+
+def _collect(conn, user_id: str, server_id: str, settlement: dict | None) -> dict:
+    """Runs on the aiosqlite worker thread. ``conn`` is the raw sqlite3
+    connection (row_factory is already sqlite3.Row). ``settlement`` is the
+    cached settlement projection, or None to read the buildings and plots
+    and return a fresh one under ``snapshot["settlement"]``."""
+
+    def one(sql, params):
+        return conn.execute(sql, params).fetchone()
+
+    def all_(sql, params):
+        return conn.execute(sql, params).fetchall()
+
+    uid = (user_id,)
+    uid_sid = (user_id, server_id)
+    snap: dict = {"errors": {}}
+
+    # --- Not isolated (load_player let these raise) ---
+    snap["gear"] = {
+        slot: one(f"SELECT * FROM {table} WHERE user_id = ? AND is_equipped = 1", uid)
+        for slot, _col, table in LOADOUT_SLOT_DEFS
+    }
+    snap["active_companions"] = all_(
+        "SELECT * FROM companions WHERE user_id = ? AND is_active = 1", uid
+    )
+    # Rows whose id-only write paths must invalidate a cached copy of this
+    # snapshot (see PlayerSnapshotCache.invalidate_ref). Building writes
+    # invalidate their owner directly.
+    snap["refs"] = [
+        (table, snap["gear"][slot]["item_id"])
+        for slot, _col, table in LOADOUT_SLOT_DEFS
+        if snap["gear"][slot]
+    ]
+    snap["refs"] += [("companions", r["id"]) for r in snap["active_companions"]]
+    if settlement is None:
+        building_rows = all_(COMBAT_BUILDINGS_SQL, uid_sid)
+        snap["barracks"] = SettlementRepository.building_details_from_rows(
+            building_rows, "barracks"
+        )
+        snap["apothecary"] = SettlementRepository.building_details_from_rows(
+            building_rows, "apothecary"
+        )
+    else:
+        building_rows = ()
+        snap["barracks"] = settlement["buildings"].get("barracks", (0, 0))
+        snap["apothecary"] = settlement["buildings"].get("apothecary", (0, 0))
+
+    # --- Isolated sections ---
+    def combat_bonuses():
+        if settlement is not None:
+            return {
+                "apothecary_boost_pct": settlement["apothecary_boost_pct"],
+                "shrine_effectiveness": dict(settlement["shrine_effectiveness"]),
+            }
+        plot_rows = all_(COMBAT_PLOTS_SQL, uid_sid) if building_rows else []
+        projection = SettlementRepository.projection_from_rows(building_rows, plot_rows)
+        snap["settlement"] = projection
+        return {
+            "apothecary_boost_pct": projection["apothecary_boost_pct"],
+            "shrine_effectiveness": dict(projection["shrine_effectiveness"]),
+        }
+
+    def companion_mastery():
+        row = one(
+            "SELECT nodes_owned FROM companion_mastery WHERE user_id=? AND server_id=?",
+            uid_sid,
+        )
+        return json.loads(row["nodes_owned"]) if row and row["nodes_owned"] else {}
+
+    def slayer():
+        emblem = _emblem_from_row(
+            one("SELECT * FROM slayer_emblems WHERE user_id = ? AND server_id = ?", uid_sid)
+        )
+        row = one(
+            "SELECT active_task_species FROM slayer_profiles "
+            "WHERE user_id = ? AND server_id = ?",
+            uid_sid,
+        )
+        return emblem, row["active_task_species"] if row else None
+
+    def codex_tomes():
+        return [
+            CodexTome(
+                slot=r["slot"],
+                passive_type=r["passive_type"],
+                tier=r["tier"],
+                value=r["value"],
+            )
+            for r in all_(
+                "SELECT slot, passive_type, tier, value FROM codex_tomes "
+                "WHERE user_id = ? ORDER BY slot",
+                uid,
+            )
+        ]
+
+    def ascension_unlocks():
+        return {
+            r["floor"]
+            for r in all_("SELECT floor FROM ascension_unlocks WHERE user_id = ?", uid)
+        }
+
+    def potion_passives():
+        return [_potion_passive_from_row(r) for r in all_(POTION_PASSIVES_SQL, uid)]
+
+    def equipped_parts():
+        return {
+            r["slot_type"]: {"hp": r["hp_value"], "monster_name": r["monster_name"]}
+            for r in all_(
+                "SELECT slot_type, hp_value, monster_name "
+                "FROM monster_parts_equipped WHERE user_id = ?",
+                uid,
+            )
+        }
+
+    def paradise():
+        row = one(
+            """SELECT user_id, unlocked_skills, equipped_skill, skill_levels,
+                      skill_charges, skill_engrams, passive_slots, passive_jewels_invested,
+                      total_jewels_obtained, total_jewels_consumed
+               FROM paradise_jewel_data WHERE user_id = ?""",
+            uid,
+        )
+        return _paradise_from_row(row) if row else _default_paradise()
+
+    def active_partner():
+        # A plain dict so the cache can patch per-fight exp/affinity writes.
+        row = one(
+            "SELECT * FROM user_partners WHERE user_id = ? AND is_active_combat = 1", uid
+        )
+        return dict(row) if row else None
+
+    def hematurgy():
+        return {
+            r["slot_type"]: {"passive_id": r["passive_id"], "tier": r["tier"]}
+            for r in all_(
+                "SELECT slot_type, passive_id, tier FROM hematurgy_passives WHERE user_id = ?",
+                uid,
+            )
+        }
+
+    def soul_stone():
+        row = one("SELECT * FROM soul_stones WHERE user_id = ? AND server_id = ?", uid_sid)
+        return dict(row) if row else _empty_soul_stone(user_id, server_id)
+
+    def artefact():
+        row = one(
+            "SELECT item_id, artefact_key, roll_1, roll_2, roll_3, is_equipped "
+            "FROM rite_artefact_items WHERE user_id = ? AND server_id = ? AND is_equipped = 1",
+            uid_sid,
+        )
+        if not row:
+            return None
+        snap["refs"].append(("rite_artefact_items", row["item_id"]))
+        return dict(row)
+
+    def stat_investments():
+        row = one(
+            "SELECT stat_invest_atk, stat_invest_def, stat_invest_hp, stat_invest_gold "
+            "FROM users WHERE user_id = ?",
+            uid,
+        )
+        if not row:
+            return {"atk": 0, "def": 0, "hp": 0, "gold": 0}
+        return {
+            "atk": row["stat_invest_atk"],
+            "def": row["stat_invest_def"],
+            "hp": row["stat_invest_hp"],
+            "gold": row["stat_invest_gold"],
+        }
+
+    for section, fn in (
+        ("combat_bonuses", combat_bonuses),
+        ("companion_mastery", companion_mastery),
+        ("slayer", slayer),
+        ("codex_tomes", codex_tomes),
+        ("ascension_unlocks", ascension_unlocks),
+        ("potion_passives", potion_passives),
+        ("equipped_parts", equipped_parts),
+        ("paradise", paradise),
+        ("active_partner", active_partner),
+        ("hematurgy", hematurgy),
+        ("soul_stone", soul_stone),
+        ("artefact", artefact),
+        ("stat_investments", stat_investments),
+    ):
+        _isolated(snap, section, fn)
+    return snap
+
+
+class PlayerSnapshotRepository(BaseRepository):
+    async def fetch(self, user_id: str, server_id: str) -> dict:
+        """Everything load_player attaches to a Player, in one worker-thread hop.
+
+        Returns a dict keyed by section (see _collect). Failed optional
+        sections are absent from the dict and present in ``["errors"]``.
+        Served from the connection's PlayerSnapshotCache when the player has
+        not been written to since the last read; the result is always the
+        caller's own copy.
+        """
+        cache = self.connection.player_cache
+        cached = cache.get(user_id, server_id)
+        if cached is not None:
+            return cached
+        version = cache.version(user_id)
+        # On a snapshot miss the settlement usually has not changed, so its
+        # adjacency pass is skipped (SettlementProjectionCache).
+        projections = self.connection.settlement_projections
+        settlement = projections.get(user_id, server_id)
+        layout = projections.version(user_id, server_id)
+
+        # potion_passives.passive_duration is added lazily; make sure it exists
+        # before the raw SELECT references it (no-op after the first call).
+        await AlchemyRepository(self.connection)._ensure_passive_duration_column()
+        snapshot = await self.connection.run_sync(
+            _collect, user_id, server_id, settlement
+        )
+        fresh = snapshot.pop("settlement", None)
+        if fresh is not None:
+            projections.put(user_id, server_id, layout, fresh)
+        cache.put(user_id, server_id, version, snapshot)
+        return cache.clone(snapshot)
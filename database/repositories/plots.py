@@ -22,6 +22,7 @@ class PlotRepository:
         """Insert all 20 plot rows (undeveloped) if they don't already exist,
         then auto-develop the 4 Town Hall-adjacent plots so new players can
         immediately place Logging Camp / Quarry."""
+        changes = self.connection.total_changes
         for plot_index in range(1, 21):
             await self.connection.execute(
                 "INSERT OR IGNORE INTO settlement_plots "
@@ -39,6 +40,11 @@ class PlotRepository:
             (user_id, server_id),
         )
         await self.connection.commit()
+        # get_plots() calls this on every read; only a first-time insert or
+        # unlock changes the layout.
+        if self.connection.total_changes != changes:
+            self.connection.settlement_projections.bump(user_id, server_id)
+            self.connection.player_cache.invalidate(user_id)
 
     # ------------------------------------------------------------------
     # Reads
@@ -90,6 +96,8 @@ class PlotRepository:
             (new_bonus_type, user_id, server_id, plot_index),
         )
         await self.connection.commit()
+        self.connection.settlement_projections.bump(user_id, server_id)
+        self.connection.player_cache.invalidate(user_id)
 
     async def develop_plot(
         self,
@@ -106,3 +114,5 @@ class PlotRepository:
             (bonus_type, user_id, server_id, plot_index),
         )
         await self.connection.commit()
+        self.connection.settlement_projections.bump(user_id, server_id)
+        self.connection.player_cache.invalidate(user_id)
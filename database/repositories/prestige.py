@@ -61,15 +61,11 @@ class PrestigeRepository:
             f"UPDATE users SET {field} = ? WHERE user_id = ?", (value, user_id)
         )
         await self.connection.commit()
+        if field != "prestige_border":
+            # Rare, and the server scope isn't known here; reload on next view.
+            self.connection.leaderboards.invalidate("monuments")
 
     async def get_monument_hall(self, server_id: str, limit: int = 10) -> list:
-        cursor = await self.connection.execute(
-            """SELECT name, prestige_monument, prestige_title, prestige_display_name,
-                      prestige_emblem, level
-               FROM users
-               WHERE server_id = ? AND prestige_monument IS NOT NULL AND prestige_monument != ''
-               ORDER BY level DESC
-               LIMIT ?""",
-            (server_id, limit),
+        return await self.connection.leaderboards.top(
+            "monuments", limit, server_id=server_id
         )
-        return await cursor.fetchall()
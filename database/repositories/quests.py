@@ -547,6 +547,80 @@ class QuestsRepository(BaseRepository):
         )
         await self.connection.commit()
 
+    # ------------------------------------------------------------------
+    # Batched progress ticks (see core/quests/mechanics.py:tick_quest_events)
+    # ------------------------------------------------------------------
+
+    async def get_tick_state(
+        self, user_id: str, server_id: str
+    ) -> tuple[list, dict | None, int]:
+        """Everything a progress tick reads, in one worker-thread hop.
+
+        Returns (contracts, horizon, horizon_boost_uses): the contracts and
+        horizon quest that can still progress (neither completed nor turned
+        in), and the remaining horizon boost uses (0 with no meta row).
+        """
+
+        def collect(conn):
+            contracts = [
+                dict(r)
+                for r in conn.execute(
+                    "SELECT slot, quest_id, progress, goal FROM quest_contracts "
+                    "WHERE user_id = ? AND server_id = ? AND completed = 0 AND turned_in = 0 "
+                    "ORDER BY slot",
+                    (user_id, server_id),
+                )
+            ]
+            row = conn.execute(
+                "SELECT path_id, progress, goal FROM quest_horizon "
+                "WHERE user_id = ? AND server_id = ? AND completed = 0 AND turned_in = 0",
+                (user_id, server_id),
+            ).fetchone()
+            horizon = dict(row) if row else None
+            meta = conn.execute(
+                "SELECT horizon_boost_uses FROM quest_meta WHERE user_id = ?",
+                (user_id,),
+            ).fetchone()
+            return contracts, horizon, meta[0] if meta else 0
+
+        return await self.connection.run_sync(collect)
+
+    async def apply_ticks(
+        self,
+        user_id: str,
+        server_id: str,
+        contract_ticks: list[tuple[int, int]],
+        horizon_amount: int = 0,
+        boost_used: bool = False,
+    ) -> None:
+        """Writes one tick's progress with a single commit.
+
+        ``contract_ticks`` is (amount, slot) pairs. Updates are relative
+        (progress = progress + ?), so progress made between the state read
+        and this write is kept, not overwritten.
+        """
+        if contract_ticks:
+            await self.connection.executemany(
+                "UPDATE quest_contracts SET progress = progress + ?1, "
+                "completed = CASE WHEN progress + ?1 >= goal THEN 1 ELSE 0 END "
+                "WHERE user_id = ?2 AND server_id = ?3 AND slot = ?4 AND turned_in = 0",
+                [(amount, user_id, server_id, slot) for amount, slot in contract_ticks],
+            )
+        if horizon_amount:
+            await self.connection.execute(
+                "UPDATE quest_horizon SET progress = progress + ?1, "
+                "completed = CASE WHEN progress + ?1 >= goal THEN 1 ELSE 0 END "
+                "WHERE user_id = ?2 AND server_id = ?3 AND turned_in = 0",
+                (horizon_amount, user_id, server_id),
+            )
+        if boost_used:
+            await self.connection.execute(
+                "UPDATE quest_meta SET horizon_boost_uses = MAX(0, horizon_boost_uses - 1) WHERE user_id = ?",
+                (user_id,),
+            )
+        if contract_ticks or horizon_amount or boost_used:
+            await self.connection.commit()
+
     # ------------------------------------------------------------------
     # Check-in
     # ------------------------------------------------------------------
@@ -130,6 +130,7 @@ class RiteRepository:
             (user_id, server_id, artefact_key, roll_1, roll_2, roll_3, int(equip_now)),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return cursor.lastrowid
 
     async def equip_artefact(self, user_id: str, server_id: str, item_id: int) -> None:
@@ -144,6 +145,7 @@ class RiteRepository:
             (item_id,),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def unequip_artefact(self, user_id: str, server_id: str) -> None:
         await self.connection.execute(
@@ -152,9 +154,11 @@ class RiteRepository:
             (user_id, server_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def discard_artefact(self, item_id: int) -> None:
         await self.connection.execute(
             "DELETE FROM rite_artefact_items WHERE item_id = ?", (item_id,)
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate_ref("rite_artefact_items", item_id)
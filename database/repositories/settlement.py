@@ -6,10 +6,51 @@ import aiosqlite
 from core.models import Building, Settlement
 
 
+# Shared by get_combat_bonuses() and the bulk player snapshot loader.
+COMBAT_BUILDINGS_SQL = (
+    "SELECT id, user_id, server_id, building_type, tier, slot_index, "
+    "workers_assigned, plot_index, is_meta, COALESCE(is_disabled, 0) AS is_disabled "
+    "FROM buildings WHERE user_id = ? AND server_id = ?"
+)
+COMBAT_PLOTS_SQL = (
+    "SELECT plot_index, is_developed, bonus_type "
+    "FROM settlement_plots WHERE user_id = ? AND server_id = ?"
+)
+
+
+def load_combat_projection(conn, user_id: str, server_id: str) -> dict:
+    """Runs on the aiosqlite worker thread: reads one settlement's buildings
+    and plots and derives its projection. Plots may not exist yet for
+    brand-new players."""
+    building_rows = conn.execute(COMBAT_BUILDINGS_SQL, (user_id, server_id)).fetchall()
+    plot_rows = []
+    if building_rows:
+        try:
+            plot_rows = conn.execute(COMBAT_PLOTS_SQL, (user_id, server_id)).fetchall()
+        except Exception:
+            pass
+    return SettlementRepository.projection_from_rows(building_rows, plot_rows)
+
+
 class SettlementRepository:
     def __init__(self, connection: aiosqlite.Connection):
         self.connection = connection
 
+    def layout_changed(self, user_id: str, server_id: str) -> None:
+        """Called by every write that can change a settlement's combat
+        projection (see SettlementProjectionCache)."""
+        self.connection.settlement_projections.bump(user_id, server_id)
+        self.connection.player_cache.invalidate(user_id)
+
+    async def _update_building(self, sql: str, params: tuple) -> None:
+        """Runs an id-keyed building write whose RETURNING clause names the
+        owner, so the right settlement's layout version is bumped."""
+        cursor = await self.connection.execute(sql, params)
+        rows = await cursor.fetchall()
+        await self.connection.commit()
+        for row in rows:
+            self.layout_changed(row["user_id"], row["server_id"])
+
     async def migrate_buildings_schema(self) -> None:
         """Add new columns to the buildings table for existing databases."""
         try:
@@ -104,27 +145,28 @@ class SettlementRepository:
             (user_id, server_id, b_type, plot_index, plot_index, int(is_meta)),
         )
         await self.connection.commit()
+        self.layout_changed(user_id, server_id)
 
     async def assign_workers(self, building_id: int, count: int) -> None:
-        await self.connection.execute(
-            "UPDATE buildings SET workers_assigned = ? WHERE id = ?",
+        await self._update_building(
+            "UPDATE buildings SET workers_assigned = ? WHERE id = ? "
+            "RETURNING user_id, server_id",
             (count, building_id),
         )
-        await self.connection.commit()
 
     async def disable_building(self, building_id: int) -> None:
-        await self.connection.execute(
-            "UPDATE buildings SET is_disabled = 1 WHERE id = ?",
+        await self._update_building(
+            "UPDATE buildings SET is_disabled = 1 WHERE id = ? "
+            "RETURNING user_id, server_id",
             (building_id,),
         )
-        await self.connection.commit()
 
     async def repair_building(self, building_id: int) -> None:
-        await self.connection.execute(
-            "UPDATE buildings SET is_disabled = 0 WHERE id = ?",
+        await self._update_building(
+            "UPDATE buildings SET is_disabled = 0 WHERE id = ? "
+            "RETURNING user_id, server_id",
             (building_id,),
         )
-        await self.connection.commit()
 
     async def get_building_by_type(
         self, user_id: str, server_id: str, building_type: str
@@ -305,6 +347,9 @@ class SettlementRepository:
         Returns (tier, 0) if the building is disabled (e.g. by a crisis event),
         so its passive effects and production correctly drop to nothing.
         """
+        projection = self.connection.settlement_projections.peek(user_id, server_id)
+        if projection is not None:
+            return projection["buildings"].get(building_type, (0, 0))
         cursor = await self.connection.execute(
             "SELECT tier, workers_assigned, COALESCE(is_disabled, 0) AS is_disabled "
             "FROM buildings WHERE user_id = ? AND server_id = ? AND building_type = ?",
@@ -331,58 +376,93 @@ class SettlementRepository:
         Returns default values (all bonuses zero / empty) when the player has no
         settlement, no relevant buildings, or the tables do not yet exist.
         """
+        try:
+            projection = await self.get_combat_projection(user_id, server_id)
+        except Exception:
+            return self.combat_bonuses_from_rows([], [])
+        return {
+            "apothecary_boost_pct": projection["apothecary_boost_pct"],
+            "shrine_effectiveness": dict(projection["shrine_effectiveness"]),
+        }
+
+    async def get_combat_projection(self, user_id: str, server_id: str) -> dict:
+        """The settlement's derived combat bonuses (see projection_from_rows),
+        recomputed only after a layout write. The result is shared; do not
+        mutate it."""
+        projections = self.connection.settlement_projections
+        projection = projections.get(user_id, server_id)
+        if projection is None:
+            version = projections.version(user_id, server_id)
+            projection = await self.connection.run_sync(
+                load_combat_projection, user_id, server_id
+            )
+            projections.put(user_id, server_id, version, projection)
+        return projection
+
+    @staticmethod
+    def building_details_from_rows(building_rows, building_type: str) -> tuple[int, int]:
+        """get_building_details() computed from rows already loaded with
+        COMBAT_BUILDINGS_SQL, so bulk loaders avoid a query per building."""
+        for r in building_rows:
+            if r["building_type"] == building_type:
+                if r["is_disabled"]:
+                    return (r["tier"], 0)
+                return (r["tier"], r["workers_assigned"])
+        return (0, 0)
+
+    @staticmethod
+    def projection_from_rows(building_rows, plot_rows) -> dict:
+        """Everything combat needs from a settlement's layout:
+
+        - ``buildings``: building type → get_building_details() result.
+        - ``apothecary_boost_pct`` / ``shrine_effectiveness``: as returned by
+          get_combat_bonuses().
+        """
+        buildings: dict[str, tuple[int, int]] = {}
+        for r in building_rows:
+            buildings.setdefault(
+                r["building_type"],
+                (r["tier"], 0 if r["is_disabled"] else r["workers_assigned"]),
+            )
+        return {
+            "buildings": buildings,
+            **SettlementRepository.combat_bonuses_from_rows(building_rows, plot_rows),
+        }
+
+    @staticmethod
+    def combat_bonuses_from_rows(building_rows, plot_rows) -> dict:
+        """Pure half of get_combat_bonuses(): maps rows loaded with
+        COMBAT_BUILDINGS_SQL / COMBAT_PLOTS_SQL to the combat bonus dict."""
         from core.settlement.mechanics import SettlementMechanics
         from core.settlement.models import Building, Plot
         from core.settlement.plots import PLOT_BONUS_TABLE
 
-        _DEFAULT = {"apothecary_boost_pct": 0.0, "shrine_effectiveness": {}}
-
-        # Load all buildings
-        try:
-            b_cursor = await self.connection.execute(
-                "SELECT id, user_id, server_id, building_type, tier, slot_index, "
-                "workers_assigned, plot_index, is_meta, COALESCE(is_disabled, 0) AS is_disabled "
-                "FROM buildings WHERE user_id = ? AND server_id = ?",
-                (user_id, server_id),
+        buildings = [
+            Building(
+                id=r["id"],
+                user_id=r["user_id"],
+                server_id=r["server_id"],
+                building_type=r["building_type"],
+                tier=r["tier"],
+                slot_index=r["slot_index"],
+                workers_assigned=r["workers_assigned"],
+                plot_index=r["plot_index"],
+                is_meta=bool(r["is_meta"]),
+                is_disabled=bool(r["is_disabled"]),
             )
-            buildings = [
-                Building(
-                    id=r["id"],
-                    user_id=r["user_id"],
-                    server_id=r["server_id"],
-                    building_type=r["building_type"],
-                    tier=r["tier"],
-                    slot_index=r["slot_index"],
-                    workers_assigned=r["workers_assigned"],
-                    plot_index=r["plot_index"],
-                    is_meta=bool(r["is_meta"]),
-                    is_disabled=bool(r["is_disabled"]),
-                )
-                for r in await b_cursor.fetchall()
-            ]
-        except Exception:
-            return _DEFAULT
-
+            for r in building_rows
+        ]
         if not buildings:
-            return _DEFAULT
+            return {"apothecary_boost_pct": 0.0, "shrine_effectiveness": {}}
 
-        # Load all plots (may not exist for brand-new players)
-        try:
-            p_cursor = await self.connection.execute(
-                "SELECT plot_index, is_developed, bonus_type "
-                "FROM settlement_plots WHERE user_id = ? AND server_id = ?",
-                (user_id, server_id),
+        plots = [
+            Plot(
+                plot_index=r["plot_index"],
+                is_developed=bool(r["is_developed"]),
+                bonus_type=r["bonus_type"],
             )
-            plots = [
-                Plot(
-                    plot_index=r["plot_index"],
-                    is_developed=bool(r["is_developed"]),
-                    bonus_type=r["bonus_type"],
-                )
-                for r in await p_cursor.fetchall()
-            ]
-        except Exception:
-            plots = []
+            for r in plot_rows
+        ]
 
         adj_bonuses = SettlementMechanics.calculate_adjacency_bonuses(plots, buildings)
         plot_bonus_by_idx = {
@@ -498,16 +578,18 @@ class SettlementRepository:
     # ------------------------------------------------------------------
 
     async def demolish_building(self, building_id: int) -> None:
-        await self.connection.execute(
-            "DELETE FROM buildings WHERE id = ?", (building_id,)
+        await self._update_building(
+            "DELETE FROM buildings WHERE id = ? "
+            "RETURNING user_id, server_id",
+            (building_id,),
         )
-        await self.connection.commit()
 
     async def upgrade_building_tier(self, building_id: int) -> None:
-        await self.connection.execute(
-            "UPDATE buildings SET tier = tier + 1 WHERE id = ?", (building_id,)
+        await self._update_building(
+            "UPDATE buildings SET tier = tier + 1 WHERE id = ? "
+            "RETURNING user_id, server_id",
+            (building_id,),
         )
-        await self.connection.commit()
 
     async def expand_building_slots(self, user_id: str, server_id: str) -> None:
         await self.connection.execute(
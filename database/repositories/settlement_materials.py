@@ -105,3 +105,22 @@ class SettlementMaterialsRepository(BaseRepository):
             (amount, user_id),
         )
         await self.connection.commit()
+
+    async def modify_many(self, user_id: str, deltas: dict[str, int]) -> None:
+        """modify() for several materials at once, in one UPDATE. Each floor
+        at 0 applies to the net delta."""
+        deltas = {material: amount for material, amount in deltas.items() if amount}
+        if not deltas:
+            return
+        for material in deltas:
+            if material not in _VALID_MATERIALS:
+                raise ValueError(
+                    f"settlement_materials.modify_many: unknown material {material!r}"
+                )
+        await self._ensure(user_id)
+        sets = ", ".join(f"`{m}` = MAX(0, `{m}` + ?)" for m in deltas)
+        await self.connection.execute(
+            f"UPDATE settlement_materials SET {sets} WHERE user_id = ?",
+            (*deltas.values(), user_id),
+        )
+        await self.connection.commit()
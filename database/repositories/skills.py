@@ -2,8 +2,20 @@ from typing import Dict, List, Literal, Tuple
 
 import aiosqlite
 
+from core.skills.mastery import split_excess_points
+from core.skills.passive_tick import (
+    RESOURCE_COLUMNS,
+    TOOL_COLUMNS,
+    PassiveTickResult,
+)
+
 SkillType = Literal["mining", "fishing", "woodcutting"]
 
+# Elemental keys held on gathering_mastery.
+ELEMENTAL_KEY_COLUMNS = frozenset(
+    {"blessed_bismuth", "sparkling_sprig", "capricious_carp"}
+)
+
 
 class SkillRepository:
     def __init__(self, connection: aiosqlite.Connection):
@@ -258,6 +270,7 @@ class SkillRepository:
         if cursor.rowcount == 0:
             raise ValueError("Insufficient gold for pickaxe upgrade")
         await self.connection.commit()
+        self.connection.leaderboards.adjust("wealth", (user_id,), "gold", -gp)
 
     async def upgrade_axe(
         self, user_id: str, server_id: str, new_tier: str, costs: tuple
@@ -290,6 +303,7 @@ class SkillRepository:
         if cursor.rowcount == 0:
             raise ValueError("Insufficient gold for axe upgrade")
         await self.connection.commit()
+        self.connection.leaderboards.adjust("wealth", (user_id,), "gold", -gp)
 
     # ---------------------------------------------------------
     # Upgrade material helpers (used by upgrade views via base.py)
@@ -358,6 +372,9 @@ class SkillRepository:
             (gold_amount, user_id),
         )
         await self.connection.commit()
+        self.connection.leaderboards.adjust(
+            "wealth", (user_id,), "gold", -gold_amount
+        )
 
     async def upgrade_fishing_rod(
         self, user_id: str, server_id: str, new_tier: str, costs: tuple
@@ -390,6 +407,7 @@ class SkillRepository:
         if cursor.rowcount == 0:
             raise ValueError("Insufficient gold for fishing rod upgrade")
         await self.connection.commit()
+        self.connection.leaderboards.adjust("wealth", (user_id,), "gold", -gp)
 
     # =========================================================
     # Artisan Mastery (Gathering Mastery) methods
@@ -503,6 +521,23 @@ class SkillRepository:
         )
         await self.connection.commit()
 
+    async def add_elemental_keys(
+        self, user_id: str, server_id: str, keys: Dict[str, int]
+    ) -> None:
+        """The increment_* methods above for several keys at once."""
+        keys = {col: amount for col, amount in keys.items() if amount}
+        if not keys:
+            return
+        for col in keys:
+            if col not in ELEMENTAL_KEY_COLUMNS:
+                raise ValueError(f"add_elemental_keys: unknown key {col!r}")
+        sets = ", ".join(f"{col} = {col} + ?" for col in keys)
+        await self.connection.execute(
+            f"UPDATE gathering_mastery SET {sets} WHERE user_id=? AND server_id=?",
+            (*keys.values(), user_id, server_id),
+        )
+        await self.connection.commit()
+
     async def consume_elemental_keys(self, user_id: str, server_id: str) -> None:
         """Deducts 1 of each elemental key atomically."""
         await self.connection.execute(
@@ -755,6 +790,79 @@ class SkillRepository:
         except Exception:
             pass
 
+    # =========================================================
+    # Hourly passive tick (batch) — see core/skills/passive_tick.py
+    # =========================================================
+
+    async def get_passive_tick_state(self) -> tuple[dict, dict]:
+        """Every skill row and every mastery row, in one worker-thread hop.
+
+        Returns (skill_rows, mastery_rows): skill_rows maps each skill to its
+        rows; mastery_rows maps (user_id, server_id) to the mastery row dict.
+        """
+
+        def collect(conn):
+            skill_rows = {
+                skill: conn.execute(
+                    f"SELECT user_id, server_id, {tool_col} FROM {skill}"
+                ).fetchall()
+                for skill, tool_col in TOOL_COLUMNS.items()
+            }
+            mastery_rows = {
+                (r["user_id"], r["server_id"]): dict(r)
+                for r in conn.execute("SELECT * FROM gathering_mastery")
+            }
+            return skill_rows, mastery_rows
+
+        return await self.connection.run_sync(collect)
+
+    async def apply_passive_tick(self, result: PassiveTickResult) -> None:
+        """Writes a computed passive tick back with one executemany per table.
+
+        Every update is relative (col = col + ?), so actions players take
+        between the state read and this write are kept, not overwritten.
+        """
+        if result.new_mastery_keys:
+            await self.connection.executemany(
+                "INSERT OR IGNORE INTO gathering_mastery (user_id, server_id) VALUES (?, ?)",
+                result.new_mastery_keys,
+            )
+        for skill, rows in result.resource_rows.items():
+            if not rows:
+                continue
+            sets = ", ".join(f"{c} = {c} + ?" for c in RESOURCE_COLUMNS[skill])
+            await self.connection.executemany(
+                f"UPDATE {skill} SET {sets} WHERE user_id = ? AND server_id = ?",
+                rows,
+            )
+        if result.mastery_rows:
+            await self.connection.executemany(
+                """UPDATE gathering_mastery
+                   SET mining_points = mining_points + ?,
+                       fishing_points = fishing_points + ?,
+                       woodcutting_points = woodcutting_points + ?,
+                       geode_cores = geode_cores + ?,
+                       tide_relics = tide_relics + ?,
+                       heartwood_shards = heartwood_shards + ?,
+                       mining_tripled_ticks = MAX(0, mining_tripled_ticks - ?),
+                       fishing_tripled_ticks = MAX(0, fishing_tripled_ticks - ?),
+                       woodcutting_tripled_ticks = MAX(0, woodcutting_tripled_ticks - ?),
+                       last_point_claim = COALESCE(?, last_point_claim)
+                   WHERE user_id=? AND server_id=?""",
+                result.mastery_rows,
+            )
+        if result.insight_rows:
+            await self.connection.executemany(
+                """UPDATE gathering_mastery
+                   SET mining_points = MAX(0, mining_points - ?),
+                       fishing_points = MAX(0, fishing_points - ?),
+                       woodcutting_points = MAX(0, woodcutting_points - ?),
+                       mastery_insight = mastery_insight + ?
+                   WHERE user_id=? AND server_id=?""",
+                result.insight_rows,
+            )
+        await self.connection.commit()
+
     async def convert_excess_to_insight(
         self, user_id: str, server_id: str, conversion_rate: int = 5
     ) -> int:
@@ -776,26 +884,15 @@ class SkillRepository:
         if not row:
             return 0
 
-        m_pts = row["mining_points"] or 0
-        f_pts = row["fishing_points"] or 0
-        w_pts = row["woodcutting_points"] or 0
-        total_points = m_pts + f_pts + w_pts
-        if total_points < conversion_rate:
-            return 0
-
-        insight_gain = total_points // conversion_rate
+        new_mining, new_fishing, new_woodcutting, insight_gain = split_excess_points(
+            row["mining_points"] or 0,
+            row["fishing_points"] or 0,
+            row["woodcutting_points"] or 0,
+            conversion_rate,
+        )
         if insight_gain <= 0:
             return 0
 
-        remainder = total_points % conversion_rate
-
-        # Distribute remainder back across the three pools (simple round-robin style)
-        new_mining = min(remainder, m_pts)
-        remainder -= new_mining
-        new_fishing = min(remainder, f_pts)
-        remainder -= new_fishing
-        new_woodcutting = remainder  # whatever is left
-
         await self.connection.execute(
             """UPDATE gathering_mastery
                SET mining_points = ?, fishing_points = ?, woodcutting_points = ?,
@@ -3,6 +3,15 @@ import json
 import aiosqlite
 
 
+def _emblem_from_row(row) -> dict:
+    if not row:
+        return {}
+    return {
+        n: {"type": row[f"slot_{n}_type"], "tier": row[f"slot_{n}_tier"]}
+        for n in range(1, 6)
+    }
+
+
 class SlayerRepository:
     def __init__(self, connection: aiosqlite.Connection):
         self.connection = connection
@@ -23,6 +32,7 @@ class SlayerRepository:
                 (user_id, server_id),
             )
             await self.connection.commit()
+            self.connection.player_cache.invalidate(user_id)
             return await self.get_profile(user_id, server_id)
 
         return {
@@ -41,16 +51,7 @@ class SlayerRepository:
             "SELECT * FROM slayer_emblems WHERE user_id = ? AND server_id = ?",
             (user_id, server_id),
         )
-        row = await cursor.fetchone()
-        if not row:
-            return {}
-        return {
-            1: {"type": row["slot_1_type"], "tier": row["slot_1_tier"]},
-            2: {"type": row["slot_2_type"], "tier": row["slot_2_tier"]},
-            3: {"type": row["slot_3_type"], "tier": row["slot_3_tier"]},
-            4: {"type": row["slot_4_type"], "tier": row["slot_4_tier"]},
-            5: {"type": row["slot_5_type"], "tier": row["slot_5_tier"]},
-        }
+        return _emblem_from_row(await cursor.fetchone())
 
     async def assign_task(
         self, user_id: str, server_id: str, species: str, amount: int
@@ -60,6 +61,7 @@ class SlayerRepository:
             (species, amount, user_id, server_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def update_task_progress(self, user_id: str, server_id: str, amount: int):
         await self.connection.execute(
@@ -74,20 +76,29 @@ class SlayerRepository:
             (user_id, server_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def add_rewards(self, user_id: str, server_id: str, xp: int, points: int):
-        await self.connection.execute(
-            "UPDATE slayer_profiles SET xp = xp + ?, slayer_points = slayer_points + ? WHERE user_id = ? AND server_id = ?",
+        cursor = await self.connection.execute(
+            "UPDATE slayer_profiles SET xp = xp + ?, slayer_points = slayer_points + ? WHERE user_id = ? AND server_id = ? "
+            "RETURNING user_id, server_id, level, xp",
             (xp, points, user_id, server_id),
         )
+        row = await cursor.fetchone()
         await self.connection.commit()
+        if row:
+            self.connection.leaderboards.offer("slayer", dict(row))
 
     async def update_level(self, user_id: str, server_id: str, new_level: int):
-        await self.connection.execute(
-            "UPDATE slayer_profiles SET level = ? WHERE user_id = ? AND server_id = ?",
+        cursor = await self.connection.execute(
+            "UPDATE slayer_profiles SET level = ? WHERE user_id = ? AND server_id = ? "
+            "RETURNING user_id, server_id, level, xp",
             (new_level, user_id, server_id),
         )
+        row = await cursor.fetchone()
         await self.connection.commit()
+        if row:
+            self.connection.leaderboards.offer("slayer", dict(row))
 
     async def modify_materials(
         self, user_id: str, server_id: str, col: str, amount: int
@@ -108,6 +119,7 @@ class SlayerRepository:
             (p_type, p_tier, user_id, server_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
 
     async def consume_material(
         self, user_id: str, server_id: str, col: str, amount: int
@@ -157,17 +169,5 @@ class SlayerRepository:
         return pts
 
     async def get_leaderboard(self, limit: int = 10):
-        # Join with users table to get the player's name
-        rows = await self.connection.execute(
-            """
-            SELECT u.name, s.level, s.xp 
-            FROM slayer_profiles s 
-            JOIN users u ON s.user_id = u.user_id AND s.server_id = u.server_id
-            WHERE s.level > 1 
-            ORDER BY s.level DESC, s.xp DESC 
-            LIMIT ?
-            """,
-            (limit,),
-        )
-        async with rows as cursor:
-            return await cursor.fetchall()
+        """[{user_id, server_id, name, level, xp}, ...] for slayers past level 1."""
+        return await self.connection.leaderboards.top("slayer", limit)
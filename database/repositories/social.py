@@ -30,19 +30,26 @@ class SocialRepository:
 
     async def create_ideology(self, user_id: str, server_id: str, name: str) -> None:
         """Registers a new ideology."""
-        await self.connection.execute(
+        cursor = await self.connection.execute(
             "INSERT INTO ideologies (user_id, server_id, name) VALUES (?, ?, ?)",
             (user_id, server_id, name),
         )
         await self.connection.commit()
+        self.connection.leaderboards.offer(
+            "ideologies", {"id": cursor.lastrowid, "name": name, "followers": 0}
+        )
 
     async def update_followers(self, ideology_name: str, new_count: int) -> None:
         """Sets the follower count for an ideology."""
-        await self.connection.execute(
-            "UPDATE ideologies SET followers = ? WHERE name = ?",
+        cursor = await self.connection.execute(
+            "UPDATE ideologies SET followers = ? WHERE name = ? "
+            "RETURNING id, name, followers",
             (new_count, ideology_name),
         )
+        rows = await cursor.fetchall()
         await self.connection.commit()
+        for row in rows:
+            self.connection.leaderboards.offer("ideologies", dict(row))
 
     async def increment_followers(
         self, ideology_name: str, amount: int, server_id: str = "", user_id: str = ""
@@ -51,22 +58,22 @@ class SocialRepository:
         Uses name-only lookup (consistent with get_follower_count / update_followers).
         If no matching row exists, inserts one so the count is never silently lost."""
         cursor = await self.connection.execute(
-            "UPDATE ideologies SET followers = followers + ? WHERE name = ?",
+            "UPDATE ideologies SET followers = followers + ? WHERE name = ? "
+            "RETURNING id, name, followers",
             (amount, ideology_name),
         )
-        if cursor.rowcount == 0 and ideology_name:
+        rows = [dict(row) for row in await cursor.fetchall()]
+        if not rows and ideology_name:
             # Row doesn't exist yet — insert it
-            await self.connection.execute(
+            cursor = await self.connection.execute(
                 "INSERT OR IGNORE INTO ideologies (user_id, server_id, name, followers) "
                 "VALUES (?, ?, ?, ?)",
                 (user_id or "system", server_id or "", ideology_name, amount),
             )
+            rows = [{"id": cursor.lastrowid, "name": ideology_name, "followers": amount}]
         await self.connection.commit()
+        for row in rows:
+            self.connection.leaderboards.offer("ideologies", row)
 
     async def get_ideology_leaderboard(self, limit: int = 10):
-        rows = await self.connection.execute(
-            "SELECT name, followers FROM ideologies ORDER BY followers DESC LIMIT ?",
-            (limit,),
-        )
-        async with rows as cursor:
-            return await cursor.fetchall()
+        return await self.connection.leaderboards.top("ideologies", limit)
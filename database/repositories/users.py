@@ -153,6 +153,11 @@ class UserRepository:
                 print(f"[unregister] skipped {table}: {e}")
 
         await self.connection.commit()
+        self.connection.settlement_projections.bump(user_id, server_id)
+        self.connection.player_cache.invalidate(user_id)
+        # The user may hold a place on any board (duels, slayer, ideologies
+        # included); unregistering is rare enough to just reload them all.
+        self.connection.leaderboards.invalidate()
 
     # ---------------------------------------------------------
     # Player Stats & State Object
@@ -171,7 +176,7 @@ class UserRepository:
         would hide mutation sites and create silent staleness bugs when Player
         fields diverge from what the DB expects.
         """
-        await self.connection.execute(
+        cursor = await self.connection.execute(
             """
                 UPDATE users SET
                     level = ?,
@@ -180,6 +185,9 @@ class UserRepository:
                     potions = ?,
                     experience = ?
                 WHERE user_id = ?
+                RETURNING user_id, server_id, name, level, ascension,
+                          highest_ascension_stage, prestige_monument, prestige_title,
+                          prestige_display_name, prestige_emblem
                 """,
             (
                 player.level,
@@ -190,7 +198,42 @@ class UserRepository:
                 player.id,
             ),
         )
+        rows = await cursor.fetchall()
         await self.connection.commit()
+        boards = self.connection.leaderboards
+        for row in rows:
+            boards.offer(
+                "levels",
+                {
+                    "user_id": row["user_id"],
+                    "name": row["name"],
+                    "level": row["level"],
+                    "ascension": row["ascension"],
+                },
+            )
+            boards.offer(
+                "ascensions",
+                {
+                    "user_id": row["user_id"],
+                    "name": row["name"],
+                    "highest_ascension_stage": row["highest_ascension_stage"],
+                    "level": row["level"],
+                },
+            )
+            if row["prestige_monument"]:
+                boards.offer(
+                    "monuments",
+                    {
+                        "user_id": row["user_id"],
+                        "name": row["name"],
+                        "prestige_monument": row["prestige_monument"],
+                        "prestige_title": row["prestige_title"],
+                        "prestige_display_name": row["prestige_display_name"],
+                        "prestige_emblem": row["prestige_emblem"],
+                        "level": row["level"],
+                    },
+                    server_id=row["server_id"],
+                )
 
     async def update_hp(self, user_id: str, hp: int) -> None:
         """Specific update for HP (e.g., regeneration task)."""
@@ -276,10 +319,15 @@ class UserRepository:
 
     async def modify_gold(self, user_id: str, amount: int) -> None:
         """Add (positive) or remove (negative) gold."""
-        await self.connection.execute(
-            "UPDATE users SET gold = gold + ? WHERE user_id = ?", (amount, user_id)
+        cursor = await self.connection.execute(
+            "UPDATE users SET gold = gold + ? WHERE user_id = ? "
+            "RETURNING user_id, name, gold",
+            (amount, user_id),
         )
+        row = await cursor.fetchone()
         await self.connection.commit()
+        if row:
+            self.connection.leaderboards.offer("wealth", dict(row))
 
     async def deduct_gold_atomic(self, user_id: str, amount: int) -> bool:
         """Deducts gold only if the current balance covers it. Returns True on success."""
@@ -288,7 +336,10 @@ class UserRepository:
             (amount, user_id, amount),
         )
         await self.connection.commit()
-        return cursor.rowcount == 1
+        if cursor.rowcount != 1:
+            return False
+        self.connection.leaderboards.adjust("wealth", (user_id,), "gold", -amount)
+        return True
 
     async def set_gold(self, user_id: str, amount: int) -> None:
         """Hard set gold amount (e.g. gambling resets)."""
@@ -330,6 +381,21 @@ class UserRepository:
         )
         await self.connection.commit()
 
+    async def modify_currencies(self, user_id: str, deltas: dict[str, int]) -> None:
+        """modify_currency for several columns at once, in one UPDATE."""
+        deltas = {col: amount for col, amount in deltas.items() if amount}
+        if not deltas:
+            return
+        for column in deltas:
+            if not self._COLUMN_RE.match(column):
+                raise ValueError(f"modify_currencies: invalid column name {column!r}")
+        sets = ", ".join(f"{col} = {col} + ?" for col in deltas)
+        await self.connection.execute(
+            f"UPDATE player_currencies SET {sets} WHERE user_id = ?",
+            (*deltas.values(), user_id),
+        )
+        await self.connection.commit()
+
     async def deduct_currency_atomic(
         self, user_id: str, currency_column: str, amount: int
     ) -> bool:
@@ -484,39 +550,59 @@ class UserRepository:
         )
         await self.connection.commit()
 
+    async def _backfill_stamina_regen_chances(self) -> None:
+        """Derives inner_sanctum.stamina_regen_bonus_chance for rows that predate
+        the column (or were created by add_points before any node purchase)."""
+        async with self.connection.execute(
+            "SELECT user_id, server_id, nodes_owned FROM inner_sanctum "
+            "WHERE stamina_regen_bonus_chance IS NULL"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        if not rows:
+            return
+        await self.connection.executemany(
+            "UPDATE inner_sanctum SET stamina_regen_bonus_chance = ? "
+            "WHERE user_id = ? AND server_id = ?",
+            [
+                (
+                    get_tree_bonuses(
+                        json.loads(r["nodes_owned"]) if r["nodes_owned"] else {}
+                    )["stamina_regen_bonus_chance"],
+                    r["user_id"],
+                    r["server_id"],
+                )
+                for r in rows
+            ],
+        )
+        await self.connection.commit()
+
     async def regen_stamina_tick(self) -> int:
         """
         Grants +1 combat_stamina to every user below cap whose last regen
         was >= 1 hour ago (or has never been set). Returns number of users updated.
 
         Inner Sanctum Recovery — Deep Reserves: each eligible user has a
-        per-rank chance to receive +2 instead of +1 on a given tick.
+        per-rank chance to receive +2 instead of +1 on a given tick. The
+        chance is read precomputed from inner_sanctum rather than re-derived
+        from every tree, and all grants land in one executemany + commit.
         """
         now = datetime.now()
+        await self._backfill_stamina_regen_chances()
         async with self.connection.execute(
-            "SELECT user_id, combat_stamina, last_stamina_regen FROM users WHERE combat_stamina < 10"
+            """SELECT u.user_id, u.last_stamina_regen,
+                      COALESCE(s.bonus_chance, 0) AS bonus_chance
+               FROM users u
+               LEFT JOIN (
+                   SELECT user_id, MAX(stamina_regen_bonus_chance) AS bonus_chance
+                   FROM inner_sanctum GROUP BY user_id
+               ) s ON s.user_id = u.user_id
+               WHERE u.combat_stamina < 10"""
         ) as cursor:
             rows = await cursor.fetchall()
 
-        if not rows:
-            return 0
-
-        async with self.connection.execute(
-            "SELECT user_id, nodes_owned FROM inner_sanctum"
-        ) as is_cursor:
-            is_rows = await is_cursor.fetchall()
-        nodes_by_user = {
-            r["user_id"]: (json.loads(r["nodes_owned"]) if r["nodes_owned"] else {})
-            for r in is_rows
-        }
-
-        updated = 0
+        grants = []
         for row in rows:
-            user_id, stamina, last_regen_str = (
-                row["user_id"],
-                row["combat_stamina"],
-                row["last_stamina_regen"],
-            )
+            last_regen_str = row["last_stamina_regen"]
             should_grant = False
             if last_regen_str is None:
                 should_grant = True
@@ -532,48 +618,45 @@ class UserRepository:
 
             if should_grant:
                 gain = 1
-                nodes_owned = nodes_by_user.get(user_id)
-                if nodes_owned:
-                    bonus_chance = get_tree_bonuses(nodes_owned)[
-                        "stamina_regen_bonus_chance"
-                    ]
-                    if bonus_chance and random.random() < bonus_chance:
-                        gain = 2
-                await self.connection.execute(
-                    "UPDATE users SET combat_stamina = ?, last_stamina_regen = ? WHERE user_id = ?",
-                    (min(10, stamina + gain), now.isoformat(), user_id),
-                )
-                await self.connection.commit()
-                updated += 1
+                bonus_chance = row["bonus_chance"]
+                if bonus_chance and random.random() < bonus_chance:
+                    gain = 2
+                grants.append((gain, now.isoformat(), row["user_id"]))
 
-        return updated
+        if not grants:
+            return 0
+        # Relative update re-checks the cap, so stamina spent or granted by
+        # War Camp between the SELECT and this write is never overwritten.
+        await self.connection.executemany(
+            "UPDATE users SET combat_stamina = MIN(10, combat_stamina + ?), "
+            "last_stamina_regen = ? WHERE user_id = ? AND combat_stamina < 10",
+            grants,
+        )
+        await self.connection.commit()
+        return len(grants)
 
     # ---------------------------------------------------------
     # Leaderboards
     # ---------------------------------------------------------
 
     async def get_leaderboard(self, limit: int = 10):
-        rows = await self.connection.execute(
-            "SELECT * FROM users ORDER BY level DESC, ascension DESC LIMIT ?", (limit,)
-        )
-        async with rows as cursor:
-            return await cursor.fetchall()
+        """[{user_id, name, level, ascension}, ...] by level, then ascension."""
+        return await self.connection.leaderboards.top("levels", limit)
 
     async def get_ascension_leaderboard(self, limit: int = 10):
-        rows = await self.connection.execute(
-            "SELECT name, highest_ascension_stage, level FROM users ORDER BY highest_ascension_stage DESC, level DESC LIMIT ?",
-            (limit,),
-        )
-        async with rows as cursor:
-            return await cursor.fetchall()
+        return await self.connection.leaderboards.top("ascensions", limit)
 
     async def update_highest_ascension_stage(self, user_id: str, stage: int) -> None:
         """Records the stage if it's higher than the player's current record."""
-        await self.connection.execute(
-            "UPDATE users SET highest_ascension_stage = MAX(highest_ascension_stage, ?) WHERE user_id = ?",
+        cursor = await self.connection.execute(
+            "UPDATE users SET highest_ascension_stage = MAX(highest_ascension_stage, ?) WHERE user_id = ? "
+            "RETURNING user_id, name, highest_ascension_stage, level",
             (stage, user_id),
         )
+        row = await cursor.fetchone()
         await self.connection.commit()
+        if row:
+            self.connection.leaderboards.offer("ascensions", dict(row))
 
     async def get_doors_enabled(self, user_id: str) -> bool:
         """Fetches the boss door preference for a user. Defaults to True."""
@@ -625,11 +708,7 @@ class UserRepository:
         await self.connection.commit()
 
     async def get_wealth_leaderboard(self, limit: int = 10):
-        rows = await self.connection.execute(
-            "SELECT name, gold FROM users ORDER BY gold DESC LIMIT ?", (limit,)
-        )
-        async with rows as cursor:
-            return await cursor.fetchall()
+        return await self.connection.leaderboards.top("wealth", limit)
 
     # ---------------------------------------------------------
     # Hard Combat Mode
@@ -778,6 +857,7 @@ class UserRepository:
             (user_id, server_id),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return True
 
     async def refund_stat_point(self, user_id: str, server_id: str, stat: str) -> bool:
@@ -808,6 +888,7 @@ class UserRepository:
             (user_id,),
         )
         await self.connection.commit()
+        self.connection.player_cache.invalidate(user_id)
         return True
 
     # ---------------------------------------------------------
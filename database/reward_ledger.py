@@ -0,0 +1,180 @@
+# database/reward_ledger.py
+from __future__ import annotations
+
+from .repositories.settlement_materials import _VALID_MATERIALS
+from .repositories.skills import ELEMENTAL_KEY_COLUMNS
+from .repositories.users import UserRepository
+
+
+class RewardLedger:
+    """Accumulates one player's reward grants in memory and writes them in
+    a handful of statements.
+
+    Reward paths (curio opens, Black Market deals, dispatch claims) used to
+    call ``modify_currency`` / ``essences.add`` / ``add_tickets`` ... once per
+    reward, each with its own commit. A ledger sums the deltas per table and
+    column instead; ``flush()`` then hands each table's deltas to its
+    repository's bulk method (``users.modify_currencies``,
+    ``essences.add_many``, ...) once, all in one transaction:
+
+        ledger = bot.database.reward_ledger(user_id, server_id)
+        ledger.gold(50_000)
+        ledger.currency("refinement_runes", 2)
+        ledger.essence("fire", 3)
+        await ledger.flush()
+
+    Column names are validated when recorded, with the same rules as the
+    repository method each one replaces. Settlement materials keep their
+    floor at 0, applied to the net delta. ``flush()`` joins the caller's
+    transaction if it is already inside one, under a savepoint so a failed
+    flush undoes only its own writes; otherwise it opens its own.
+    """
+
+    def __init__(self, database, user_id: str, server_id: str | None = None):
+        self._db = database
+        self.user_id = user_id
+        self.server_id = server_id
+        self._reset()
+        # Statements issued by the last flush(), for logging/benchmarks.
+        self.statements = 0
+
+    def _reset(self) -> None:
+        self._gold = 0
+        self._tickets = 0
+        self._cosmic_dust = 0
+        self._currencies: dict[str, int] = {}
+        self._essences: dict[str, int] = {}
+        self._materials: dict[str, int] = {}
+        self._mastery: dict[str, int] = {}
+        self._resources: dict[str, dict[str, int]] = {}
+
+    @staticmethod
+    def _add(bucket: dict[str, int], key: str, amount: int) -> None:
+        bucket[key] = bucket.get(key, 0) + amount
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def gold(self, amount: int) -> None:
+        self._gold += amount
+
+    def currency(self, column: str, amount: int) -> None:
+        """A ``player_currencies`` column (runes, keys, misc counters)."""
+        if not UserRepository._COLUMN_RE.match(column):
+            raise ValueError(f"RewardLedger.currency: invalid column name {column!r}")
+        self._add(self._currencies, column, amount)
+
+    def essence(self, essence_type: str, quantity: int = 1) -> None:
+        self._add(self._essences, essence_type, quantity)
+
+    def tickets(self, amount: int) -> None:
+        """Guild tickets (``user_partner_items``)."""
+        self._tickets += amount
+
+    def cosmic_dust(self, amount: int) -> None:
+        self._cosmic_dust += amount
+
+    def material(self, material: str, amount: int) -> None:
+        """A ``settlement_materials`` column."""
+        if material not in _VALID_MATERIALS:
+            raise ValueError(f"RewardLedger.material: unknown material {material!r}")
+        self._add(self._materials, material, amount)
+
+    def mastery(self, column: str, amount: int) -> None:
+        """An elemental key on ``gathering_mastery`` (needs ``server_id``)."""
+        if column not in ELEMENTAL_KEY_COLUMNS:
+            raise ValueError(f"RewardLedger.mastery: unknown column {column!r}")
+        self._add(self._mastery, column, amount)
+
+    def resource(self, skill_type: str, resource: str, amount: int) -> None:
+        """A raw gathering resource on the mining/woodcutting/fishing table
+        (needs ``server_id``)."""
+        if resource not in self._db.skills.allowed_columns.get(skill_type, ()):
+            raise ValueError(
+                f"Invalid resource column '{resource}' for skill '{skill_type}'"
+            )
+        self._add(self._resources.setdefault(skill_type, {}), resource, amount)
+
+    @property
+    def empty(self) -> bool:
+        return not (
+            self._gold
+            or self._tickets
+            or self._cosmic_dust
+            or any(self._currencies.values())
+            or any(self._essences.values())
+            or any(self._materials.values())
+            or any(self._mastery.values())
+            or any(any(cols.values()) for cols in self._resources.values())
+        )
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    async def flush(self) -> int:
+        """Writes everything recorded so far and clears the ledger.
+
+        Returns the number of statements issued. Raises like the repository
+        calls would, with none of the ledger's writes applied.
+        """
+        conn = self._db.connection
+        if conn._owns_transaction():
+            count = await self._write_in_savepoint(conn)
+        else:
+            async with self._db.transaction():
+                count = await self._write()
+        self._reset()
+        self.statements = count
+        return count
+
+    async def _write_in_savepoint(self, conn) -> int:
+        # A SAVEPOINT outside a transaction would start (and its RELEASE
+        # commit) one of its own, cutting the caller's transaction in two.
+        if not conn.in_transaction:
+            await conn.execute("BEGIN")
+        await conn.execute("SAVEPOINT reward_ledger")
+        try:
+            count = await self._write()
+        except BaseException:
+            await conn.execute("ROLLBACK TO reward_ledger")
+            await conn.execute("RELEASE reward_ledger")
+            # The write paths may already have offered rows that never landed.
+            conn._discard_caches()
+            raise
+        await conn.execute("RELEASE reward_ledger")
+        return count
+
+    async def _write(self) -> int:
+        db = self._db
+        uid, sid = self.user_id, self.server_id
+        count = 0
+
+        if self._gold:
+            await db.users.modify_gold(uid, self._gold)
+            count += 1
+        if any(self._currencies.values()):
+            await db.users.modify_currencies(uid, self._currencies)
+            count += 1
+        if any(self._essences.values()):
+            await db.essences.add_many(uid, self._essences)
+            count += 1
+        if self._tickets:
+            await db.partners.add_tickets(uid, self._tickets)
+            count += 2
+        if self._cosmic_dust:
+            await db.alchemy.modify_cosmic_dust(uid, self._cosmic_dust)
+            count += 2
+        if any(self._materials.values()):
+            await db.settlement_materials.modify_many(uid, self._materials)
+            count += 2
+        if any(self._mastery.values()):
+            await db.skills.add_elemental_keys(uid, sid, self._mastery)
+            count += 1
+        for skill_type, columns in self._resources.items():
+            resources = {col: amount for col, amount in columns.items() if amount}
+            if resources:
+                await db.skills.update_batch(uid, sid, skill_type, resources)
+                count += 1
+        return count
@@ -607,6 +607,10 @@ CREATE TABLE IF NOT EXISTS inner_sanctum (
   points_available  INTEGER NOT NULL DEFAULT 0,
   points_spent      INTEGER NOT NULL DEFAULT 0,
   nodes_owned       TEXT    NOT NULL DEFAULT '{}',
+  -- Deep Reserves chance derived from nodes_owned, kept in step by the
+  -- node write paths so the stamina tick never parses the tree JSON.
+  -- NULL = not yet derived (backfilled by the next tick).
+  stamina_regen_bonus_chance REAL DEFAULT NULL,
   PRIMARY KEY (user_id, server_id)
 );
 
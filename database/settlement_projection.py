@@ -0,0 +1,90 @@
+# database/settlement_projection.py
+from __future__ import annotations
+
+
+class SettlementProjectionCache:
+    """Derived combat bonuses of each settlement, keyed by (user_id, server_id).
+
+    A projection (SettlementRepository.projection_from_rows) holds every
+    building's effective (tier, workers) — barracks, apothecary and the
+    sigil shrines among them — plus the Apothecary Annex boost and shrine
+    effectiveness that come out of the adjacency pass. None of it changes
+    between fights: only building, upgrading, demolishing, disabling,
+    repairing, staffing a building or developing a plot does, and each of
+    those repository methods calls bump() for the settlement it touched.
+
+    bump() advances the settlement's layout version. Readers take version()
+    before they read the rows and hand it back to put(), so a projection
+    computed while the layout was changing is never stored. A rollback
+    clears everything, since a bump inside the transaction may have been
+    for a write that never happened.
+
+    Projections are shared, not copied: callers must not mutate them.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: dict[tuple[str, str], tuple[tuple, dict]] = {}
+        self._layouts: dict[tuple[str, str], int] = {}
+        # Bumped by clear(), so a read in flight across a rollback is refused.
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.bumps = 0
+
+    @staticmethod
+    def _key(user_id: str, server_id: str) -> tuple[str, str]:
+        return (str(user_id), str(server_id))
+
+    def version(self, user_id: str, server_id: str) -> tuple[int, int]:
+        """Opaque token to take before a read and hand back to put()."""
+        return (self._epoch, self._layouts.get(self._key(user_id, server_id), 0))
+
+    def get(self, user_id: str, server_id: str) -> dict | None:
+        key = self._key(user_id, server_id)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != self.version(*key):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def peek(self, user_id: str, server_id: str) -> dict | None:
+        """get() without counting a miss, for callers with their own query
+        to fall back on."""
+        key = self._key(user_id, server_id)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != self.version(*key):
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def put(self, user_id: str, server_id: str, version: tuple, projection: dict) -> None:
+        if self.max_entries <= 0:
+            return
+        key = self._key(user_id, server_id)
+        if version != self.version(*key):
+            return  # the layout changed while this projection was being read
+        self._entries.pop(key, None)
+        self._entries[key] = (version, projection)
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def bump(self, user_id: str, server_id: str) -> None:
+        """The settlement's layout changed; its projection is stale."""
+        key = self._key(user_id, server_id)
+        self._layouts[key] = self._layouts.get(key, 0) + 1
+        self._entries.pop(key, None)
+        self.bumps += 1
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "bumps": self.bumps,
+        }